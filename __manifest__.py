@@ -32,6 +32,10 @@
         "data/service_booking_sequence.xml",
         "data/service_appointment_sequence.xml",
         "data/service_appointment_cron.xml",
+        "data/service_media_cron.xml",
+        "data/service_date_overdue_cron.xml",
+        "data/service_booking_report_cron.xml",
+        "data/service_reminder_mail_templates.xml",
         "reports/service_booking_reports.xml",
         "views/service_customer_vehicle_views.xml",
         "views/res_partner_views.xml",
@@ -50,8 +54,10 @@
         "views/service_inspection_type_views.xml",
         "views/service_product_template_views.xml",
         "views/service_type_views.xml",
+        "views/service_workshop_capacity_views.xml",
         "views/service_supervisor_user_views.xml",
         "views/service_showroom_reporting_views.xml",
+        "views/service_booking_state_event_views.xml",
         "views/my_service_bookings_templates.xml",
         "views/my_job_card_templates.xml",
         "views/wizards/cancel_reason_wizard_views.xml",
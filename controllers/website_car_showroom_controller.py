@@ -1,18 +1,71 @@
+from werkzeug.http import http_date
+
 from odoo import http
-from odoo.http import request
+from odoo.http import Response, request
+
+from odoo.addons.infinys_service_showroom.models.showroom_car_vehicle import SHOWROOM_FACET_FIELDS
+
+
+# Query parameters that change the rendered /cars listing.
+CARS_LIST_PARAMS = ("search", "min_price", "max_price", "order") + tuple(
+    SHOWROOM_FACET_FIELDS
+)
 
 
 class WebsiteCarShowroom(http.Controller):
 
-    @http.route(["/cars"], type="http", auth="public", website=True)
-    def cars_list(self, **kwargs):
+    def _render_showroom_page(self, template, key, prepare_values):
+        """Render ``template`` around its ``<template>_content`` fragment.
+
+        For anonymous visitors the fragment is served from the showroom page
+        cache, and the response carries validators so browsers and proxies
+        can revalidate with a 304.
+        """
+        if not request.env.user._is_public():
+            return request.render(template, prepare_values())
+
+        PageCache = request.env["showroom.page.cache"]
+        entry = PageCache._lookup(key)
+        if entry is None:
+            fragment = request.env["ir.ui.view"]._render_template(
+                template + "_content", prepare_values()
+            )
+            entry = PageCache._store(key, fragment)
+        etag, last_modified, fragment = entry
+
+        headers = {
+            "Cache-Control": "public, no-cache",
+            "Vary": "Cookie",
+            "ETag": f'"{etag}"',
+        }
+        if last_modified:
+            headers["Last-Modified"] = http_date(last_modified)
+        if request.httprequest.if_none_match.contains(etag):
+            return Response(status=304, headers=headers)
+
+        response = request.render(template, {"showroom_fragment": fragment})
+        response.headers.update(headers)
+        return response
+
+    @http.route(
+        ["/cars", "/cars/page/<int:page>"], type="http", auth="public", website=True
+    )
+    def cars_list(self, page=1, **kwargs):
+        key = ("cars", int(page)) + tuple(
+            (name, str(kwargs[name]).strip())
+            for name in CARS_LIST_PARAMS
+            if kwargs.get(name)
+        )
+        return self._render_showroom_page(
+            "infinys_service_showroom.car_showroom_list",
+            key,
+            lambda: self._prepare_cars_list_values(page, **kwargs),
+        )
+
+    def _prepare_cars_list_values(self, page, **kwargs):
         Car = request.env["showroom.car.vehicle"].sudo()
         domain = [("website_published", "=", True), ("active", "=", True)]
 
-        brand_id = kwargs.get("brand_id")
-        if brand_id:
-            domain.append(("brand_id", "=", int(brand_id)))
-
         min_price = kwargs.get("min_price")
         if min_price:
             domain.append(("price", ">=", float(min_price)))
@@ -22,8 +75,22 @@ class WebsiteCarShowroom(http.Controller):
             domain.append(("price", "<=", float(max_price)))
 
         search_term = kwargs.get("search")
+        ranked_ids = None
         if search_term:
-            domain.append(("name", "ilike", search_term))
+            ranked_ids = Car._search_showroom_ids(search_term)
+            domain.append(("id", "in", ranked_ids))
+
+        selected = {}
+        for name in SHOWROOM_FACET_FIELDS:
+            value = kwargs.get(name)
+            if not value:
+                continue
+            if name in ("brand_id", "fuel_type_id", "type_id"):
+                try:
+                    value = int(value)
+                except ValueError:
+                    continue
+            selected[name] = value
 
         order_param = kwargs.get("order", "name asc")
         valid_orders = {
@@ -32,30 +99,78 @@ class WebsiteCarShowroom(http.Controller):
             "price asc": "price",
             "price desc": "price desc",
             "year desc": "year desc",
-            "id desc": "Newest Arrivals",
+            "id desc": "id desc",
         }
-        order = (
-            valid_orders.get(order_param, "name")
-            if order_param in valid_orders
-            else "name"
-        )
+        order = valid_orders.get(order_param, "name")
 
-        cars = Car.search(domain, order=order)
-        brands = request.env["service.vehicle.brand"].sudo().search([])
+        facets = Car._get_showroom_facets(domain, selected)
+        domain += [
+            (SHOWROOM_FACET_FIELDS[name], "=", value) for name, value in selected.items()
+        ]
 
-        render_values = {
+        settings = request.env["res.config.settings"].sudo()._get_showroom_settings()
+        url_args = {
+            key: value
+            for key, value in dict(
+                selected,
+                search=search_term,
+                min_price=min_price,
+                max_price=max_price,
+                order=order_param if order_param in valid_orders else None,
+            ).items()
+            if value
+        }
+        step = max(settings.showroom_cars_per_page, 1)
+        pager = request.website.pager(
+            url="/cars",
+            total=facets["total"],
+            page=page,
+            step=step,
+            url_args=url_args,
+        )
+        if ranked_ids and not kwargs.get("order"):
+            # Keep the relevance ranking unless the shopper picked a sort.
+            matching = set(Car.search(domain).ids)
+            ranked_ids = [car_id for car_id in ranked_ids if car_id in matching]
+            cars = Car.browse(
+                ranked_ids[pager["offset"] : pager["offset"] + step]
+            )
+        else:
+            cars = Car.search(
+                domain, order=order, limit=step, offset=pager["offset"]
+            )
+
+        return {
             "cars": cars,
-            "brands": brands,
-            "selected_brand_id": int(brand_id) if brand_id else None,
+            "facets": facets,
+            "selected": selected,
+            "url_args": url_args,
+            "pager": pager,
+            "selected_brand_id": selected.get("brand_id"),
             "min_price": min_price,
             "max_price": max_price,
             "search_term": search_term,
             "current_order": order_param,
         }
 
-        return request.render(
-            "infinys_service_showroom.car_showroom_list", render_values
-        )
+    @http.route(["/cars/autocomplete"], type="http", auth="public", website=True)
+    def cars_autocomplete(self, term="", limit=8, **kwargs):
+        Car = request.env["showroom.car.vehicle"].sudo()
+        try:
+            limit = min(max(int(limit), 1), 20)
+        except ValueError:
+            limit = 8
+        cars = Car.browse(Car._search_showroom_ids(term, limit=limit))
+        return request.make_json_response([
+            {
+                "id": car.id,
+                "name": car.name,
+                "brand": car.brand_id.name,
+                "year": car.year,
+                "url": "/cars/%s" % car.id,
+            }
+            for car in cars
+        ])
 
     @http.route(
         ['/cars/<model("showroom.car.vehicle"):car>'],
@@ -67,22 +182,26 @@ class WebsiteCarShowroom(http.Controller):
         if not (car.website_published and car.active):
             return request.not_found()
 
-        ICPSudo = request.env["ir.config_parameter"].sudo()
-        whatsapp_phone_number = ICPSudo.get_param(
-            "infinys_service_showroom.whatsapp_phone_number", default=""
-        )
-        whatsapp_prefill_message = ICPSudo.get_param(
-            "infinys_service_showroom.whatsapp_prefill_message", default=""
+        return self._render_showroom_page(
+            "infinys_service_showroom.car_showroom_detail",
+            ("car", car.id),
+            lambda: self._prepare_car_detail_values(car),
         )
 
-        render_values = {
+    def _prepare_car_detail_values(self, car):
+        settings = request.env["res.config.settings"].sudo()._get_showroom_settings()
+        return {
             "car": car,
-            "whatsapp_phone_number": whatsapp_phone_number,
-            "whatsapp_prefill_message": whatsapp_prefill_message,
+            "whatsapp_phone_number": settings.whatsapp_phone_number,
+            "whatsapp_prefill_message": settings.whatsapp_prefill_message,
         }
 
-        return request.render(
-            "infinys_service_showroom.car_showroom_detail", render_values
+    @http.route(["/cars/cache_stats"], type="http", auth="user", website=True)
+    def cars_cache_stats(self, **kwargs):
+        if not request.env.user.has_group("base.group_system"):
+            return request.not_found()
+        return request.make_json_response(
+            request.env["showroom.page.cache"]._get_stats()
         )
 
     @http.route(["/visit-schedule"], type="http", auth="public", website=True)
@@ -130,38 +249,9 @@ class WebsiteCarShowroom(http.Controller):
             except Exception:
                 vehicle = None
 
-        partner = (
-            request.env["res.partner"]
-            .sudo()
-            .search(
-                [
-                    ("name", "=", name),
-                    "|",
-                    ("email", "=", email),
-                    ("phone", "=", phone),
-                ],
-                limit=1,
-            )
+        partner = request.env["res.partner"]._resolve_showroom_partner(
+            name, email=email, phone=phone
         )
-        if not partner:
-            partner = (
-                request.env["res.partner"]
-                .sudo()
-                .create(
-                    {
-                        "name": name,
-                        "phone": phone,
-                        "email": email,
-                    }
-                )
-            )
-        else:
-            partner.sudo().write(
-                {
-                    "phone": phone,
-                    "email": email,
-                }
-            )
 
         lead_vals = {
             "type": "lead",
@@ -9,22 +9,12 @@ from odoo.osv.expression import OR
 
 
 class CustomerPortal(CustomerPortal):
-    def _prepare_portal_layout_values(self):
-        values = super(CustomerPortal, self)._prepare_portal_layout_values()
-        partner = request.env.user.partner_id
-        service_booking_count = (
-            request.env["service.booking"]
-            .sudo()
-            .search_count([("customer_name", "=", partner.id)])
-        )
-        service_appointment_count = (
-            request.env["service.appointment"]
-            .sudo()
-            .search_count([("customer_name", "=", partner.id), ("state", "=", "draft")])
-        )
-        values["service_booking_count"] = (
-            service_booking_count + service_appointment_count
-        )
+    def _prepare_home_portal_values(self, counters):
+        values = super()._prepare_home_portal_values(counters)
+        if "service_booking_count" in counters:
+            values["service_booking_count"] = request.env[
+                "service.portal.booking"
+            ]._get_portal_count(request.env.user.partner_id)
         return values
 
 
@@ -46,9 +36,6 @@ class MyServiceBookings(CustomerPortal):
         search_in="content",
         **kw,
     ):
-        response = request.render(
-            "infinys_service_showroom.my_service_bookings_list_template"
-        )
         values = self._prepare_portal_my_service_bookings_values(
             page, date_begin, date_end, search, search_in, **kw
         )
@@ -60,14 +47,12 @@ class MyServiceBookings(CustomerPortal):
         self, page, date_begin, date_end, search=None, search_in="content", **kw
     ):
         partner = request.env.user.partner_id
-        ServiceBooking = request.env["service.booking"]
+        PortalBooking = request.env["service.portal.booking"]
 
         domain = [
             ("customer_name", "=", partner.id),
         ]
 
-        order = ServiceBooking._order
-
         searchbar_inputs = {
             "content": {"input": "content", "label": _("Search in Content")},
             "booking_number": {
@@ -115,85 +100,7 @@ class MyServiceBookings(CustomerPortal):
                 ("create_date", "<=", date_end),
             ]
 
-        ServiceAppointment = request.env["service.appointment"]
-
-        booking_domain = list(domain)
-        service_bookings = ServiceBooking.search(booking_domain)
-
-        appointment_domain = list(domain)
-        appointment_domain.append(("state", "in", ["draft", "cancelled"]))
-        if search and search_in:
-            if search_in == "content":
-                appointment_search_domain = OR(
-                    [
-                        [("name", "ilike", search)],
-                        [("plat_number", "ilike", search)],
-                        [("complaint_issue", "ilike", search)],
-                    ]
-                )
-                appointment_domain += appointment_search_domain
-            elif search_in == "booking_number":
-                appointment_search_domain = [("name", "ilike", search)]
-                appointment_domain += appointment_search_domain
-            elif search_in == "plate_number":
-                appointment_search_domain = [("plat_number", "ilike", search)]
-                appointment_domain += appointment_search_domain
-
-        service_appointments = ServiceAppointment.search(appointment_domain)
-
-        combined_records = []
-        for booking in service_bookings:
-            booking_data = type(
-                "MockBooking",
-                (object,),
-                {
-                    "id": booking.id,
-                    "name": booking.name,
-                    "customer_name": booking.customer_name,
-                    "contact_number": booking.contact_number,
-                    "contact_email": booking.contact_email,
-                    "plat_number": booking.plat_number,
-                    "vehicle_brand": booking.vehicle_brand,
-                    "vehicle_model": booking.vehicle_model,
-                    "plan_service_date": booking.plan_service_date,
-                    "service_type": booking.service_type,
-                    "complaint_issue": booking.complaint_issue,
-                    "state": booking.state,
-                    "record_type": "booking",
-                    "get_portal_url": booking.get_portal_url,
-                },
-            )()
-            combined_records.append(booking_data)
-        for appointment in service_appointments:
-            mock_booking = type(
-                "MockBooking",
-                (object,),
-                {
-                    "id": appointment.id,
-                    "name": appointment.name,
-                    "customer_name": appointment.customer_name,
-                    "contact_number": appointment.contact_number,
-                    "contact_email": appointment.contact_email,
-                    "plat_number": appointment.plat_number,
-                    "vehicle_brand": appointment.vehicle_brand,
-                    "vehicle_model": appointment.vehicle_model,
-                    "plan_service_date": appointment.plan_service_date,
-                    "service_type": appointment.service_type,
-                    "complaint_issue": appointment.complaint_issue,
-                    "state": "waiting"
-                    if appointment.state == "draft"
-                    else appointment.state,
-                    "record_type": "appointment",
-                    "get_portal_url": lambda: "#",
-                },
-            )()
-            combined_records.append(mock_booking)
-
-        combined_records.sort(
-            key=lambda r: (r.plan_service_date or fields.Date.today(), r.name or "")
-        )
-
-        total_records = len(combined_records)
+        total_records = PortalBooking.search_count(domain)
         pager = portal_pager(
             url="/my/service-bookings",
             total=total_records,
@@ -206,9 +113,11 @@ class MyServiceBookings(CustomerPortal):
                 "search": search,
             },
         )
-        offset = pager["offset"]
-        limit = self._items_per_page
-        paginated_records = combined_records[offset : offset + limit]
+        paginated_records = PortalBooking.search(
+            domain,
+            limit=self._items_per_page,
+            offset=pager["offset"],
+        )
 
         values = {
             "date": date_begin,
@@ -1,14 +1,25 @@
-from odoo import http
-from odoo.http import request
-import base64
+from odoo import fields, http, Command
+from odoo.exceptions import UserError
+from odoo.http import Response, request
+from odoo.tools.translate import _lt
+
+BOOKING_FORM_ERRORS = {
+    "invalid": _lt("Some required fields are missing or invalid. Please check the form and try again."),
+    "slot_full": _lt("The workshop is fully booked on the selected date. Please choose another date."),
+}
+
+
+def _parse_id(value):
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else None
 
 
 class WebsiteServiceBooking(http.Controller):
 
     @http.route(["/service-booking/new"], type="http", auth="public", website=True)
-    def service_booking_form(self, **kwargs):
+    def service_booking_form(self, error=None, **kwargs):
         brands = request.env["service.vehicle.brand"].sudo().search([])
-        models = request.env["service.vehicle.model"].sudo().search([])
+        catalogue = request.env["service.vehicle.model"]._get_brand_model_catalogue()
         service_types = request.env["service.type"].sudo().search([])
 
         user = request.env.user
@@ -32,84 +43,134 @@ class WebsiteServiceBooking(http.Controller):
             "infinys_service_showroom.service_booking_form_template",
             {
                 "brands": brands,
-                "models": models,
+                "catalogue_version": catalogue["version"],
                 "service_types": service_types,
                 "customer_vehicles": customer_vehicles,
                 "customer_name": customer_name,
                 "customer_email": customer_email,
                 "customer_phone": customer_phone,
+                "error_message": BOOKING_FORM_ERRORS.get(error),
             },
         )
 
+    @http.route(
+        ["/service-booking/vehicle-models"], type="http", auth="public", website=True
+    )
+    def service_booking_vehicle_models(self, brand_id=None, version=None, **kwargs):
+        catalogue = request.env["service.vehicle.model"]._get_brand_model_catalogue()
+        brands = catalogue["brands"]
+        if brand_id:
+            brands = {brand_id: brands.get(brand_id, [])}
+
+        etag = catalogue["version"]
+        if version == etag:
+            # The URL names the catalogue version: it never changes content.
+            cache_control = "public, max-age=31536000, immutable"
+        else:
+            cache_control = "public, no-cache"
+        headers = {"Cache-Control": cache_control, "ETag": f'"{etag}"'}
+        if request.httprequest.if_none_match.contains(etag):
+            return Response(status=304, headers=headers)
+        return request.make_json_response(
+            {"version": etag, "brands": brands}, headers=headers
+        )
+
+    @http.route(
+        ["/service-booking/availability"], type="http", auth="public", website=True
+    )
+    def service_booking_availability(self, service_type_id=None, start=None, **kwargs):
+        today = fields.Date.context_today(request.env.user)
+        try:
+            start = max(fields.Date.to_date(start) or today, today)
+        except ValueError:
+            start = today
+        calendar = request.env["service.workshop.occupancy"].sudo()._get_availability(
+            start,
+            service_type_id=int(service_type_id) if service_type_id and service_type_id.isdigit() else None,
+        )
+        return request.make_json_response(
+            {"days": calendar}, headers={"Cache-Control": "no-store"}
+        )
+
     @http.route(
         ["/service_booking/submit"], type="http", auth="public", website=True, csrf=True
     )
     def service_booking_submit(self, **post):
-        partner = (
-            request.env["res.partner"]
-            .sudo()
-            .search([("name", "=", post.get("customer_name"))], limit=1)
-        )
-        if not partner:
-            partner = (
-                request.env["res.partner"]
-                .sudo()
-                .create(
-                    {
-                        "name": post.get("customer_name"),
-                        "phone": post.get("contact_number"),
-                        "email": post.get("contact_email"),
-                    }
-                )
-            )
-        else:
-            partner.sudo().write(
-                {
-                    "phone": post.get("contact_number"),
-                    "email": post.get("contact_email"),
-                }
+        values = self._parse_booking_submission(post)
+        if not values:
+            return request.redirect("/service-booking/new?error=invalid")
+        try:
+            request.env["service.workshop.occupancy"].sudo()._reserve_slot(
+                values["plan_service_date"], values["service_type"]
             )
+        except UserError:
+            return request.redirect("/service-booking/new?error=slot_full")
+
+        partner = request.env["res.partner"]._resolve_showroom_partner(
+            post.get("customer_name"),
+            email=post.get("contact_email"),
+            phone=post.get("contact_number"),
+        )
 
         appointment_vals = {
             "customer_name": partner.id,
             "contact_number": post.get("contact_number"),
             "contact_email": post.get("contact_email"),
             "plat_number": post.get("plat_number"),
-            "vehicle_brand": int(post.get("vehicle_brand")),
-            "vehicle_model": int(post.get("vehicle_model")),
-            "vehicle_year_manufacture": (
-                post.get("vehicle_year_manufacture")
-                if post.get("vehicle_year_manufacture")
-                else False
-            ),
-            "kilometers": (
-                int(post.get("kilometers")) if post.get("kilometers") else False
-            ),
-            "plan_service_date": post.get("plan_service_date"),
-            "service_type": int(post.get("service_type")),
+            "vehicle_year_manufacture": post.get("vehicle_year_manufacture") or False,
             "complaint_issue": post.get("complaint_issue"),
+            **values,
         }
 
         appointment = request.env["service.appointment"].sudo().create(appointment_vals)
 
-        if "media_document" in request.params:
-            attachment_ids = []
-            for c_file in request.httprequest.files.getlist("media_document"):
-                attachment_vals = {
-                    "name": c_file.filename,
-                    "datas": base64.b64encode(c_file.read()).decode("utf-8"),
-                    "res_model": "service.appointment",
-                    "res_id": appointment.id,
-                }
-                new_attachment = (
-                    request.env["ir.attachment"].sudo().create(attachment_vals)
+        uploads = request.httprequest.files.getlist("media_document")
+        if uploads:
+            attachments = (
+                request.env["ir.attachment"]
+                .sudo()
+                ._create_from_uploads(uploads, "service.appointment", appointment.id)
+            )
+            if attachments:
+                appointment.sudo().write(
+                    {"media_document": [Command.set(attachments.ids)]}
                 )
-                attachment_ids.append(new_attachment.id)
-
-            if attachment_ids:
-                appointment.sudo().write({"media_document": [(6, 0, attachment_ids)]})
 
         return request.render(
             "infinys_service_showroom.service_booking_success_template",
             {"appointment": appointment},
         )
+
+    def _parse_booking_submission(self, post):
+        """Return the typed relational, numeric and date values of a booking
+        submission, or None when a required one is missing or invalid."""
+        if not all(post.get(name, "").strip() for name in ("customer_name", "contact_number", "plat_number")):
+            return None
+        values = {
+            "vehicle_brand": _parse_id(post.get("vehicle_brand")),
+            "vehicle_model": _parse_id(post.get("vehicle_model")),
+            "service_type": _parse_id(post.get("service_type")),
+        }
+        if not all(values.values()):
+            return None
+        env = request.env
+        if not (
+            env["service.vehicle.brand"].sudo().browse(values["vehicle_brand"]).exists()
+            and env["service.vehicle.model"].sudo().browse(values["vehicle_model"]).exists()
+            and env["service.type"].sudo().browse(values["service_type"]).exists()
+        ):
+            return None
+        try:
+            plan_service_date = fields.Date.to_date(post.get("plan_service_date") or None)
+        except ValueError:
+            return None
+        if not plan_service_date or plan_service_date < fields.Date.context_today(env.user):
+            return None
+        kilometers = post.get("kilometers", "").strip()
+        if kilometers and not kilometers.isdigit():
+            return None
+        values.update(
+            plan_service_date=plan_service_date,
+            kilometers=int(kilometers) if kilometers else False,
+        )
+        return values
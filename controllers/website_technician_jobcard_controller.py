@@ -10,6 +10,16 @@ from odoo.osv.expression import OR
 
 class TechnicianJobCards(CustomerPortal):
     _items_per_page = 10
+    # Columns rendered by my_job_card_list_template.
+    _jobcard_list_fields = [
+        "name",
+        "plan_service_date",
+        "customer_name",
+        "vehicle_brand",
+        "vehicle_model",
+        "plat_number",
+        "state",
+    ]
 
     @http.route(
         ["/my/technician-jobcards", "/my/technician-jobcards/page/<int:page>"],
@@ -94,11 +104,7 @@ class TechnicianJobCards(CustomerPortal):
                 ("create_date", "<=", date_end),
             ]
 
-        service_bookings = ServiceBooking.with_context(
-            from_technician_portal=True
-        ).search(domain, order=order)
-
-        total_records = len(service_bookings)
+        total_records = ServiceBooking.search_count(domain)
         pager = portal_pager(
             url="/my/technician-jobcards",
             total=total_records,
@@ -111,9 +117,18 @@ class TechnicianJobCards(CustomerPortal):
                 "search": search,
             },
         )
-        offset = pager["offset"]
-        limit = self._items_per_page
-        paginated_records = service_bookings[offset : offset + limit]
+        paginated_records = ServiceBooking.with_context(
+            from_technician_portal=True
+        ).search(
+            domain,
+            order=order,
+            limit=self._items_per_page,
+            offset=pager["offset"],
+        )
+        paginated_records.fetch(self._jobcard_list_fields)
+        paginated_records.customer_name.fetch(["name"])
+        paginated_records.vehicle_brand.fetch(["name"])
+        paginated_records.vehicle_model.fetch(["name"])
 
         values = {
             "date": date_begin,
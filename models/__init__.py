@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+from . import showroom_cache_version
+from . import showroom_page_cache
+from . import showroom_image_mixin
 from . import showroom_car_vehicle
 from . import showroom_crm_lead
 from . import showroom_res_config_settings
@@ -8,6 +11,9 @@ from . import service_inspection_image_lines
 from . import service_inspection_type
 from . import service_parts_used_lines
 from . import service_product_template
+from . import service_reminder_mail
+from . import service_date_overdue_mixin
+from . import service_workshop_occupancy_mixin
 from . import service_booking
 from . import service_type
 from . import service_used_lines
@@ -17,6 +23,12 @@ from . import service_vehicle_fuel_type
 from . import service_vehicle_model
 from . import service_vehicle_type
 from . import res_partner
+from . import ir_attachment
+from . import service_media_job
 from . import service_booking_wizards
 from . import service_appointment
+from . import service_workshop_capacity
+from . import service_booking_report
+from . import service_booking_state_event
+from . import service_portal_booking
 from . import wizards
@@ -0,0 +1,241 @@
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import uuid
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+from odoo.tools.image import ImageProcess
+
+_logger = logging.getLogger(__name__)
+
+# Rendition -> (maximum width/height, JPEG quality).
+SERVICE_MEDIA_RENDITIONS = {
+    "display": (1600, 85),
+    "thumbnail": (320, 80),
+}
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_MAX_FILE_SIZE = 256 * 1024 * 1024
+UPLOAD_MAX_REQUEST_SIZE = 512 * 1024 * 1024
+
+
+class _StreamedUpload(bytes):
+    """First bytes of an upload already copied to the filestore.
+
+    Passed as ``raw`` to ``create()``, so the usual content checks run on
+    them, while :meth:`IrAttachment._get_datas_related_values` points the
+    attachment at the stored file.
+    """
+
+    def __new__(cls, head, store_fname, file_size, checksum):
+        self = super().__new__(cls, head)
+        self.store_fname = store_fname
+        self.file_size = file_size
+        self.checksum = checksum
+        return self
+
+
+class IrAttachment(models.Model):
+    _inherit = "ir.attachment"
+
+    service_media_display_id = fields.Many2one(
+        "ir.attachment", string="Display Rendition", ondelete="set null", copy=False
+    )
+    service_media_thumbnail_id = fields.Many2one(
+        "ir.attachment", string="Thumbnail Rendition", ondelete="set null", copy=False
+    )
+    service_media_width = fields.Integer(string="Width (px)", copy=False)
+    service_media_height = fields.Integer(string="Height (px)", copy=False)
+
+    def _get_service_media_url(self, rendition="thumbnail"):
+        """URL of the ``display`` or ``thumbnail`` rendition, or of the original
+        file while it has not been processed yet."""
+        self.ensure_one()
+        attachment = self.sudo()[f"service_media_{rendition}_id"] or self.sudo()
+        access_token = attachment.access_token or attachment.generate_access_token()[0]
+        return "/web/image/%s?access_token=%s" % (attachment.id, access_token)
+
+    def _get_datas_related_values(self, data, mimetype):
+        if not isinstance(data, _StreamedUpload):
+            return super()._get_datas_related_values(data, mimetype)
+        # Already in the filestore: only the index is computed, from the
+        # first bytes of the file.
+        return {
+            "file_size": data.file_size,
+            "checksum": data.checksum,
+            "index_content": self._index(bytes(data), mimetype, checksum=data.checksum),
+            "store_fname": data.store_fname,
+            "db_datas": False,
+        }
+
+    def _generate_service_media_renditions(self):
+        self.ensure_one()
+        if self.mimetype.startswith("video/"):
+            source = self._extract_video_poster()
+            if not source:
+                return
+        else:
+            source = self.raw
+
+        # ImageProcess applies the EXIF orientation; re-encoding with an
+        # explicit quality drops the EXIF block (location, device...) itself.
+        width, height = ImageProcess(source).image.size
+        vals = {"service_media_width": width, "service_media_height": height}
+        basename = os.path.splitext(self.name or "media")[0]
+        renditions = self.create([
+            {
+                "name": f"{basename}-{rendition}.jpg",
+                "raw": ImageProcess(source)
+                .resize(max_width=size, max_height=size)
+                .image_quality(quality=quality, output_format="JPEG"),
+                "mimetype": "image/jpeg",
+                "res_model": self.res_model,
+                "res_id": self.res_id,
+                "access_token": str(uuid.uuid4()),
+            }
+            for rendition, (size, quality) in SERVICE_MEDIA_RENDITIONS.items()
+        ])
+        for rendition, rendered in zip(SERVICE_MEDIA_RENDITIONS, renditions):
+            vals[f"service_media_{rendition}_id"] = rendered.id
+        self.write(vals)
+
+    def _extract_video_poster(self):
+        """Return a JPEG frame of the video, or None when ffmpeg is not installed."""
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            _logger.info(f"ffmpeg not found, no poster extracted for attachment {self.id}.")
+            return None
+        with tempfile.TemporaryDirectory() as tmpdir:
+            if self.store_fname:
+                video_path = self._full_path(self.store_fname)
+            else:
+                video_path = os.path.join(tmpdir, "video")
+                with open(video_path, "wb") as f:
+                    f.write(self.raw)
+            poster_path = os.path.join(tmpdir, "poster.jpg")
+            subprocess.run(
+                [ffmpeg, "-v", "error", "-i", video_path, "-frames:v", "1", "-y", poster_path],
+                check=True,
+                timeout=60,
+            )
+            with open(poster_path, "rb") as f:
+                return f.read()
+
+    @api.model
+    def _create_from_uploads(self, uploads, res_model, res_id):
+        """Create attachments from uploaded werkzeug ``FileStorage`` objects.
+
+        Files are copied to the filestore chunk by chunk while their checksum
+        is computed, so an upload is never held in memory nor base64-encoded.
+        Identical files in one request are stored once, and all attachments
+        are created in a single batch. Raises ``UserError`` when a file or the
+        request as a whole exceeds the upload limits.
+
+        Streamed files are stored as uploaded: the automatic resizing of
+        large images would need the whole file in memory.
+        """
+        vals_list = []
+        streamed_fnames = []
+        seen = set()
+        request_size = 0
+        try:
+            for upload in uploads:
+                if not upload.filename:
+                    continue
+                if self._storage() == "file":
+                    content = self._stream_upload_to_filestore(upload)
+                    if content.get("store_fname"):
+                        streamed_fnames.append(content["store_fname"])
+                else:
+                    raw = upload.stream.read(UPLOAD_MAX_FILE_SIZE + 1)
+                    content = {"raw": raw, "file_size": len(raw), "checksum": self._compute_checksum(raw)}
+                if content["file_size"] > UPLOAD_MAX_FILE_SIZE:
+                    raise UserError(_(
+                        "The file %(name)s is larger than the %(limit)s MB upload limit.",
+                        name=upload.filename,
+                        limit=UPLOAD_MAX_FILE_SIZE // (1024 * 1024),
+                    ))
+                request_size += content["file_size"]
+                if request_size > UPLOAD_MAX_REQUEST_SIZE:
+                    raise UserError(_(
+                        "The uploaded files exceed the %(limit)s MB limit per submission.",
+                        limit=UPLOAD_MAX_REQUEST_SIZE // (1024 * 1024),
+                    ))
+                if content["checksum"] in seen:
+                    continue
+                seen.add(content["checksum"])
+                vals = {"name": upload.filename, "res_model": res_model, "res_id": res_id}
+                if "raw" in content:
+                    vals["raw"] = content["raw"]
+                else:
+                    head = content.pop("head")
+                    vals["mimetype"] = self._compute_mimetype({"name": upload.filename, "raw": head})
+                    vals["raw"] = _StreamedUpload(head, **content)
+                vals_list.append(vals)
+
+            attachments = (
+                self.with_context(image_no_postprocess=bool(streamed_fnames))
+                .create(vals_list)
+                .with_env(self.env)
+            )
+        except Exception:
+            for fname in streamed_fnames:
+                self._mark_for_gc(fname)
+            raise
+
+        if streamed_fnames:
+            # Referenced only once committed: let the filestore garbage
+            # collector check them if the transaction rolls back.
+            self.env.cr.postrollback.add(
+                lambda: [self._mark_for_gc(fname) for fname in streamed_fnames]
+            )
+        return attachments
+
+    @api.model
+    def _stream_upload_to_filestore(self, upload):
+        """Copy ``upload`` into the filestore and return its attachment values.
+
+        Copying stops as soon as the file exceeds the per-file limit; the
+        returned ``file_size`` then tells the caller to reject it. ``head``
+        holds the first bytes, to guess the mimetype from.
+        """
+        sha = hashlib.sha1()
+        size = 0
+        head = b""
+        directory = self._full_path("")
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as tmp:
+            try:
+                while chunk := upload.stream.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > UPLOAD_MAX_FILE_SIZE:
+                        break
+                    if not head:
+                        head = chunk[:1024]
+                    sha.update(chunk)
+                    tmp.write(chunk)
+            except Exception:
+                os.unlink(tmp.name)
+                raise
+        if size > UPLOAD_MAX_FILE_SIZE:
+            os.unlink(tmp.name)
+            return {"file_size": size, "checksum": None}
+
+        checksum = sha.hexdigest()
+        fname = checksum[:2] + "/" + checksum
+        full_path = self._full_path(fname)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if os.path.isfile(full_path):
+            os.unlink(tmp.name)
+        else:
+            os.replace(tmp.name, full_path)
+        return {
+            "store_fname": fname,
+            "file_size": size,
+            "checksum": checksum,
+            "head": head,
+        }
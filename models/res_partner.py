@@ -1,4 +1,51 @@
-from odoo import fields, models
+import re
+
+from odoo import api, fields, models, tools
+
+
+def _normalize_email_key(email):
+    email = (email or "").strip().lower()
+    return email or False
+
+
+def _normalize_phone_key(phone, country_code=None):
+    """Return ``phone`` in E.164 form (``+628123456789``) or False.
+
+    Local numbers (leading 0) get ``country_code``; numbers without a leading
+    0 or + are taken as already carrying their country code.
+    """
+    phone = (phone or "").strip()
+    digits = re.sub(r"\D", "", phone)
+    if not digits:
+        return False
+    if phone.startswith("+"):
+        return "+" + digits
+    if digits.startswith("00"):
+        return "+" + digits[2:]
+    if digits.startswith("0"):
+        if not country_code:
+            return False
+        return "+%s%s" % (country_code, digits[1:])
+    return "+" + digits
+
+
+class ResPartnerShowroomClaim(models.Model):
+    """Contact key of a partner created from a website submission.
+
+    The unique key lets concurrent submissions for the same contact agree
+    on one partner; see :meth:`ResPartner._resolve_showroom_partner`.
+    """
+
+    _name = "res.partner.showroom.claim"
+    _description = "Website Customer Contact Key"
+    _log_access = False
+
+    key = fields.Char(string="Key", required=True, readonly=True)
+    partner_id = fields.Many2one("res.partner", string="Partner", readonly=True, ondelete="cascade")
+
+    _sql_constraints = [
+        ("key_uniq", "unique (key)", "A contact key is claimed once."),
+    ]
 
 
 class ResPartner(models.Model):
@@ -10,3 +57,165 @@ class ResPartner(models.Model):
         string="Vehicles",
         help="The vehicles owned by this customer",
     )
+
+    showroom_email_key = fields.Char(
+        string="Matching Email",
+        compute="_compute_showroom_match_keys",
+        store=True,
+        index=True,
+        help="Normalized email used to recognize returning website customers.",
+    )
+    showroom_phone_key = fields.Char(
+        string="Matching Phone",
+        compute="_compute_showroom_match_keys",
+        store=True,
+        index=True,
+        help="E.164 phone number used to recognize returning website customers.",
+    )
+
+    def init(self):
+        super().init()
+        tools.create_index(
+            self.env.cr,
+            "res_partner_lower_name_index",
+            self._table,
+            ["lower(name)"],
+        )
+
+    @api.depends("email", "phone", "country_id", "company_id.country_id")
+    def _compute_showroom_match_keys(self):
+        for partner in self:
+            partner.showroom_email_key = _normalize_email_key(partner.email)
+            partner.showroom_phone_key = _normalize_phone_key(
+                partner.phone,
+                partner.country_id.phone_code or partner.company_id.country_id.phone_code,
+            )
+
+    @api.model
+    def _resolve_showroom_partner(self, name, email=None, phone=None):
+        """Return the partner of a website submission, creating it if needed.
+
+        Partners are matched on email first, then phone, then name. A name
+        only matches a partner whose email and phone do not contradict the
+        submission. Companies and the partners of internal users are never
+        matched. Missing contact details are filled in, never overwritten.
+
+        A partner is only created after claiming the normalized contact key
+        in ``res.partner.showroom.claim``. A concurrent submission for the
+        same contact blocks on that unique key; once the first one commits,
+        PostgreSQL raises a serialization failure and the request is
+        retried, now finding the new partner. A key claimed by a partner
+        that no longer matches the submission is handed over to the partner
+        matched or created instead.
+
+        A local phone number is read in the country of the current company,
+        which is then set on a partner without a country so that its stored
+        key agrees.
+        """
+        Partner = self.sudo()
+        email_key = _normalize_email_key(email)
+        phone_key = _normalize_phone_key(phone, self.env.company.country_id.phone_code)
+        name = (name or "").strip()
+
+        partner = Partner._match_showroom_partner(name, email_key, phone_key)
+        if partner:
+            return partner._fill_showroom_contact(email, phone, phone_key)
+
+        if email_key:
+            claim_key = f"email:{email_key}"
+        elif phone_key:
+            claim_key = f"phone:{phone_key}"
+        else:
+            claim_key = f"name:{name.lower()}"
+        cr = self.env.cr
+        cr.execute(
+            """
+            INSERT INTO res_partner_showroom_claim (key) VALUES (%s)
+            ON CONFLICT (key) DO NOTHING
+              RETURNING id
+            """,
+            (claim_key,),
+        )
+        row = cr.fetchone()
+        if row:
+            claim_id = row[0]
+        else:
+            # Claimed earlier, by a partner whose details have changed since.
+            cr.execute(
+                "SELECT id, partner_id FROM res_partner_showroom_claim WHERE key = %s FOR UPDATE",
+                (claim_key,),
+            )
+            claim_id, partner_id = cr.fetchone()
+            # Matched again under the lock: the claiming partner may have
+            # been committed, or changed, since the first lookup.
+            partner = Partner._match_showroom_partner(name, email_key, phone_key)
+            if partner and partner.id == partner_id:
+                return partner._fill_showroom_contact(email, phone, phone_key)
+
+        if not partner:
+            partner = Partner.create({
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "country_id": self._get_showroom_phone_country(phone, phone_key).id,
+            })
+        else:
+            partner._fill_showroom_contact(email, phone, phone_key)
+        cr.execute(
+            "UPDATE res_partner_showroom_claim SET partner_id = %s WHERE id = %s",
+            (partner.id, claim_id),
+        )
+        return partner
+
+    @api.model
+    def _match_showroom_partner(self, name, email_key, phone_key):
+        self.flush_model(["showroom_email_key", "showroom_phone_key", "name", "active", "is_company"])
+        self.env["res.users"].flush_model(["partner_id", "share"])
+        self.env.cr.execute(
+            """
+            SELECT id FROM res_partner p
+             WHERE active
+               AND NOT COALESCE(is_company, FALSE)
+               AND NOT EXISTS (
+                       SELECT 1 FROM res_users u
+                        WHERE u.partner_id = p.id AND NOT COALESCE(u.share, FALSE)
+                   )
+               AND (showroom_email_key = %(email)s
+                    OR showroom_phone_key = %(phone)s
+                    OR (lower(name) = lower(%(name)s)
+                        AND (showroom_email_key IS NULL OR showroom_email_key = %(email)s)
+                        AND (showroom_phone_key IS NULL OR showroom_phone_key = %(phone)s)))
+          ORDER BY (showroom_email_key = %(email)s) IS TRUE DESC,
+                   (showroom_phone_key = %(phone)s) IS TRUE DESC,
+                   id
+             LIMIT 1
+            """,
+            {"email": email_key or None, "phone": phone_key or None, "name": name},
+        )
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    @api.model
+    def _get_showroom_phone_country(self, phone, phone_key):
+        """Country a local ``phone`` was read in, to keep on the partner.
+
+        Empty when the number carries its own country code.
+        """
+        if phone_key and not _normalize_phone_key(phone):
+            return self.env.company.country_id
+        return self.env["res.country"]
+
+    def _fill_showroom_contact(self, email, phone, phone_key=False):
+        self.ensure_one()
+        vals = {}
+        if email and not self.email:
+            vals["email"] = email
+        if phone and not self.phone:
+            vals["phone"] = phone
+            if not self.country_id and not self.company_id.country_id:
+                country = self._get_showroom_phone_country(phone, phone_key)
+                if country:
+                    vals["country_id"] = country.id
+        if vals:
+            self.write(vals)
+        return self
@@ -1,5 +1,11 @@
 import logging
+import threading
+from time import monotonic
+
+from markupsafe import Markup
+
 from odoo import api, fields, models, _
+from odoo.tools import split_every
 from datetime import date, timedelta
 from odoo.exceptions import ValidationError
 
@@ -8,9 +14,11 @@ _logger = logging.getLogger(__name__)
 class ServiceAppointment(models.Model):
     _name = "service.appointment"
     _description = "Service Appointment"
-    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'portal.mixin', 'service.reminder.mail.mixin', 'service.date.overdue.mixin', 'service.workshop.occupancy.mixin']
     _rec_name = "name"
     _order = "create_date desc"
+    _overdue_closed_states = ('done', 'cancelled')
+    _CANCEL_BATCH_SIZE = 500
 
     name = fields.Char(
         string="Appointment Number", 
@@ -24,6 +32,7 @@ class ServiceAppointment(models.Model):
         "res.partner",
         string="Customer Name",
         required=True,
+        index=True,
         help="Choose customer name",
     )
     contact_number = fields.Char(string="Contact Number", required=True)
@@ -56,7 +65,6 @@ class ServiceAppointment(models.Model):
     plan_service_date = fields.Date(
         string="Planned Service Date", required=True, default=fields.Date.context_today
     )
-    is_date_overdue = fields.Boolean(compute='_compute_is_date_overdue')
     service_type = fields.Many2one(
         "service.type",
         string="Service Type",
@@ -97,13 +105,7 @@ class ServiceAppointment(models.Model):
     
     @api.depends('plan_service_date', 'state')
     def _compute_is_date_overdue(self):
-        today = fields.Date.today()
-        for rec in self:
-            rec.is_date_overdue = (
-                rec.plan_service_date and
-                rec.plan_service_date < today and
-                rec.state not in ('done', 'cancelled')
-            )
+        super()._compute_is_date_overdue()
 
     @api.constrains('state', 'job_order_id')
     def _check_job_order_creation(self):
@@ -185,29 +187,22 @@ class ServiceAppointment(models.Model):
         if vals.get('name', _('New')) == _('New'):
             vals['name'] = self.env['ir.sequence'].next_by_code('service.appointment') or _('New')
         res = super(ServiceAppointment, self).create(vals)
+        self.env["service.portal.booking"]._invalidate_portal_count(res.customer_name.ids)
+        self.env["service.media.job"]._enqueue(res.media_document)
+
+        settings = self.env["res.config.settings"]._get_showroom_settings()
 
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        enable_new_appointment_supervisor_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_new_appointment_supervisor_reminders", "False"
-        ).lower() == "true"
-        reminder_new_appointment_supervisor_activity = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_activity", "False"
-        ).lower() == "true"
-        reminder_new_appointment_supervisor_email = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_email", "False"
-        ).lower() == "true"
-
-        if enable_new_appointment_supervisor_reminders:
+        if settings.enable_new_appointment_supervisor_reminders:
             supervisor_group = self.env.ref('infinys_service_showroom.group_infinys_service_supervisor', raise_if_not_found=False)
             if supervisor_group:
                 supervisor_users = supervisor_group.users
-                if reminder_new_appointment_supervisor_activity:
+                if settings.reminder_new_appointment_supervisor_activity:
                     res._send_activity_notification(
                         supervisor_users,
                         _("New Service Appointment: %s needs Job Order") % res.name,
                         _("A new service appointment %s has been created. Please review and create a Job Order.") % res.name
                     )
-                if reminder_new_appointment_supervisor_email:
+                if settings.reminder_new_appointment_supervisor_email:
                     for user in supervisor_users:
                         res._send_reminder_email(
                             'email_template_new_appointment_supervisor_reminder',
@@ -215,6 +210,24 @@ class ServiceAppointment(models.Model):
                         )
         return res
 
+    def unlink(self):
+        partner_ids = self.customer_name.ids
+        res = super().unlink()
+        self.env["service.portal.booking"]._invalidate_portal_count(partner_ids)
+        return res
+
+    def write(self, vals):
+        portal_partner_ids = set()
+        if "state" in vals or "customer_name" in vals:
+            portal_partner_ids.update(self.customer_name.ids)
+        res = super().write(vals)
+        if portal_partner_ids:
+            portal_partner_ids.update(self.customer_name.ids)
+            self.env["service.portal.booking"]._invalidate_portal_count(portal_partner_ids)
+        if "media_document" in vals:
+            self.env["service.media.job"]._enqueue(self.media_document)
+        return res
+
     @api.onchange('vehicle_brand')
     def _onchange_vehicle_brand(self):
         if self.vehicle_brand:
@@ -241,52 +254,8 @@ class ServiceAppointment(models.Model):
         if not recipient_user or not recipient_user.partner_id.email:
             _logger.warning(f"No recipient or email address found for email reminder using template {template_xml_id}.")
             return
-
-        body = ""
-        subject = ""
-        email_from = f"<{self.env.company.email or self.env.user.email}>"
-
-        record = booking_record or self
-
-        if template_xml_id == 'email_template_new_appointment_supervisor_reminder':
-            subject = f"New Service Appointment: {record.name} needs Job Order"
-            body = f"""
-                <div style=\"margin: 0px; padding: 0px;">
-                    <p style=\"margin: 0px; padding: 0px; font-size: 13px;\">
-                        Hello {recipient_user.name},
-                        <br/><br/>
-                        A new service appointment, <strong>{record.name}</strong>, has been created and requires your attention to be converted into a Job Order.
-                        <br/><br/>
-                        <strong>Customer:</strong> {record.customer_name.name} <br/>
-                        <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                        <strong>Planned Service Date:</strong> {record.plan_service_date} <br/>
-                        <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                        <br/><br/>
-                        Please review the appointment and create a Job Order.
-                        <br/><br/>
-                        <a href=\"/web#model=service.appointment&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Appointment</a>
-                        <br/><br/>
-                        Thank you,<br/>
-                        The Service Team
-                    </p>
-                </div>
-            """
-        
-        if subject and body:
-            mail_values = {
-                'email_from': email_from,
-                'author_id': self.env.user.partner_id.id,
-                'email_to': recipient_user.partner_id.email,
-                'subject': subject,
-                'body_html': body,
-                'auto_delete': True,
-                'state': 'outgoing',
-                'res_id': record.id,
-                'model': 'service.appointment',
-            }
-            self.env['mail.mail'].sudo().create(mail_values).send()
-            _logger.info(f"Sent email reminder for appointment {record.name} to {recipient_user.partner_id.email} using template {template_xml_id}.")
-
+        records = booking_record or self
+        records._queue_reminder_emails(template_xml_id, dict.fromkeys(records.ids, recipient_user))
 
     def _compute_job_order_count(self):
         for rec in self:
@@ -342,31 +311,18 @@ class ServiceAppointment(models.Model):
 
     @api.model
     def _check_and_send_new_appointment_reminders(self):
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        enable_new_appointment_supervisor_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_new_appointment_supervisor_reminders", "False"
-        ).lower() == "true"
+        settings = self.env["res.config.settings"]._get_showroom_settings()
 
-        if not enable_new_appointment_supervisor_reminders:
+        if not settings.enable_new_appointment_supervisor_reminders:
             _logger.info("New Appointment Supervisor Reminders are disabled.")
             return
 
-        reminder_interval_days_new_appointment = int(ICPSudo.get_param(
-            "infinys_service_showroom.reminder_interval_days_new_appointment", default="1"
-        ))
-        reminder_new_appointment_supervisor_activity = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_activity", "False"
-        ).lower() == "true"
-        reminder_new_appointment_supervisor_email = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_email", "False"
-        ).lower() == "true"
-
         today = fields.Date.today()
 
         overdue_new_appointments = self.search([
             ('state', '=', 'draft'),
             ('job_order_id', '=', False),
-            ('create_date', '<=', today - timedelta(days=reminder_interval_days_new_appointment)),
+            ('create_date', '<=', today - timedelta(days=settings.reminder_interval_days_new_appointment)),
             '|',
             ('last_reminder_date_new_appointment', '=', False),
             ('last_reminder_date_new_appointment', '<', today)
@@ -379,44 +335,66 @@ class ServiceAppointment(models.Model):
 
         supervisor_users = supervisor_group.users
 
-        for appointment in overdue_new_appointments:
-            activity_reminder_sent = False
-            email_reminder_sent = False
-
-            if reminder_new_appointment_supervisor_activity:
+        if settings.reminder_new_appointment_supervisor_activity:
+            for appointment in overdue_new_appointments:
                 appointment._send_activity_notification(
                     supervisor_users,
                     _("REMINDER: New Service Appointment %s needs Job Order") % appointment.name,
                     _("Service Appointment %s created on %s is still awaiting Job Order creation.") % (appointment.name, appointment.create_date.strftime('%Y-%m-%d'))
                 )
-                activity_reminder_sent = True
-            
-            if reminder_new_appointment_supervisor_email:
-                for user in supervisor_users:
-                    appointment._send_reminder_email(
-                        'email_template_new_appointment_supervisor_reminder',
-                        user
-                    )
-                email_reminder_sent = True
 
-            if activity_reminder_sent or email_reminder_sent:
-                appointment.last_reminder_date_new_appointment = today
+        if settings.reminder_new_appointment_supervisor_email and overdue_new_appointments:
+            for user in supervisor_users:
+                overdue_new_appointments._send_reminder_email(
+                    'email_template_new_appointment_supervisor_reminder',
+                    user
+                )
+
+        if settings.reminder_new_appointment_supervisor_activity or settings.reminder_new_appointment_supervisor_email:
+            overdue_new_appointments.write({'last_reminder_date_new_appointment': today})
 
         return True
 
     @api.model
-    def _cancel_overdue_appointments(self):
-        today = fields.Date.today()
-        overdue_appointments = self.search([
+    def _cancel_overdue_appointments(self, batch_size=None):
+        """Cancel draft appointments whose planned date has passed.
+
+        Appointments are cancelled in chunks with one ``write()`` each. Field
+        tracking is replaced by one batched chatter note per chunk, carrying
+        the state change as its tracking value, and each chunk is committed
+        on its own so a failure does not undo earlier ones.
+        Returns the number of cancelled appointments and the elapsed time.
+        """
+        started = monotonic()
+        batch_size = batch_size or self._CANCEL_BATCH_SIZE
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        overdue_ids = self.search([
             ('state', '=', 'draft'),
-            ('plan_service_date', '<', today),
-            ('job_order_id', '=', False)
-        ])
-        for appointment in overdue_appointments:
-            appointment.write({
+            ('plan_service_date', '<', fields.Date.today()),
+            ('job_order_id', '=', False),
+        ]).ids
+        reason = _("Appointment automatically cancelled due to overdue booking date.")
+        body = Markup("<p>%s</p>") % reason
+        state_tracking = self.env['mail.tracking.value']._create_tracking_values(
+            'draft', 'cancelled', 'state', self.fields_get(['state'])['state'], self,
+        )
+
+        cancelled = 0
+        for ids in split_every(batch_size, overdue_ids):
+            appointments = self.browse(ids).with_context(tracking_disable=True)
+            appointments.write({
                 'state': 'cancelled',
-                'cancel_reason': _("Appointment automatically cancelled due to overdue booking date."),
+                'cancel_reason': reason,
             })
-            _logger.info(f"Appointment {appointment.name} otomatis dibatalkan karena tanggal terlewat.")
-        return True
-
+            messages = appointments._message_log_batch(dict.fromkeys(appointments.ids, body))
+            self.env['mail.tracking.value'].sudo().create([
+                dict(state_tracking, mail_message_id=message.id) for message in messages
+            ])
+            cancelled += len(appointments)
+            if auto_commit:
+                self.env.cr.commit()
+            _logger.info(f"{len(appointments)} appointment(s) otomatis dibatalkan karena tanggal terlewat.")
+
+        summary = {'cancelled': cancelled, 'seconds': monotonic() - started}
+        _logger.info(f"Overdue appointment cancellation: {cancelled} cancelled in {summary['seconds']:.2f}s")
+        return summary
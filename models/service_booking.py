@@ -1,7 +1,12 @@
+import heapq
 import logging
-from odoo import api, fields, models, _
+import threading
+from collections import defaultdict
+from time import monotonic
+from odoo import api, fields, models, tools, Command, _
 from odoo.exceptions import UserError, ValidationError
-from datetime import date, timedelta
+from odoo.tools import split_every
+from datetime import date, datetime, time, timedelta
 from odoo.addons.mail.models.mail_activity_mixin import MailActivityMixin
 from odoo.addons.portal.models.portal_mixin import PortalMixin
 from odoo.addons.mail.models.mail_thread import MailThread
@@ -15,7 +20,7 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
     _description = "Service Booking"
     _rec_name = "name"
     _order = "plan_service_date desc"
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'service.reminder.mail.mixin', 'service.date.overdue.mixin', 'service.workshop.occupancy.mixin']
 
     name = fields.Char(
         string="Booking Number", help="Enter the booking number for the vehicle service"
@@ -25,6 +30,7 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
         "res.partner",
         string="Customer Name",
         required=True,
+        index=True,
         help="Choose customer name",
     )
     contact_number = fields.Char(string="Contact Number", required=True)
@@ -56,7 +62,6 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
     plan_service_date = fields.Date(
         string="Booking Date", required=True, default=fields.Date.context_today
     )
-    is_date_overdue = fields.Boolean(compute='_compute_is_date_overdue')
     service_date = fields.Date(
         string="Service Date", required=True, default=fields.Date.context_today
     )
@@ -183,15 +188,26 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
         store=False,
     )
 
+    # Only these fields can leave a booking without checklist lines (or make it
+    # eligible for them), so write() re-seeds the checklist only when they change.
+    _CHECKLIST_TRIGGER_FIELDS = {"inspection_checklist_line_ids", "state"}
+    _REMINDER_BATCH_SIZE = 500
+    _MEDIA_FIELDS = ("media_document", "internal_media_document")
+    _overdue_closed_states = ('completed', 'cancelled')
+
+    def init(self):
+        super().init()
+        # Serves the technician portal listing: one technician, newest first.
+        tools.create_index(
+            self.env.cr,
+            "service_booking_technician_plan_date_idx",
+            self._table,
+            ["assigned_technician_id", "plan_service_date DESC"],
+        )
+
     @api.depends('plan_service_date', 'state')
     def _compute_is_date_overdue(self):
-        today = fields.Date.today()
-        for rec in self:
-            rec.is_date_overdue = (
-                rec.plan_service_date and
-                rec.plan_service_date < today and
-                rec.state not in ('completed', 'cancelled')
-            )
+        super()._compute_is_date_overdue()
 
     @api.onchange('vehicle_brand')
     def _onchange_vehicle_brand(self):
@@ -246,152 +262,225 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
             if record.plan_service_date < date.today():
                 raise ValidationError(_("Service date cannot be in the past."))
 
-    @api.model
-    def create(self, vals):
-        if "plat_number" in vals and vals["plat_number"]:
-            vals["plat_number"] = vals["plat_number"].upper()
-        if vals.get("name", "/") in ("/", False, None):
-            vals["name"] = (
-                self.env["ir.sequence"].next_by_code("infinys.vehicle.service") or "/"
-            )
-        res = super().create(vals)
-
-        if res.customer_name and res.plat_number:
-            vehicle = self.env["service.customer.vehicle"].search(
-                [
-                    ("customer_id", "=", res.customer_name.id),
-                    ("vehicle_plate_no", "=", res.plat_number),
-                ]
-            )
-            if not vehicle:
-                self.env["service.customer.vehicle"].create(
-                    {
-                        "customer_id": res.customer_name.id,
-                        "vehicle_plate_no": res.plat_number,
-                        "vehicle_brand_id": res.vehicle_brand.id,
-                        "vehicle_model_id": res.vehicle_model.id,
-                        "vehicle_year": res.vehicle_year_manufacture,
-                    }
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if "plat_number" in vals and vals["plat_number"]:
+                vals["plat_number"] = vals["plat_number"].upper()
+            if vals.get("name", "/") in ("/", False, None):
+                vals["name"] = (
+                    self.env["ir.sequence"].next_by_code("infinys.vehicle.service") or "/"
                 )
-        
-        res._populate_inspection_checklist()
-        
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        enable_service_booking_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_reminders", "False"
-        ).lower() == "true"
-        reminder_new_booking_supervisor = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_booking_supervisor", "False"
-        ).lower() == "true"
-        enable_service_booking_email_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_email_reminders", "False"
-        ).lower() == "true"
-        reminder_new_booking_supervisor_email = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_new_booking_supervisor_email", "False"
-        ).lower() == "true"
-
-        if enable_service_booking_reminders and reminder_new_booking_supervisor:
-            supervisor_users = self.env['res.users'].search([('id', '=', res.supervisor_user_id.user_id.id)])
-            if supervisor_users:
-                res._send_activity_notification(
-                    supervisor_users,
+        records = super().create(vals_list)
+
+        self.env["service.booking.state.event"]._log_transitions(records, {})
+        self.env["service.portal.booking"]._invalidate_portal_count(records.customer_name.ids)
+        records._sync_customer_vehicles()
+        records._populate_inspection_checklist()
+        self.env["service.media.job"]._enqueue(
+            records.media_document | records.internal_media_document
+        )
+
+        settings = self.env["res.config.settings"]._get_showroom_settings()
+
+        notify_activity = (
+            settings.enable_service_booking_reminders
+            and settings.reminder_new_booking_supervisor
+        )
+        notify_email = (
+            settings.enable_service_booking_email_reminders
+            and settings.reminder_new_booking_supervisor_email
+        )
+        supervised = records.filtered(lambda r: r.supervisor_user_id.user_id)
+        if notify_activity:
+            self._create_notification_activities([
+                (
+                    res,
+                    res.supervisor_user_id.user_id,
                     _("New Service Booking: %s needs assignment") % res.name,
-                    _("Please assign technician for Service Booking %s.") % res.name
-                )
-        if enable_service_booking_email_reminders and reminder_new_booking_supervisor_email:
-            if res.supervisor_user_id and res.supervisor_user_id.user_id:
-                res._send_reminder_email(
-                    'email_template_new_booking_supervisor_reminder',
-                    res.supervisor_user_id.user_id
+                    _("Please assign technician for Service Booking %s.") % res.name,
                 )
+                for res in supervised
+            ])
+        if notify_email and supervised:
+            supervised._queue_reminder_emails(
+                'email_template_new_booking_supervisor_reminder',
+                {res.id: res.supervisor_user_id.user_id for res in supervised},
+            )
+        return records
+
+    def _sync_customer_vehicles(self):
+        """Register unknown (customer, plate) pairs as customer vehicles in one pass."""
+        bookings = self.filtered(lambda r: r.customer_name and r.plat_number)
+        if not bookings:
+            return
+        CustomerVehicle = self.env["service.customer.vehicle"]
+        existing = CustomerVehicle.search_read(
+            [
+                ("customer_id", "in", bookings.customer_name.ids),
+                ("vehicle_plate_no", "in", list(set(bookings.mapped("plat_number")))),
+            ],
+            ["customer_id", "vehicle_plate_no"],
+        )
+        known = {
+            (vehicle["customer_id"][0], vehicle["vehicle_plate_no"])
+            for vehicle in existing
+        }
+        vehicle_vals_list = []
+        for booking in bookings:
+            key = (booking.customer_name.id, booking.plat_number)
+            if key in known:
+                continue
+            known.add(key)
+            vehicle_vals_list.append({
+                "customer_id": booking.customer_name.id,
+                "vehicle_plate_no": booking.plat_number,
+                "vehicle_brand_id": booking.vehicle_brand.id,
+                "vehicle_model_id": booking.vehicle_model.id,
+                "vehicle_year": booking.vehicle_year_manufacture,
+            })
+        if vehicle_vals_list:
+            CustomerVehicle.create(vehicle_vals_list)
+
+    def unlink(self):
+        partner_ids = self.customer_name.ids
+        res = super().unlink()
+        self.env["service.portal.booking"]._invalidate_portal_count(partner_ids)
         return res
 
     def write(self, vals):
-        old_state = self.state
+        old_states = {record.id: record.state for record in self}
+        StateEvent = self.env["service.booking.state.event"]
+        state_snapshot = StateEvent._snapshot(self) if "state" in vals else {}
+        portal_partner_ids = set()
+        if "state" in vals or "customer_name" in vals:
+            portal_partner_ids.update(self.customer_name.ids)
         
         if "plat_number" in vals and vals["plat_number"]:
             vals["plat_number"] = vals["plat_number"].upper()
         
         res = super().write(vals)
-        
-        self._populate_inspection_checklist()
-
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        enable_service_booking_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_reminders", "False"
-        ).lower() == "true"
-        reminder_assigned_technician_initial = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_assigned_technician_initial", "False"
-        ).lower() == "true"
-        reminder_in_progress_notification = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_in_progress_notification", "False"
-        ).lower() == "true"
-        enable_service_booking_email_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_email_reminders", "False"
-        ).lower() == "true"
-        reminder_assigned_technician_initial_email = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_assigned_technician_initial_email", "False"
-        ).lower() == "true"
-        reminder_in_progress_notification_email = ICPSudo.get_param(
-            "infinys_service_showroom.reminder_in_progress_notification_email", "False"
-        ).lower() == "true"
 
-        for record in self:
-            if enable_service_booking_reminders and record.state == 'assigned' and old_state != 'assigned':
-                if reminder_assigned_technician_initial and record.assigned_technician_id:
-                    record._send_activity_notification(
-                        record.assigned_technician_id,
-                        _("Service Booking %s Assigned") % record.name,
-                        _("You have been assigned to service booking %s. Please start working on it.") % record.name
-                    )
-                if enable_service_booking_email_reminders and reminder_assigned_technician_initial_email:
-                    if record.assigned_technician_id:
-                        record._send_reminder_email(
-                            'email_template_assigned_technician_overdue_reminder',
-                            record.assigned_technician_id
-                        )
-            
-            if enable_service_booking_reminders and record.state == 'in_progress' and old_state != 'in_progress':
-                if reminder_in_progress_notification:
-                    if self.env.user == record.assigned_technician_id:
-                        if record.supervisor_user_id and record.supervisor_user_id.user_id:
-                            record._send_activity_notification(
-                                record.supervisor_user_id.user_id,
-                                _("Service Booking %s is In Progress") % record.name,
-                                _("Technician %s has started working on Service Booking %s.") % (self.env.user.name, record.name)
-                            )
-                    else:
-                        if record.assigned_technician_id:
-                            record._send_activity_notification(
-                                record.assigned_technician_id.user_ids,
-                                _("Service Booking %s is In Progress") % record.name,
-                                _("Service Booking %s has been marked as in progress.") % record.name
-                            )
-                if enable_service_booking_email_reminders and reminder_in_progress_notification_email:
-                    if self.env.user == record.assigned_technician_id: 
-                        if record.supervisor_user_id and record.supervisor_user_id.user_id:
-                            record._send_reminder_email(
-                                'email_template_in_progress_supervisor_overdue_reminder',
-                                record.supervisor_user_id.user_id
-                            )
-                    else: 
-                        if record.assigned_technician_id:
-                            record._send_reminder_email(
-                                'email_template_in_progress_technician_overdue_reminder',
-                                record.assigned_technician_id
-                            )
+        if "state" in vals:
+            StateEvent._log_transitions(self, state_snapshot)
+
+        if portal_partner_ids:
+            portal_partner_ids.update(self.customer_name.ids)
+            self.env["service.portal.booking"]._invalidate_portal_count(portal_partner_ids)
+
+        if self._CHECKLIST_TRIGGER_FIELDS.intersection(vals):
+            self._populate_inspection_checklist()
+
+        if any(field in vals for field in self._MEDIA_FIELDS):
+            self.env["service.media.job"]._enqueue(
+                self.media_document | self.internal_media_document
+            )
+
+        if "state" in vals and not self.env.context.get("defer_state_notifications"):
+            self._notify_state_changes(old_states)
         return res
 
     def _populate_inspection_checklist(self):
+        """Seed the default checklist on bookings that do not have any line yet."""
+        inspection_type_ids = self.env["service.inspection.type"]._get_active_inspection_type_ids()
+        if not self or not inspection_type_ids:
+            return
+        ChecklistLine = self.env["service.inspection.checklist.line"]
+        seeded_booking_ids = {
+            booking.id
+            for [booking] in ChecklistLine._read_group(
+                [("service_booking_id", "in", self.ids)], ["service_booking_id"]
+            )
+        }
+        ChecklistLine.create([
+            {
+                "service_booking_id": booking_id,
+                "inspection_type_id": inspection_type_id,
+                "checklist_ok": False,
+            }
+            for booking_id in self.ids
+            if booking_id not in seeded_booking_ids
+            for inspection_type_id in inspection_type_ids
+        ])
+
+    def _notify_state_changes(self, old_states):
+        """Notify technicians and supervisors of the job orders that changed state.
+
+        ``old_states`` maps record ids to their state before the change. The
+        activities of all records are created in one batch and every email
+        template is rendered once per recipient.
+        """
+        settings = self.env["res.config.settings"]._get_showroom_settings()
+        if not settings.enable_service_booking_reminders:
+            return
+        send_email = settings.enable_service_booking_email_reminders
+        activities = []
+        emails = defaultdict(dict)
         for record in self:
-            if not record.inspection_checklist_line_ids:
-                inspection_types = self.env["service.inspection.type"].search([("active", "=", True)])
-                for insp_type in inspection_types:
-                    record.env["service.inspection.checklist.line"].create({
-                        "service_booking_id": record.id,
-                        "inspection_type_id": insp_type.id,
-                        "checklist_ok": False,
-                    })
+            if record.state == old_states.get(record.id):
+                continue
+            technician = record.assigned_technician_id
+            supervisor_user = record.supervisor_user_id.user_id
+            if record.state == 'assigned' and technician:
+                if settings.reminder_assigned_technician_initial:
+                    activities.append((
+                        record,
+                        technician,
+                        _("Service Booking %s Assigned") % record.name,
+                        _("You have been assigned to service booking %s. Please start working on it.") % record.name,
+                    ))
+                if send_email and settings.reminder_assigned_technician_initial_email:
+                    emails['email_template_assigned_technician_overdue_reminder'][record.id] = technician
+            elif record.state == 'in_progress':
+                started_by_technician = self.env.user == technician
+                if settings.reminder_in_progress_notification:
+                    if started_by_technician:
+                        if supervisor_user:
+                            activities.append((
+                                record,
+                                supervisor_user,
+                                _("Service Booking %s is In Progress") % record.name,
+                                _("Technician %s has started working on Service Booking %s.") % (self.env.user.name, record.name),
+                            ))
+                    elif technician:
+                        activities.append((
+                            record,
+                            technician.user_ids,
+                            _("Service Booking %s is In Progress") % record.name,
+                            _("Service Booking %s has been marked as in progress.") % record.name,
+                        ))
+                if send_email and settings.reminder_in_progress_notification_email:
+                    if started_by_technician:
+                        if supervisor_user:
+                            emails['email_template_in_progress_supervisor_overdue_reminder'][record.id] = supervisor_user
+                    elif technician:
+                        emails['email_template_in_progress_technician_overdue_reminder'][record.id] = technician
+
+        self._create_notification_activities(activities)
+        for template_xml_id, recipients in emails.items():
+            self._queue_reminder_emails(template_xml_id, recipients)
+
+    @api.model
+    def _create_notification_activities(self, notifications, date_deadline=None):
+        """Create the to-do activities of ``(record, users, summary, note)`` tuples in one batch."""
+        if not notifications:
+            return
+        activity_type = self.env.ref('mail.mail_activity_data_todo')
+        res_model_id = self.env['ir.model']._get_id(self._name)
+        today = date_deadline or fields.Date.today()
+        self.env['mail.activity'].create([
+            {
+                'res_model_id': res_model_id,
+                'res_id': record.id,
+                'activity_type_id': activity_type.id,
+                'summary': summary,
+                'note': note,
+                'user_id': user.id,
+                'date_deadline': today,
+            }
+            for record, users, summary, note in notifications
+            for user in users
+        ])
 
     def _send_activity_notification(self, user_ids, summary, note):
         if not user_ids:
@@ -410,141 +499,7 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
         if not recipient_user or not recipient_user.partner_id.email:
             _logger.warning(f"No recipient or email address found for email reminder using template {template_xml_id}.")
             return
-
-        body = ""
-        subject = ""
-        email_from = f"<{self.env.company.email or self.env.user.email}>"
-
-        for record in self:
-            if template_xml_id == 'email_template_assigned_technician_overdue_reminder':
-                subject = f"REMINDER: Service Booking {record.name} Overdue to Start"
-                body = f"""
-                    <div style=\"margin: 0px; padding: 0px;">
-                        <p style=\"margin: 0px; padding: 0px; font-size: 13px;">
-                            Hello {recipient_user.name},
-                            <br/><br/>
-                            This is a reminder that Service Booking <strong>{record.name}</strong> was assigned to you on <strong>{record.assigned_datetime.strftime('%Y-%m-%d')}</strong> and has not been started yet.
-                            <br/><br/>
-                            <strong>Customer:</strong> {record.customer_name.name} <br/>
-                            <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                            <strong>Booking Date:</strong> {record.plan_service_date} <br/>
-                            <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                            <br/><br/>
-                            Please start working on this service booking.
-                            <br/><br/>
-                            <a href=\"/web#model=service.booking&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Booking</a>
-                            <br/><br/>
-                            Thank you,<br/>
-                            The Service Team
-                        </p>
-                    </div>
-                """
-            elif template_xml_id == 'email_template_new_booking_supervisor_reminder':
-                subject = f"New Service Booking: {record.name} needs assignment"
-                body = f"""
-                    <div style=\"margin: 0px; padding: 0px;">
-                        <p style=\"margin: 0px; padding: 0px; font-size: 13px;">
-                            Hello {recipient_user.name},
-                            <br/><br/>
-                            A new service booking, <strong>{record.name}</strong>, has been created and requires your attention for technician assignment.
-                            <br/><br/>
-                            <strong>Customer:</strong> {record.customer_name.name} <br/>
-                            <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                            <strong>Booking Date:</strong> {record.plan_service_date} <br/>
-                            <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                            <br/><br/>
-                            Please assign a technician to this booking as soon as possible.
-                            <br/><br/>
-                            <a href=\"/web#model=service.booking&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Booking</a>
-                            <br/><br/>
-                            Thank you,<br/>
-                            The Service Team
-                        </p>
-                    </div>
-                """
-            elif template_xml_id == 'email_template_assigned_supervisor_overdue_reminder':
-                subject = f"REMINDER: Service Booking {record.name} Overdue to Start (Supervisor)"
-                body = f"""
-                    <div style=\"margin: 0px; padding: 0px;">
-                        <p style=\"margin: 0px; padding: 0px; font-size: 13px;">
-                            Hello {recipient_user.name},
-                            <br/><br/>
-                            This is a reminder that Service Booking <strong>{record.name}</strong>, assigned to <strong>{record.assigned_technician_id.name}</strong> on <strong>{record.assigned_datetime.strftime('%Y-%m-%d')}</strong>, is overdue to start.
-                            <br/><br/>
-                            <strong>Customer:</strong> {record.customer_name.name} <br/>
-                            <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                            <strong>Booking Date:</strong> {record.plan_service_date} <br/>
-                            <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                            <br/><br/>
-                            Please follow up with the assigned technician.
-                            <br/><br/>
-                            <a href=\"/web#model=service.booking&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Booking</a>
-                            <br/><br/>
-                            Thank you,<br/>
-                            The Service Team
-                        </p>
-                    </div>
-                """
-            elif template_xml_id == 'email_template_in_progress_technician_overdue_reminder':
-                subject = f"REMINDER: Service Booking {record.name} Overdue to Complete"
-                body = f"""
-                    <div style=\"margin: 0px; padding: 0px;">
-                        <p style=\"margin: 0px; padding: 0px; font-size: 13px;">
-                            Hello {recipient_user.name},
-                            <br/><br/>
-                            This is a reminder that Service Booking <strong>{record.name}</strong> has been in progress since <strong>{record.in_progress_datetime.strftime('%Y-%m-%d')}</strong> and is overdue to be completed.
-                            <br/><br/>
-                            <strong>Customer:</strong> {record.customer_name.name} <br/>
-                            <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                            <strong>Booking Date:</strong> {record.plan_service_date} <br/>
-                            <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                            <br/><br/>
-                            Please complete this service booking.
-                            <br/><br/>
-                            <a href=\"/web#model=service.booking&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Booking</a>
-                            <br/><br/>
-                            Thank you,<br/>
-                            The Service Team
-                        </p>
-                    </div>
-                """
-            elif template_xml_id == 'email_template_in_progress_supervisor_overdue_reminder':
-                subject = f"REMINDER: Service Booking {record.name} Overdue to Complete (Supervisor)"
-                body = f"""
-                    <div style=\"margin: 0px; padding: 0px;">
-                        <p style=\"margin: 0px; padding: 0px; font-size: 13px;">
-                            Hello {recipient_user.name},
-                            <br/><br/>
-                            This is a reminder that Service Booking <strong>{record.name}</strong>, handled by <strong>{record.assigned_technician_id.name}</strong>, has been in progress since <strong>{record.in_progress_datetime.strftime('%Y-%m-%d')}</strong> and is overdue to be completed.
-                            <br/><br/>
-                            <strong>Customer:</strong> {record.customer_name.name} <br/>
-                            <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
-                            <strong>Booking Date:</strong> {record.plan_service_date} <br/>
-                            <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
-                            <br/><br/>
-                            Please follow up with the assigned technician.
-                            <br/><br/>
-                            <a href=\"/web#model=service.booking&amp;id={record.id}&amp;view_type=form\" style=\"background-color: #007bff; color: #ffffff; padding: 10px 20px; text-decoration: none; border-radius: 5px;\">View Service Booking</a>
-                            <br/><br/>
-                            Thank you,<br/>
-                            The Service Team
-                        </p>
-                    </div>
-                """
-            
-            mail_values = {
-                'email_from': email_from,
-                'author_id': self.env.user.partner_id.id,
-                'email_to': recipient_user.partner_id.email,
-                'subject': subject,
-                'body_html': body,
-                'auto_delete': True,
-                'state': 'outgoing',
-                'res_id': record.id,
-                'model': 'service.booking',
-            }
-            self.env['mail.mail'].sudo().create(mail_values).send()
-            _logger.info(f"Sent email reminder for booking {record.name} to {recipient_user.partner_id.email} using template {template_xml_id}.")
+        self._queue_reminder_emails(template_xml_id, dict.fromkeys(self.ids, recipient_user))
 
     def action_view_sale_order(self):
         self.ensure_one()
@@ -580,14 +535,101 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
         }
 
     def action_assign(self):
-        self.ensure_one()
         return {
             'name': _('Assign Technician'),
             'type': 'ir.actions.act_window',
             'res_model': 'service.booking.assign.technician.wizard',
             'view_mode': 'form',
             'target': 'new',
-            'context': {'default_booking_id': self.id},
+            'context': {'default_booking_ids': self.ids},
+        }
+
+    def action_auto_dispatch(self):
+        supervisor = self.env['service.supervisor.user']._get_current_supervisor()
+        report = self._auto_dispatch(supervisor=supervisor)
+        _logger.info(
+            "Dispatched %(bookings)s job order(s) to %(technicians)s technician(s) in %(seconds).2fs",
+            report,
+        )
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'success' if report['bookings'] else 'warning',
+                'title': _("Technicians Dispatched"),
+                'message': _(
+                    "%(bookings)s booked job order(s) assigned to %(technicians)s technician(s).",
+                    **report,
+                ),
+                'next': {'type': 'ir.actions.client', 'tag': 'soft_reload'},
+            },
+        }
+
+    @api.model
+    def _get_dispatch_technicians(self):
+        """Internal users of the booking service group, supervisors excepted."""
+        group = self.env.ref('infinys_service_showroom.group_infinys_booking_service')
+        supervisors = self.env['service.supervisor.user'].search([]).user_id
+        return group.users.filtered(lambda user: not user.share) - supervisors
+
+    @api.model
+    def _get_technician_workload(self, technicians):
+        """Return ``{technician_id: workload}`` for ``technicians``.
+
+        The workload is the number of assigned and in-progress job orders,
+        each weighted by the workload weight of its service type, read with
+        one grouped query.
+        """
+        workload = dict.fromkeys(technicians.ids, 0.0)
+        for technician, service_type, count in self._read_group(
+            [
+                ('assigned_technician_id', 'in', technicians.ids),
+                ('state', 'in', ('assigned', 'in_progress')),
+            ],
+            ['assigned_technician_id', 'service_type'],
+            ['__count'],
+        ):
+            workload[technician.id] += count * service_type.workload_weight
+        return workload
+
+    def _auto_dispatch(self, technicians=None, supervisor=None):
+        """Assign the booked job orders of ``self`` to the least loaded technicians.
+
+        Job orders are taken by planned date, heaviest first, and each goes to
+        the technician with the lowest weighted workload, kept in a heap. The
+        assignments are written with one ``write()`` per technician and the
+        technicians are then notified in one batch. Returns a report with the
+        number of job orders and technicians and the elapsed time.
+        """
+        started = monotonic()
+        bookings = self.filtered(lambda booking: booking.state == 'booked')
+        if technicians is None:
+            technicians = self._get_dispatch_technicians()
+        if not bookings or not technicians:
+            return {'bookings': 0, 'technicians': 0, 'seconds': monotonic() - started}
+
+        heap = [(load, technician_id) for technician_id, load in self._get_technician_workload(technicians).items()]
+        heapq.heapify(heap)
+        assignments = defaultdict(list)
+        for booking in bookings.sorted(
+            lambda booking: (booking.plan_service_date, -booking.service_type.workload_weight, booking.id)
+        ):
+            load, technician_id = heap[0]
+            assignments[technician_id].append(booking.id)
+            heapq.heapreplace(heap, (load + booking.service_type.workload_weight, technician_id))
+
+        vals = {'state': 'assigned', 'assigned_datetime': fields.Datetime.now()}
+        if supervisor:
+            vals['supervisor_user_id'] = supervisor.id
+        old_states = dict.fromkeys(bookings.ids, 'booked')
+        deferred = self.with_context(defer_state_notifications=True)
+        for technician_id, booking_ids in assignments.items():
+            deferred.browse(booking_ids).write(dict(vals, assigned_technician_id=technician_id))
+        bookings._notify_state_changes(old_states)
+        return {
+            'bookings': len(bookings),
+            'technicians': len(assignments),
+            'seconds': monotonic() - started,
         }
 
     def action_start(self):
@@ -599,95 +641,158 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
 
     def action_complete(self):
         for rec in self:
+            if rec.state != 'in_progress':
+                raise UserError(_("Service booking %s must be In Progress to be completed.") % rec.name)
             if not rec.spare_part_line_ids and not rec.service_line_ids:
                 raise ValidationError(_("Cannot complete the service booking. Please add at least one spare part or service."))
 
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        automate_delivery_order_done = ICPSudo.get_param(
-            "infinys_service_showroom.automate_delivery_order_done", default="False"
-        ).lower() == "true"
-        automate_invoice_creation = ICPSudo.get_param(
-            "infinys_service_showroom.automate_invoice_creation", default="False"
-        ).lower() == "true"
+        report = self._complete_bookings()
+        _logger.info(
+            "Completed %(bookings)s service booking(s): %(sale_orders)s sale order(s), "
+            "%(pickings)s delivery order(s), %(invoices)s invoice(s) in %(seconds).2fs",
+            report,
+        )
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'type': 'success',
+                'title': _("Job Orders Completed"),
+                'message': _(
+                    "%(bookings)s job order(s) completed in %(seconds).1fs: %(sale_orders)s sale order(s), "
+                    "%(pickings)s delivery order(s), %(invoices)s invoice(s).",
+                    **report,
+                ),
+                'next': {'type': 'ir.actions.client', 'tag': 'soft_reload'},
+            },
+        }
+
+    def _complete_bookings(self):
+        """Generate sale orders, delivery orders and invoices for the whole recordset.
 
-        for rec in self:
-            sale_order = self.env['sale.order']
-            if rec.spare_part_line_ids or rec.service_line_ids:
-                sale_order = self.env['sale.order'].create({
-                    'partner_id': rec.customer_name.id,
-                    'origin': rec.name,
+        Returns a report with the number of documents created and the elapsed time.
+        """
+        started = monotonic()
+        settings = self.env["res.config.settings"]._get_showroom_settings()
+
+        sale_orders = self.env['sale.order'].create([
+            {
+                'partner_id': rec.customer_name.id,
+                'origin': rec.name,
+            }
+            for rec in self
+        ])
+        # Links to the generated documents, written with one write per job
+        # order once everything is created.
+        document_vals = {
+            rec.id: {'sale_order_id': sale_order.id}
+            for rec, sale_order in zip(self, sale_orders)
+        }
+        order_line_vals = []
+        for rec, sale_order in zip(self, sale_orders):
+            if rec.spare_part_line_ids:
+                order_line_vals.append({
+                    'order_id': sale_order.id,
+                    'name': 'Spare Parts',
+                    'display_type': 'line_section',
                 })
-                if rec.spare_part_line_ids:
-                    self.env['sale.order.line'].create({
-                        'order_id': sale_order.id,
-                        'name': 'Spare Parts',
-                        'display_type': 'line_section',
-                    })
-                for part in rec.spare_part_line_ids:
-                    self.env['sale.order.line'].create({
-                        'order_id': sale_order.id,
+            for part in rec.spare_part_line_ids:
+                order_line_vals.append({
+                    'order_id': sale_order.id,
+                    'product_id': part.product_id.id,
+                    'product_uom_qty': part.qty,
+                    'price_unit': part.unit_price,
+                })
+            if rec.service_line_ids:
+                order_line_vals.append({
+                    'order_id': sale_order.id,
+                    'name': 'Services',
+                    'display_type': 'line_section',
+                })
+            for service in rec.service_line_ids:
+                order_line_vals.append({
+                    'order_id': sale_order.id,
+                    'product_id': service.product_id.id,
+                    'product_uom_qty': service.qty,
+                    'price_unit': service.unit_price,
+                })
+        self.env['sale.order.line'].create(order_line_vals)
+
+        invoices = self.env['account.move']
+        if settings.automate_invoice_creation and sale_orders:
+            sale_orders.action_confirm()
+            invoices = sale_orders._create_invoices(grouped=True)
+            for rec, sale_order in zip(self, sale_orders):
+                document_vals[rec.id]['invoice_id'] = sale_order.invoice_ids[:1].id
+
+        picking_types = {}
+        picking_vals = []
+        picking_bookings = self.browse()
+        for rec in self.filtered('spare_part_line_ids'):
+            company = rec.company_id
+            if company not in picking_types:
+                picking_types[company] = rec._get_delivery_picking_type()
+            picking_type = picking_types[company]
+            if not picking_type:
+                continue
+            location_id = picking_type.default_location_src_id.id
+            location_dest_id = rec.customer_name.property_stock_customer.id
+            picking_vals.append({
+                'partner_id': rec.customer_name.id,
+                'picking_type_id': picking_type.id,
+                'location_id': location_id,
+                'location_dest_id': location_dest_id,
+                'origin': rec.name,
+                'move_ids': [
+                    Command.create({
+                        'name': part.product_id.name,
                         'product_id': part.product_id.id,
                         'product_uom_qty': part.qty,
-                        'price_unit': part.unit_price,
-                    })
-                if rec.service_line_ids:
-                    self.env['sale.order.line'].create({
-                        'order_id': sale_order.id,
-                        'name': 'Services',
-                        'display_type': 'line_section',
-                    })
-                for service in rec.service_line_ids:
-                    self.env['sale.order.line'].create({
-                        'order_id': sale_order.id,
-                        'product_id': service.product_id.id,
-                        'product_uom_qty': service.qty,
-                        'price_unit': service.unit_price,
+                        'product_uom': part.product_id.uom_id.id,
+                        'location_id': location_id,
+                        'location_dest_id': location_dest_id,
                     })
-                rec.sale_order_id = sale_order.id
+                    for part in rec.spare_part_line_ids
+                ],
+            })
+            picking_bookings |= rec
+        pickings = self.env['stock.picking'].create(picking_vals)
+        if pickings:
+            pickings.action_confirm()
+            pickings.action_assign()
+            if settings.automate_delivery_order_done:
+                pickings.button_validate()
+            for rec, picking in zip(picking_bookings, pickings):
+                document_vals[rec.id]['stock_picking_id'] = picking.id
 
-                if automate_invoice_creation:
-                    if sale_order:
-                        sale_order.action_confirm()
-                        invoices = sale_order._create_invoices()
-                        if invoices:
-                            rec.invoice_id = invoices[0].id
+        for rec in self:
+            rec.write(document_vals[rec.id])
+        self.write({
+            'state': 'completed',
+            'completed_datetime': fields.Datetime.now(),
+        })
+        self.activity_ids.action_feedback()
 
-            if rec.spare_part_line_ids:
-                default_warehouse = self.env['stock.warehouse'].search([('company_id', '=', self.env.user.company_id.id)], limit=1)
-                picking_type = default_warehouse.out_type_id if default_warehouse else self.env['stock.picking.type'].search([('code', '=', 'outgoing')], limit=1)
-                if not picking_type:
-                    picking_type = self.env['stock.picking.type'].search([('code', '=', 'outgoing')], limit=1)
-
-                if picking_type:
-                    stock_picking = self.env['stock.picking'].create({
-                        'partner_id': rec.customer_name.id,
-                        'picking_type_id': picking_type.id,
-                        'location_id': picking_type.default_location_src_id.id,
-                        'location_dest_id': rec.customer_name.property_stock_customer.id,
-                        'origin': rec.name,
-                    })
-                    for part in rec.spare_part_line_ids:
-                        self.env['stock.move'].create({
-                            'name': part.product_id.name,
-                            'product_id': part.product_id.id,
-                            'product_uom_qty': part.qty,
-                            'product_uom': part.product_id.uom_id.id,
-                            'picking_id': stock_picking.id,
-                            'location_id': picking_type.default_location_src_id.id,
-                            'location_dest_id': rec.customer_name.property_stock_customer.id,
-                        })
-                    stock_picking.action_confirm()
-                    stock_picking.action_assign()
-                    if automate_delivery_order_done:
-                        stock_picking.button_validate()
-                    rec.stock_picking_id = stock_picking.id
+        return {
+            'bookings': len(self),
+            'sale_orders': len(sale_orders),
+            'pickings': len(pickings),
+            'invoices': len(invoices),
+            'seconds': monotonic() - started,
+        }
 
-            rec.write({
-                'state': 'completed',
-                'completed_datetime': fields.Datetime.now(),
-            })
-            for activity in rec.activity_ids:
-                activity.action_feedback()
+    def _get_delivery_picking_type(self):
+        """Outgoing picking type of the job order's company.
+
+        :meth:`_complete_bookings` looks it up once per company and reuses
+        it for every job order of that company.
+        """
+        self.ensure_one()
+        default_warehouse = self.env['stock.warehouse'].search([('company_id', '=', self.company_id.id)], limit=1)
+        picking_type = default_warehouse.out_type_id
+        if not picking_type:
+            picking_type = self.env['stock.picking.type'].search([('code', '=', 'outgoing')], limit=1)
+        return picking_type
 
     def action_cancel(self):
         self.ensure_one()
@@ -708,144 +813,166 @@ class ServiceBooking(models.Model, MailActivityMixin, MailThread, PortalMixin):
 
     @api.model
     def _check_and_send_daily_reminders(self):
-        ICPSudo = self.env["ir.config_parameter"].sudo()
-        enable_service_booking_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_reminders", "False"
-        ).lower() == "true"
+        settings = self.env["res.config.settings"]._get_showroom_settings()
 
-        if not enable_service_booking_reminders:
+        if not settings.enable_service_booking_reminders:
             _logger.info("Service Booking Reminders are disabled.")
             return
 
-        reminder_interval_days_assigned = int(ICPSudo.get_param(
-            "infinys_service_showroom.reminder_interval_days_assigned", default="1"
-        ))
-        reminder_interval_days_in_progress = int(ICPSudo.get_param(
-            "infinys_service_showroom.reminder_interval_days_in_progress", default="1"
-        ))
-        reminder_interval_days_assigned_email = int(ICPSudo.get_param(
-            "infinys_service_showroom.reminder_interval_days_assigned_email", default="1"
-        ))
-        reminder_interval_days_in_progress_email = int(ICPSudo.get_param(
-            "infinys_service_showroom.reminder_interval_days_in_progress_email", default="1"
-        ))
-        
-        enable_service_booking_email_reminders = ICPSudo.get_param(
-            "infinys_service_showroom.enable_service_booking_email_reminders", "False"
-        ).lower() == "true"
-        
         today = fields.Date.today()
+        email_enabled = settings.enable_service_booking_email_reminders
+
+        self._remind_unassigned_bookings(today)
+        self._remind_overdue_bookings(
+            today,
+            state='assigned',
+            since_field='assigned_datetime',
+            until_field='in_progress_datetime',
+            stamp_field='last_reminder_date_assigned',
+            activity_interval=settings.reminder_interval_days_assigned,
+            email_interval=settings.reminder_interval_days_assigned_email if email_enabled else None,
+        )
+        self._remind_overdue_bookings(
+            today,
+            state='in_progress',
+            since_field='in_progress_datetime',
+            until_field='completed_datetime',
+            stamp_field='last_reminder_date_in_progress',
+            activity_interval=settings.reminder_interval_days_in_progress,
+            email_interval=settings.reminder_interval_days_in_progress_email if email_enabled else None,
+        )
+        return True
+
+    @api.model
+    def _commit_reminder_batch(self):
+        if not getattr(threading.current_thread(), 'testing', False):
+            self.env.cr.commit()
 
-        bookings_to_assign = self.search([
+    @api.model
+    def _remind_unassigned_bookings(self, today):
+        bookings = self.search([
             ('state', '=', 'booked'),
             ('assigned_technician_id', '=', False),
+            ('supervisor_user_id.user_id', '!=', False),
         ])
-        for booking in bookings_to_assign:
-            if booking.supervisor_user_id and booking.supervisor_user_id.user_id:
-                last_activity = self.env['mail.activity'].search([
-                    ('res_id', '=', booking.id),
-                    ('res_model_id', '=', self.env.ref('infinys_service_showroom.model_service_booking').id),
-                    ('user_id', '=', booking.supervisor_user_id.user_id.id),
-                    ('summary', 'ilike', 'New Service Booking%needs assignment'),
-                    ('date_deadline', '=', today),
-                ], limit=1)
-                if not last_activity:
-                    booking._send_activity_notification(
-                        booking.supervisor_user_id.user_id,
-                        _("REMINDER: Service Booking %s needs assignment") % booking.name,
-                        _("Service Booking %s is still awaiting technician assignment. Please assign a technician.") % booking.name
-                    )
-
-        overdue_assigned_bookings = self.search([
-            ('state', '=', 'assigned'),
-            ('assigned_datetime', '!=', False),
-            ('in_progress_datetime', '=', False),
-        ])
-        for booking in overdue_assigned_bookings:
-            activity_reminder_sent = False
-            email_reminder_sent = False
-
-            if enable_service_booking_reminders and \
-                booking.assigned_datetime.date() <= today - timedelta(days=reminder_interval_days_assigned) and \
-                booking.last_reminder_date_assigned != today:
-                if booking.assigned_technician_id:
-                    booking._send_activity_notification(
-                        booking.assigned_technician_id,
-                        _("REMINDER: Service Booking %s Overdue to Start") % booking.name,
-                        _("Service Booking %s was assigned on %s and has not been started yet.") % (booking.name, booking.assigned_datetime.strftime('%Y-%m-%d'))
-                    )
-                    activity_reminder_sent = True
-                if booking.supervisor_user_id and booking.supervisor_user_id.user_id:
-                    booking._send_activity_notification(
-                        booking.supervisor_user_id.user_id,
-                        _("REMINDER: Service Booking %s Overdue to Start (Supervisor)") % booking.name,
-                        _("Service Booking %s assigned to %s on %s is overdue to start.") % (booking.name, booking.assigned_technician_id.name, booking.assigned_datetime.strftime('%Y-%m-%d'))
-                    )
-                    activity_reminder_sent = True
-            
-            if enable_service_booking_email_reminders and \
-                booking.assigned_datetime.date() <= today - timedelta(days=reminder_interval_days_assigned_email) and \
-                booking.last_reminder_date_assigned != today:
-                if booking.assigned_technician_id:
-                    booking._send_reminder_email(
-                        'email_template_assigned_technician_overdue_reminder',
-                        booking.assigned_technician_id
-                    )
-                    email_reminder_sent = True
-                if booking.supervisor_user_id and booking.supervisor_user_id.user_id:
-                    booking._send_reminder_email(
-                        'email_template_assigned_supervisor_overdue_reminder',
-                        booking.supervisor_user_id.user_id
-                    )
-                    email_reminder_sent = True
-
-            if activity_reminder_sent or email_reminder_sent:
-                booking.last_reminder_date_assigned = today
-
-        overdue_in_progress_bookings = self.search([
-            ('state', '=', 'in_progress'),
-            ('in_progress_datetime', '!=', False),
-            ('completed_datetime', '=', False),
-        ])
-        for booking in overdue_in_progress_bookings:
-            activity_reminder_sent = False
-            email_reminder_sent = False
-
-            if enable_service_booking_reminders and \
-                booking.in_progress_datetime.date() <= today - timedelta(days=reminder_interval_days_in_progress) and \
-                booking.last_reminder_date_in_progress != today:
-                if booking.assigned_technician_id:
-                    booking._send_activity_notification(
-                        booking.assigned_technician_id,
-                        _("REMINDER: Service Booking %s Overdue to Complete") % booking.name,
-                        _("Service Booking %s has been in progress since %s and is overdue to be completed.") % (booking.name, booking.in_progress_datetime.strftime('%Y-%m-%d'))
-                    )
-                    activity_reminder_sent = True
-                if booking.supervisor_user_id and booking.supervisor_user_id.user_id:
-                    booking._send_activity_notification(
-                        booking.supervisor_user_id.user_id,
-                        _("REMINDER: Service Booking %s Overdue to Complete (Supervisor)") % booking.name,
-                        _("Service Booking %s handled by %s has been in progress since %s and is overdue to be completed.") % (booking.name, booking.assigned_technician_id.name, booking.in_progress_datetime.strftime('%Y-%m-%d'))
-                    )
-                    activity_reminder_sent = True
-            
-            if enable_service_booking_email_reminders and \
-                booking.in_progress_datetime.date() <= today - timedelta(days=reminder_interval_days_in_progress_email) and \
-                booking.last_reminder_date_in_progress != today:
-                if booking.assigned_technician_id:
-                    booking._send_reminder_email(
-                        'email_template_in_progress_technician_overdue_reminder',
-                        booking.assigned_technician_id
-                    )
-                    email_reminder_sent = True
-                if booking.supervisor_user_id and booking.supervisor_user_id.user_id:
-                    booking._send_reminder_email(
-                        'email_template_in_progress_supervisor_overdue_reminder',
-                        booking.supervisor_user_id.user_id
-                    )
-                    email_reminder_sent = True
-
-            if activity_reminder_sent or email_reminder_sent:
-                booking.last_reminder_date_in_progress = today
-
-        return True
\ No newline at end of file
+        if not bookings:
+            return
+        # Matches both the creation activity and the daily reminder, so a run
+        # restarted on the same day does not remind twice.
+        already_reminded = set(self.env['mail.activity']._read_group(
+            [
+                ('res_model', '=', self._name),
+                ('res_id', 'in', bookings.ids),
+                ('summary', 'ilike', '%Service Booking%needs assignment'),
+                ('date_deadline', '=', today),
+            ],
+            ['res_id', 'user_id'],
+        ))
+        for batch_ids in split_every(self._REMINDER_BATCH_SIZE, bookings.ids):
+            notifications = []
+            for booking in self.browse(batch_ids):
+                supervisor_user = booking.supervisor_user_id.user_id
+                if (booking.id, supervisor_user) in already_reminded:
+                    continue
+                notifications.append((
+                    booking,
+                    supervisor_user,
+                    _("REMINDER: Service Booking %s needs assignment") % booking.name,
+                    _("Service Booking %s is still awaiting technician assignment. Please assign a technician.") % booking.name,
+                ))
+            self._create_notification_activities(notifications, date_deadline=today)
+            self._commit_reminder_batch()
+
+    @api.model
+    def _remind_overdue_bookings(self, today, state, since_field, until_field, stamp_field, activity_interval, email_interval=None):
+        def overdue_ids(interval_days):
+            # ``since_field.date() <= today - interval_days``, expressed on the datetime column.
+            cutoff = datetime.combine(today - timedelta(days=interval_days - 1), time.min)
+            return set(self.search([
+                ('state', '=', state),
+                (since_field, '<', cutoff),
+                (until_field, '=', False),
+                '|',
+                (stamp_field, '=', False),
+                (stamp_field, '<', today),
+            ]).ids)
+
+        activity_ids = overdue_ids(activity_interval)
+        email_ids = overdue_ids(email_interval) if email_interval is not None else set()
+
+        for batch_ids in split_every(self._REMINDER_BATCH_SIZE, sorted(activity_ids | email_ids)):
+            batch = self.browse(batch_ids)
+            reminded = self.browse()
+            for booking in batch:
+                if booking._send_overdue_reminder(booking.id in activity_ids, booking.id in email_ids):
+                    reminded |= booking
+            reminded.filtered(lambda b: b.id in email_ids)._queue_overdue_reminder_emails()
+            if reminded:
+                reminded.write({stamp_field: today})
+            self._commit_reminder_batch()
+
+    def _send_overdue_reminder(self, send_activity, send_email):
+        """Schedule the overdue activities of a booking stuck in its state.
+
+        Emails are queued for the whole batch by ``_queue_overdue_reminder_emails``.
+        Returns whether any reminder is due.
+        """
+        self.ensure_one()
+        technician = self.assigned_technician_id
+        supervisor_user = self.supervisor_user_id.user_id
+        if not technician and not supervisor_user:
+            return False
+
+        if self.state == 'assigned':
+            since = self.assigned_datetime.strftime('%Y-%m-%d')
+            if send_activity and technician:
+                self._send_activity_notification(
+                    technician,
+                    _("REMINDER: Service Booking %s Overdue to Start") % self.name,
+                    _("Service Booking %s was assigned on %s and has not been started yet.") % (self.name, since)
+                )
+            if send_activity and supervisor_user:
+                self._send_activity_notification(
+                    supervisor_user,
+                    _("REMINDER: Service Booking %s Overdue to Start (Supervisor)") % self.name,
+                    _("Service Booking %s assigned to %s on %s is overdue to start.") % (self.name, technician.name, since)
+                )
+        else:
+            since = self.in_progress_datetime.strftime('%Y-%m-%d')
+            if send_activity and technician:
+                self._send_activity_notification(
+                    technician,
+                    _("REMINDER: Service Booking %s Overdue to Complete") % self.name,
+                    _("Service Booking %s has been in progress since %s and is overdue to be completed.") % (self.name, since)
+                )
+            if send_activity and supervisor_user:
+                self._send_activity_notification(
+                    supervisor_user,
+                    _("REMINDER: Service Booking %s Overdue to Complete (Supervisor)") % self.name,
+                    _("Service Booking %s handled by %s has been in progress since %s and is overdue to be completed.") % (self.name, technician.name, since)
+                )
+        return send_activity or send_email
+
+    def _queue_overdue_reminder_emails(self):
+        templates = {
+            'assigned': (
+                'email_template_assigned_technician_overdue_reminder',
+                'email_template_assigned_supervisor_overdue_reminder',
+            ),
+            'in_progress': (
+                'email_template_in_progress_technician_overdue_reminder',
+                'email_template_in_progress_supervisor_overdue_reminder',
+            ),
+        }
+        for state, (technician_template, supervisor_template) in templates.items():
+            bookings = self.filtered(lambda b: b.state == state)
+            if not bookings:
+                continue
+            bookings._queue_reminder_emails(technician_template, {
+                booking.id: booking.assigned_technician_id
+                for booking in bookings if booking.assigned_technician_id
+            })
+            bookings._queue_reminder_emails(supervisor_template, {
+                booking.id: booking.supervisor_user_id.user_id
+                for booking in bookings if booking.supervisor_user_id.user_id
+            })
@@ -0,0 +1,208 @@
+import logging
+from datetime import timedelta
+from time import monotonic
+
+from odoo import api, fields, models, tools
+
+_logger = logging.getLogger(__name__)
+
+
+class ServiceBookingReport(models.Model):
+    """One row of KPIs per job order, kept in a real table.
+
+    The rows are (re)computed by :meth:`_refresh_report` for the job orders
+    changed since the previous run, so the reporting views never join the
+    job orders with their lines at read time.
+    """
+
+    _name = "service.booking.report"
+    _description = "Job Order Analysis"
+    _log_access = False
+    _rec_name = "name"
+    _order = "plan_service_date desc, id desc"
+
+    # Rows written by a transaction still open when the previous refresh ran
+    # carry an older write_date; re-reading a short overlap picks them up.
+    _REFRESH_OVERLAP = timedelta(minutes=10)
+
+    booking_id = fields.Many2one(
+        "service.booking", string="Job Order", required=True, readonly=True, ondelete="cascade"
+    )
+    name = fields.Char(string="Job Order Number", readonly=True)
+    state = fields.Selection(
+        [
+            ("booked", "Booked"),
+            ("assigned", "Assigned"),
+            ("in_progress", "In Progress"),
+            ("completed", "Completed"),
+            ("cancelled", "Cancelled"),
+        ],
+        string="Status",
+        readonly=True,
+        index=True,
+    )
+    service_type_id = fields.Many2one("service.type", string="Service Type", readonly=True, index=True)
+    technician_id = fields.Many2one("res.users", string="Technician", readonly=True, index=True)
+    customer_id = fields.Many2one("res.partner", string="Customer", readonly=True)
+    vehicle_brand_id = fields.Many2one("service.vehicle.brand", string="Vehicle Brand", readonly=True)
+    appointment_id = fields.Many2one("service.appointment", string="Appointment", readonly=True)
+
+    booked_datetime = fields.Datetime(string="Booked On", readonly=True)
+    plan_service_date = fields.Date(string="Booking Date", readonly=True, index=True)
+    completed_date = fields.Date(string="Completed On", readonly=True, index=True)
+
+    hours_appointment_to_booked = fields.Float(
+        string="Appointment to Booked (h)", readonly=True, aggregator="avg"
+    )
+    hours_booked_to_assigned = fields.Float(
+        string="Booked to Assigned (h)", readonly=True, aggregator="avg"
+    )
+    hours_assigned_to_in_progress = fields.Float(
+        string="Assigned to In Progress (h)", readonly=True, aggregator="avg"
+    )
+    hours_in_progress_to_completed = fields.Float(
+        string="In Progress to Completed (h)", readonly=True, aggregator="avg"
+    )
+    hours_turnaround = fields.Float(
+        string="Turnaround (h)", readonly=True, aggregator="avg",
+        help="From booking to completion.",
+    )
+
+    parts_amount = fields.Float(string="Parts Revenue", readonly=True)
+    service_amount = fields.Float(string="Service Revenue", readonly=True)
+    total_amount = fields.Float(string="Revenue", readonly=True)
+    parts_qty = fields.Float(string="Parts Quantity", readonly=True)
+    parts_line_count = fields.Integer(string="# Part Lines", readonly=True)
+    service_line_count = fields.Integer(string="# Service Lines", readonly=True)
+    booking_count = fields.Integer(string="# Job Orders", readonly=True)
+    refreshed_at = fields.Datetime(string="Refreshed On", readonly=True, index=True)
+
+    _sql_constraints = [
+        ("booking_uniq", "unique (booking_id)", "A job order is reported once."),
+    ]
+
+    def init(self):
+        cr = self.env.cr
+        # The incremental refresh scans the sources on write_date.
+        tools.create_index(cr, "service_booking_write_date_idx", "service_booking", ["write_date"])
+        tools.create_index(
+            cr, "service_parts_used_line_write_date_idx", "service_parts_used_line", ["write_date"]
+        )
+        tools.create_index(cr, "service_used_line_write_date_idx", "service_used_line", ["write_date"])
+        tools.create_index(
+            cr,
+            "service_booking_report_completed_technician_idx",
+            self._table,
+            ["completed_date", "technician_id"],
+        )
+
+    @api.model
+    def _refresh_report(self, full=False):
+        """Recompute the rows of the job orders changed since the last refresh.
+
+        A job order counts as changed when it or one of its part or service
+        lines was written. Rows of deleted job orders go with them through
+        the foreign key. The first run, on an empty table, is a full build.
+        Returns the number of rows written.
+        """
+        started = monotonic()
+        self.env.flush_all()
+        self.env.cr.execute(f"SELECT MAX(refreshed_at) FROM {self._table}")
+        refreshed_at = self.env.cr.fetchone()[0]
+        full = full or not refreshed_at
+        since = None if full else refreshed_at - self._REFRESH_OVERLAP
+
+        self.env.cr.execute(
+            f"""
+            WITH changed AS (
+                SELECT id FROM service_booking
+                 WHERE %(full)s OR write_date >= %(since)s
+                 UNION
+                SELECT service_booking_id FROM service_parts_used_line
+                 WHERE NOT %(full)s AND write_date >= %(since)s
+                 UNION
+                SELECT service_booking_id FROM service_used_line
+                 WHERE NOT %(full)s AND write_date >= %(since)s
+            ),
+            parts AS (
+                SELECT service_booking_id, SUM(qty) AS qty, COUNT(*) AS lines
+                  FROM service_parts_used_line
+                 WHERE service_booking_id IN (SELECT id FROM changed)
+              GROUP BY service_booking_id
+            ),
+            services AS (
+                SELECT service_booking_id, COUNT(*) AS lines
+                  FROM service_used_line
+                 WHERE service_booking_id IN (SELECT id FROM changed)
+              GROUP BY service_booking_id
+            )
+            INSERT INTO {self._table} (
+                booking_id, name, state, service_type_id, technician_id, customer_id,
+                vehicle_brand_id, appointment_id, booked_datetime, plan_service_date,
+                completed_date, hours_appointment_to_booked, hours_booked_to_assigned,
+                hours_assigned_to_in_progress, hours_in_progress_to_completed,
+                hours_turnaround, parts_amount, service_amount, total_amount, parts_qty,
+                parts_line_count, service_line_count, booking_count, refreshed_at
+            )
+            SELECT b.id,
+                   b.name,
+                   b.state,
+                   b.service_type,
+                   b.assigned_technician_id,
+                   b.customer_name,
+                   b.vehicle_brand,
+                   b.appointment_id,
+                   b.create_date,
+                   b.plan_service_date,
+                   b.completed_datetime::date,
+                   EXTRACT(EPOCH FROM b.create_date - a.create_date) / 3600,
+                   EXTRACT(EPOCH FROM b.assigned_datetime - b.create_date) / 3600,
+                   EXTRACT(EPOCH FROM b.in_progress_datetime - b.assigned_datetime) / 3600,
+                   EXTRACT(EPOCH FROM b.completed_datetime - b.in_progress_datetime) / 3600,
+                   EXTRACT(EPOCH FROM b.completed_datetime - b.create_date) / 3600,
+                   COALESCE(b.total_sparepart, 0),
+                   COALESCE(b.total_service_fee, 0),
+                   COALESCE(b.total_amount, 0),
+                   COALESCE(p.qty, 0),
+                   COALESCE(p.lines, 0),
+                   COALESCE(s.lines, 0),
+                   1,
+                   now() AT TIME ZONE 'UTC'
+              FROM service_booking b
+              JOIN changed c ON c.id = b.id
+         LEFT JOIN service_appointment a ON a.id = b.appointment_id
+         LEFT JOIN parts p ON p.service_booking_id = b.id
+         LEFT JOIN services s ON s.service_booking_id = b.id
+            ON CONFLICT (booking_id) DO UPDATE SET
+                   name = EXCLUDED.name,
+                   state = EXCLUDED.state,
+                   service_type_id = EXCLUDED.service_type_id,
+                   technician_id = EXCLUDED.technician_id,
+                   customer_id = EXCLUDED.customer_id,
+                   vehicle_brand_id = EXCLUDED.vehicle_brand_id,
+                   appointment_id = EXCLUDED.appointment_id,
+                   booked_datetime = EXCLUDED.booked_datetime,
+                   plan_service_date = EXCLUDED.plan_service_date,
+                   completed_date = EXCLUDED.completed_date,
+                   hours_appointment_to_booked = EXCLUDED.hours_appointment_to_booked,
+                   hours_booked_to_assigned = EXCLUDED.hours_booked_to_assigned,
+                   hours_assigned_to_in_progress = EXCLUDED.hours_assigned_to_in_progress,
+                   hours_in_progress_to_completed = EXCLUDED.hours_in_progress_to_completed,
+                   hours_turnaround = EXCLUDED.hours_turnaround,
+                   parts_amount = EXCLUDED.parts_amount,
+                   service_amount = EXCLUDED.service_amount,
+                   total_amount = EXCLUDED.total_amount,
+                   parts_qty = EXCLUDED.parts_qty,
+                   parts_line_count = EXCLUDED.parts_line_count,
+                   service_line_count = EXCLUDED.service_line_count,
+                   refreshed_at = EXCLUDED.refreshed_at
+            """,
+            {"full": full, "since": since},
+        )
+        written = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info(
+            f"Job order analysis: {written} rows refreshed "
+            f"({'full' if full else 'incremental'}) in {monotonic() - started:.2f}s"
+        )
+        return written
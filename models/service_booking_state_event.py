@@ -0,0 +1,207 @@
+from odoo import _, api, fields, models, tools
+from odoo.exceptions import UserError
+
+BOOKING_STATES = [
+    ("booked", "Booked"),
+    ("assigned", "Assigned"),
+    ("in_progress", "In Progress"),
+    ("completed", "Completed"),
+    ("cancelled", "Cancelled"),
+]
+
+
+class ServiceBookingStateEvent(models.Model):
+    """Append-only log of the state changes of job orders."""
+
+    _name = "service.booking.state.event"
+    _description = "Job Order State Change"
+    _order = "id desc"
+    _rec_name = "booking_id"
+
+    booking_id = fields.Many2one(
+        "service.booking", string="Job Order", required=True, readonly=True, ondelete="cascade"
+    )
+    from_state = fields.Selection(BOOKING_STATES, string="From", readonly=True)
+    to_state = fields.Selection(BOOKING_STATES, string="To", required=True, readonly=True)
+    user_id = fields.Many2one("res.users", string="Changed By", readonly=True)
+    technician_id = fields.Many2one("res.users", string="Technician", readonly=True)
+    service_type_id = fields.Many2one("service.type", string="Service Type", readonly=True)
+    entered_at = fields.Datetime(
+        string="Previous State Since",
+        readonly=True,
+        help="When the job order entered the previous state; empty when unknown.",
+    )
+    elapsed_seconds = fields.Float(
+        string="Seconds in Previous State",
+        compute="_compute_elapsed_seconds",
+        help="Time spent in the previous state, since the job order entered it.",
+    )
+
+    # Job orders logged before their first event: the previous state is
+    # dated from the timestamp the job order keeps for it.
+    _STATE_SINCE_FIELDS = {
+        "booked": "create_date",
+        "assigned": "assigned_datetime",
+        "in_progress": "in_progress_datetime",
+        "completed": "completed_datetime",
+    }
+
+    def init(self):
+        cr = self.env.cr
+        tools.create_index(
+            cr, "service_booking_state_event_booking_idx", self._table, ["booking_id", "id"]
+        )
+        tools.create_index(
+            cr,
+            "service_booking_state_event_stage_technician_idx",
+            self._table,
+            ["from_state", "technician_id"],
+        )
+        tools.create_index(
+            cr,
+            "service_booking_state_event_stage_service_type_idx",
+            self._table,
+            ["from_state", "service_type_id"],
+        )
+
+    @api.depends("create_date", "entered_at")
+    def _compute_elapsed_seconds(self):
+        for event in self:
+            event.elapsed_seconds = (
+                (event.create_date - event.entered_at).total_seconds()
+                if event.create_date and event.entered_at
+                else 0.0
+            )
+
+    def write(self, vals):
+        raise UserError(_("Job order state changes cannot be modified."))
+
+    def unlink(self):
+        raise UserError(_("Job order state changes cannot be deleted."))
+
+    @api.model
+    def _snapshot(self, bookings):
+        """Return what :meth:`_log_transitions` needs to know of ``bookings`` before a change."""
+        return {
+            booking.id: {
+                "state": booking.state,
+                "technician_id": booking.assigned_technician_id.id,
+                "service_type_id": booking.service_type.id,
+                "since": booking[self._STATE_SINCE_FIELDS[booking.state]]
+                if booking.state in self._STATE_SINCE_FIELDS
+                else False,
+            }
+            for booking in bookings
+        }
+
+    @api.model
+    def _log_transitions(self, bookings, previous):
+        """Record one event per booking whose state differs from ``previous``.
+
+        ``previous`` is the :meth:`_snapshot` of the bookings before the
+        change; a booking missing from it has just been created. The
+        technician and service type of an event are those of the previous
+        state, which is the one the time is spent in. The time each booking
+        entered that state is read with one query and all events are
+        inserted in one batch.
+        """
+        changed = bookings.filtered(lambda b: b.state != previous.get(b.id, {}).get("state"))
+        if not changed:
+            return self.browse()
+        self.flush_model(["booking_id"])
+        self.env.cr.execute(
+            f"""
+            SELECT DISTINCT ON (booking_id) booking_id, create_date
+              FROM {self._table}
+             WHERE booking_id IN %s
+          ORDER BY booking_id, id DESC
+            """,
+            [tuple(changed.ids)],
+        )
+        entered_at = dict(self.env.cr.fetchall())
+        vals_list = []
+        for booking in changed:
+            before = previous.get(booking.id)
+            if before:
+                vals_list.append({
+                    "booking_id": booking.id,
+                    "from_state": before["state"],
+                    "to_state": booking.state,
+                    "user_id": self.env.uid,
+                    "technician_id": before["technician_id"],
+                    "service_type_id": before["service_type_id"],
+                    "entered_at": entered_at.get(booking.id) or before["since"],
+                })
+            else:
+                vals_list.append({
+                    "booking_id": booking.id,
+                    "to_state": booking.state,
+                    "user_id": self.env.uid,
+                    "technician_id": booking.assigned_technician_id.id,
+                    "service_type_id": booking.service_type.id,
+                })
+        return self.sudo().create(vals_list)
+
+
+class ServiceBookingStageDuration(models.Model):
+    """Median and 95th percentile time spent in each job order state.
+
+    Every stage is reported overall, per technician and per service type;
+    ``dimension`` tells which breakdown a row belongs to.
+    """
+
+    _name = "service.booking.stage.duration"
+    _description = "Job Order Stage Duration"
+    _auto = False
+    _order = "dimension, stage"
+
+    dimension = fields.Selection(
+        [
+            ("stage", "Overall"),
+            ("technician", "Per Technician"),
+            ("service_type", "Per Service Type"),
+        ],
+        string="Breakdown",
+        readonly=True,
+    )
+    stage = fields.Selection(BOOKING_STATES, string="Stage", readonly=True)
+    technician_id = fields.Many2one("res.users", string="Technician", readonly=True)
+    service_type_id = fields.Many2one("service.type", string="Service Type", readonly=True)
+    event_count = fields.Integer(string="# Transitions", readonly=True)
+    avg_hours = fields.Float(string="Average (h)", readonly=True)
+    median_hours = fields.Float(string="Median (h)", readonly=True)
+    p95_hours = fields.Float(string="95th Percentile (h)", readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            f"""
+            CREATE OR REPLACE VIEW {self._table} AS (
+                SELECT row_number() OVER (ORDER BY from_state, technician_id, service_type_id) AS id,
+                       CASE
+                           WHEN GROUPING(technician_id) = 0 THEN 'technician'
+                           WHEN GROUPING(service_type_id) = 0 THEN 'service_type'
+                           ELSE 'stage'
+                       END AS dimension,
+                       from_state AS stage,
+                       technician_id,
+                       service_type_id,
+                       COUNT(*) AS event_count,
+                       AVG(elapsed_seconds) / 3600 AS avg_hours,
+                       percentile_cont(0.5) WITHIN GROUP (ORDER BY elapsed_seconds) / 3600 AS median_hours,
+                       percentile_cont(0.95) WITHIN GROUP (ORDER BY elapsed_seconds) / 3600 AS p95_hours
+                  FROM (
+                        SELECT from_state, technician_id, service_type_id,
+                               EXTRACT(EPOCH FROM create_date - entered_at) AS elapsed_seconds
+                          FROM service_booking_state_event
+                         WHERE from_state IS NOT NULL
+                           AND entered_at IS NOT NULL
+                       ) event
+              GROUP BY GROUPING SETS (
+                           (from_state),
+                           (from_state, technician_id),
+                           (from_state, service_type_id)
+                       )
+            )
+            """
+        )
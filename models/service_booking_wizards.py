@@ -9,11 +9,10 @@ class ServiceBookingAssignTechnicianWizard(models.TransientModel):
     _name = 'service.booking.assign.technician.wizard'
     _description = 'Assign Technician Wizard'
 
-    booking_id = fields.Many2one(
+    booking_ids = fields.Many2many(
         'service.booking',
-        string='Service Booking',
+        string='Service Bookings',
         required=True,
-        ondelete='cascade',
     )
     technician_id = fields.Many2one(
         'res.users',
@@ -22,6 +21,17 @@ class ServiceBookingAssignTechnicianWizard(models.TransientModel):
         domain=[('share', '=', False)],
         help="Select the technician for this service booking."
     )
+    technician_workload = fields.Float(
+        string='Current Workload',
+        compute='_compute_technician_workload',
+        help="Assigned and in-progress job orders of the technician, weighted by service type."
+    )
+
+    @api.depends('technician_id')
+    def _compute_technician_workload(self):
+        workload = self.env['service.booking']._get_technician_workload(self.technician_id)
+        for wizard in self:
+            wizard.technician_workload = workload.get(wizard.technician_id.id, 0.0)
 
     def assign_technician_action(self):
         self.ensure_one()
@@ -29,17 +39,20 @@ class ServiceBookingAssignTechnicianWizard(models.TransientModel):
         if not self.technician_id:
             raise UserError(_("Please select a technician."))
 
-        current_user = self.env.user
-        is_supervisor = self.env['service.supervisor.user'].search([('user_id', '=', current_user.id)], limit=1)
-        
-        if not is_supervisor:
-            raise UserError(_("You do not have permission to assign technicians. Only supervisors can perform this action."))
+        supervisor = self.env['service.supervisor.user']._get_current_supervisor()
 
-        self.booking_id.write({
+        started = self.booking_ids.filtered(lambda b: b.state not in ('booked', 'assigned'))
+        if started:
+            raise UserError(_(
+                "Only booked or assigned job orders can be assigned to a technician: %s",
+                ", ".join(started.mapped('name')),
+            ))
+
+        self.booking_ids.write({
             'assigned_technician_id': self.technician_id.id,
             'assigned_datetime': fields.Datetime.now(),
             'state': 'assigned',
-            'supervisor_user_id': is_supervisor.id,
+            'supervisor_user_id': supervisor.id,
         })
         return {'type': 'ir.actions.act_window_close'}
 
@@ -0,0 +1,56 @@
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class ServiceDateOverdueMixin(models.AbstractModel):
+    """Stored ``is_date_overdue`` flag for documents with a planned service date.
+
+    Inheriting models declare ``plan_service_date`` and ``state`` and override
+    :meth:`_compute_is_date_overdue` with the matching ``@api.depends``. As the
+    flag also depends on today's date, :meth:`_rollover_date_overdue` is run
+    nightly to flag the documents whose planned date has just passed.
+    """
+
+    _name = "service.date.overdue.mixin"
+    _description = "Service Planned Date Overdue Mixin"
+
+    # States in which a document is never overdue.
+    _overdue_closed_states = ()
+
+    is_date_overdue = fields.Boolean(
+        string="Overdue",
+        compute="_compute_is_date_overdue",
+        store=True,
+        index=True,
+    )
+
+    def _compute_is_date_overdue(self):
+        today = fields.Date.today()
+        for rec in self:
+            rec.is_date_overdue = bool(
+                rec.plan_service_date
+                and rec.plan_service_date < today
+                and rec.state not in self._overdue_closed_states
+            )
+
+    @api.model
+    def _rollover_date_overdue(self):
+        """Flag the open documents whose planned date passed since the last run."""
+        self.flush_model(["plan_service_date", "state", "is_date_overdue"])
+        self.env.cr.execute(
+            f"""
+            UPDATE {self._table}
+               SET is_date_overdue = TRUE
+             WHERE is_date_overdue IS NOT TRUE
+               AND plan_service_date < %s
+               AND state NOT IN %s
+            """,
+            (fields.Date.today(), tuple(self._overdue_closed_states)),
+        )
+        flipped = self.env.cr.rowcount
+        self.invalidate_model(["is_date_overdue"])
+        _logger.info(f"{self._name}: {flipped} records became overdue.")
+        return flipped
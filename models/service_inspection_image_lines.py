@@ -19,3 +19,15 @@ class InspectionImageLines(models.Model):
         "ir.attachment", string="Image", required=True, ondelete="cascade"
     )
     description = fields.Char(string="Description")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["service.media.job"]._enqueue(records.image)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "image" in vals:
+            self.env["service.media.job"]._enqueue(self.image)
+        return res
@@ -1,5 +1,5 @@
 import logging
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 from odoo.exceptions import UserError
 
 _logger = logging.getLogger(__name__)
@@ -16,3 +16,29 @@ class InspectionType(models.Model):
     _sql_constraints = [
         ("name_unique", "unique(name)", "Inspection Type name must be unique.")
     ]
+
+    @api.model
+    def _get_active_inspection_type_ids(self):
+        version = self.env["showroom.cache.version"]._get_version(self._name)
+        return self._get_active_inspection_type_ids_cached(version)
+
+    @tools.ormcache("version")
+    def _get_active_inspection_type_ids_cached(self, version):
+        return tuple(self.sudo().search([("active", "=", True)]).ids)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["showroom.cache.version"]._bump(self._name)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "active" in vals:
+            self.env["showroom.cache.version"]._bump(self._name)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["showroom.cache.version"]._bump(self._name)
+        return res
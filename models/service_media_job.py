@@ -0,0 +1,114 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class ServiceMediaJob(models.Model):
+    _name = "service.media.job"
+    _description = "Service Media Processing Job"
+    _order = "id"
+
+    _BATCH_SIZE = 20
+    _MAX_ATTEMPTS = 5
+    _RETRY_DELAY = 10  # minutes, doubled after every failed attempt
+
+    attachment_id = fields.Many2one(
+        "ir.attachment", string="Attachment", required=True, ondelete="cascade", index=True
+    )
+    state = fields.Selection(
+        [
+            ("pending", "Pending"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        default="pending",
+        required=True,
+        index=True,
+    )
+    attempts = fields.Integer(string="Attempts", default=0)
+    next_try = fields.Datetime(string="Next Try")
+    last_error = fields.Text(string="Last Error")
+
+    _sql_constraints = [
+        ("attachment_uniq", "unique (attachment_id)", "An attachment is processed only once."),
+    ]
+
+    @api.model
+    def _enqueue(self, attachments):
+        """Queue the image and video ``attachments`` that have no job yet."""
+        attachments = attachments.sudo().filtered(
+            lambda a: a.mimetype and a.mimetype.split("/")[0] in ("image", "video")
+        )
+        if not attachments:
+            return self.browse()
+        queued = self.sudo().search([("attachment_id", "in", attachments.ids)]).attachment_id
+        return self.sudo().create([
+            {"attachment_id": attachment.id}
+            for attachment in attachments - queued
+        ])
+
+    @api.model
+    def _process_queue(self, batch_size=None, limit=500):
+        """Process pending jobs in batches, committing after each batch.
+
+        A job that fails is retried with an exponential backoff and marked as
+        failed after ``_MAX_ATTEMPTS``. Returns the number of processed jobs.
+        """
+        batch_size = batch_size or self._BATCH_SIZE
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        processed = 0
+        while processed < limit:
+            jobs = self._lock_batch(min(batch_size, limit - processed))
+            if not jobs:
+                break
+            processed += len(jobs)
+            started = time.monotonic()
+            failed = 0
+            for job in jobs:
+                try:
+                    with self.env.cr.savepoint():
+                        job.attachment_id._generate_service_media_renditions()
+                        job.write({"state": "done", "last_error": False})
+                except Exception as e:
+                    failed += 1
+                    _logger.warning(f"Media processing failed for attachment {job.attachment_id.id}: {e}")
+                    job._schedule_retry(str(e))
+            _logger.info(
+                f"Service media batch: {len(jobs) - failed} processed, {failed} failed "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+            if auto_commit:
+                self.env.cr.commit()
+        return processed
+
+    @api.model
+    def _lock_batch(self, size):
+        self.flush_model(["state", "next_try"])
+        self.env.cr.execute(
+            """
+            SELECT id FROM service_media_job
+             WHERE state = 'pending'
+               AND (next_try IS NULL OR next_try <= %s)
+          ORDER BY id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+            """,
+            (fields.Datetime.now(), size),
+        )
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _schedule_retry(self, error):
+        attempts = self.attempts + 1
+        self.write({
+            "attempts": attempts,
+            "last_error": error,
+            "state": "failed" if attempts >= self._MAX_ATTEMPTS else "pending",
+            "next_try": fields.Datetime.now()
+            + timedelta(minutes=self._RETRY_DELAY * 2 ** (attempts - 1)),
+        })
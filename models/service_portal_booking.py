@@ -0,0 +1,124 @@
+import time
+
+from odoo import api, fields, models, tools
+
+PORTAL_COUNT_CACHE_TTL = 60  # seconds
+
+
+class ServicePortalBooking(models.Model):
+    _name = "service.portal.booking"
+    _description = "Portal Service Booking Listing"
+    _auto = False
+    _rec_name = "name"
+    _order = "plan_service_date, name"
+
+    record_type = fields.Selection(
+        [("booking", "Job Order"), ("appointment", "Appointment")],
+        string="Record Type",
+        readonly=True,
+    )
+    booking_id = fields.Many2one("service.booking", string="Job Order", readonly=True)
+    appointment_id = fields.Many2one("service.appointment", string="Appointment", readonly=True)
+    name = fields.Char(string="Number", readonly=True)
+    customer_name = fields.Many2one("res.partner", string="Customer Name", readonly=True)
+    contact_number = fields.Char(string="Contact Number", readonly=True)
+    contact_email = fields.Char(string="Email", readonly=True)
+    plat_number = fields.Char(string="Plate Number", readonly=True)
+    vehicle_brand = fields.Many2one("service.vehicle.brand", string="Vehicle Brand", readonly=True)
+    vehicle_model = fields.Many2one("service.vehicle.model", string="Vehicle Model", readonly=True)
+    plan_service_date = fields.Date(string="Booking Date", readonly=True)
+    service_type = fields.Many2one("service.type", string="Service Type", readonly=True)
+    complaint_issue = fields.Text(string="Complaints", readonly=True)
+    state = fields.Selection(
+        [
+            ("waiting", "Waiting"),
+            ("booked", "Booked"),
+            ("assigned", "Assigned"),
+            ("in_progress", "In Progress"),
+            ("completed", "Completed"),
+            ("cancelled", "Cancelled"),
+        ],
+        string="Status",
+        readonly=True,
+    )
+    create_date = fields.Datetime(string="Created on", readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        # Booking ids are even and appointment ids odd, so both can share one id column.
+        self.env.cr.execute(
+            f"""
+            CREATE OR REPLACE VIEW {self._table} AS (
+                SELECT b.id * 2 AS id,
+                       'booking' AS record_type,
+                       b.id AS booking_id,
+                       NULL::integer AS appointment_id,
+                       b.name,
+                       b.customer_name,
+                       b.contact_number,
+                       b.contact_email,
+                       b.plat_number,
+                       b.vehicle_brand,
+                       b.vehicle_model,
+                       b.plan_service_date,
+                       b.service_type,
+                       b.complaint_issue,
+                       b.state,
+                       b.create_date
+                  FROM service_booking b
+                 UNION ALL
+                SELECT a.id * 2 + 1 AS id,
+                       'appointment' AS record_type,
+                       NULL::integer AS booking_id,
+                       a.id AS appointment_id,
+                       a.name,
+                       a.customer_name,
+                       a.contact_number,
+                       a.contact_email,
+                       a.plat_number,
+                       a.vehicle_brand,
+                       a.vehicle_model,
+                       a.plan_service_date,
+                       a.service_type,
+                       a.complaint_issue,
+                       CASE WHEN a.state = 'draft' THEN 'waiting' ELSE a.state END AS state,
+                       a.create_date
+                  FROM service_appointment a
+                 WHERE a.state IN ('draft', 'cancelled')
+            )
+            """
+        )
+
+    def get_portal_url(self, report_type=None, download=None, query_string=None, anchor=None):
+        self.ensure_one()
+        if self.record_type == "booking":
+            return self.booking_id.get_portal_url()
+        return "#"
+
+    @api.model
+    def _get_portal_count(self, partner):
+        """Number of job orders and waiting appointments listed on the partner's portal.
+
+        The count is cached per worker under the partner's version, which
+        :meth:`_invalidate_portal_count` bumps in the same transaction as
+        the change, and for at most ``PORTAL_COUNT_CACHE_TTL`` seconds.
+        """
+        version = self.env["showroom.cache.version"]._get_version(self._name, partner.id)
+        bucket = int(time.time() // PORTAL_COUNT_CACHE_TTL)
+        return self._get_portal_count_cached(partner.id, version, bucket)
+
+    @tools.ormcache("partner_id", "version", "bucket")
+    def _get_portal_count_cached(self, partner_id, version, bucket):
+        return sum(
+            record_count
+            for record_type, state, record_count in self.sudo()._read_group(
+                [("customer_name", "=", partner_id)],
+                ["record_type", "state"],
+                ["__count"],
+            )
+            if not (record_type == "appointment" and state == "cancelled")
+        )
+
+    @api.model
+    def _invalidate_portal_count(self, partner_ids):
+        self.env["showroom.cache.version"]._bump(self._name, partner_ids)
@@ -0,0 +1,173 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class MailMail(models.Model):
+    _inherit = "mail.mail"
+
+    _SERVICE_REMINDER_BATCH_SIZE = 100
+    _SERVICE_REMINDER_MAX_ATTEMPTS = 5
+    _SERVICE_REMINDER_RETRY_DELAY = 5  # minutes, doubled after every failed attempt
+
+    is_service_reminder = fields.Boolean(
+        string="Service Reminder",
+        index=True,
+        help="Queued by a service booking or appointment reminder and sent by the reminder mail queue.",
+    )
+    service_reminder_attempts = fields.Integer(string="Send Attempts", default=0)
+    service_reminder_next_try = fields.Datetime(string="Next Retry")
+
+    @api.model
+    def process_email_queue(self, email_ids=None, **kwargs):
+        # Reminder emails have their own sender cron; keep the generic
+        # scheduler away from them so a message is never sent twice.
+        if email_ids is None and not self.env.context.get("service_reminder_queue"):
+            filters = list(self.env.context.get("filters", [])) + [("is_service_reminder", "=", False)]
+            self = self.with_context(filters=filters)
+        return super().process_email_queue(email_ids=email_ids, **kwargs)
+
+    @api.model
+    def _process_service_reminder_queue(self, batch_size=None, limit=10000):
+        """Send queued reminder emails in batches.
+
+        Each batch goes through ``send()``, which opens one SMTP session per
+        mail server. Failed messages are retried with an exponential backoff.
+        Returns one throughput entry per batch.
+        """
+        batch_size = batch_size or self._SERVICE_REMINDER_BATCH_SIZE
+        auto_commit = not getattr(threading.current_thread(), "testing", False)
+        self = self.with_context(service_reminder_queue=True)
+        self._requeue_failed_service_reminders()
+
+        metrics = []
+        processed = 0
+        while processed < limit:
+            mails = self._lock_service_reminder_batch(min(batch_size, limit - processed))
+            if not mails:
+                break
+            processed += len(mails)
+            started = time.monotonic()
+            mails.send(auto_commit=auto_commit, raise_exception=False)
+            elapsed = time.monotonic() - started
+
+            failed = mails.exists().filtered(lambda m: m.state == "exception")
+            failed._schedule_service_reminder_retry()
+            batch_metrics = {
+                "count": len(mails),
+                "sent": len(mails) - len(failed),
+                "failed": len(failed),
+                "seconds": elapsed,
+                "per_second": len(mails) / elapsed if elapsed else float(len(mails)),
+            }
+            metrics.append(batch_metrics)
+            _logger.info(
+                "Service reminder mail batch: %(sent)s sent, %(failed)s failed in %(seconds).2fs (%(per_second).1f msg/s)",
+                batch_metrics,
+            )
+            if auto_commit:
+                self.env.cr.commit()
+        return metrics
+
+    @api.model
+    def _lock_service_reminder_batch(self, size):
+        self.flush_model(["is_service_reminder", "state", "scheduled_date"])
+        self.env.cr.execute(
+            """
+            SELECT id FROM mail_mail
+             WHERE is_service_reminder
+               AND state = 'outgoing'
+               AND (scheduled_date IS NULL OR scheduled_date <= %s)
+          ORDER BY id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+            """,
+            (fields.Datetime.now(), size),
+        )
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def _requeue_failed_service_reminders(self):
+        retry = self.search([
+            ("is_service_reminder", "=", True),
+            ("state", "=", "exception"),
+            ("service_reminder_attempts", "<", self._SERVICE_REMINDER_MAX_ATTEMPTS),
+            ("service_reminder_next_try", "<=", fields.Datetime.now()),
+        ])
+        if retry:
+            retry.write({"state": "outgoing", "failure_reason": False})
+
+    def _schedule_service_reminder_retry(self):
+        # The next try only depends on the attempt count: mails sharing it
+        # are rescheduled with one write.
+        now = fields.Datetime.now()
+        mails_by_attempts = defaultdict(lambda: self.browse())
+        for mail in self:
+            mails_by_attempts[mail.service_reminder_attempts + 1] |= mail
+        for attempts, mails in mails_by_attempts.items():
+            mails.write({
+                "service_reminder_attempts": attempts,
+                "service_reminder_next_try": now + timedelta(
+                    minutes=self._SERVICE_REMINDER_RETRY_DELAY * 2 ** (attempts - 1)
+                ),
+            })
+
+
+class ServiceReminderMailMixin(models.AbstractModel):
+    _name = "service.reminder.mail.mixin"
+    _description = "Service Reminder Email Mixin"
+
+    def _queue_reminder_emails(self, template_xml_id, recipients):
+        """Render a reminder template and queue one email per record.
+
+        ``recipients`` maps record ids to the ``res.users`` to notify. The
+        template is rendered once per recipient over all of its records, so the
+        related fields it uses are prefetched for the whole batch.
+        """
+        template = self.env.ref(
+            f"infinys_service_showroom.{template_xml_id}", raise_if_not_found=False
+        )
+        if not template:
+            _logger.warning(f"Email template {template_xml_id} not found, no reminder queued.")
+            return self.env["mail.mail"]
+
+        records_by_user = defaultdict(list)
+        for res_id, user in recipients.items():
+            if user and user.partner_id.email:
+                records_by_user[user].append(res_id)
+            else:
+                _logger.warning(f"No recipient or email address found for email reminder using template {template_xml_id}.")
+        if not records_by_user:
+            return self.env["mail.mail"]
+
+        template = template.sudo()
+        email_from = f"<{self.env.company.email or self.env.user.email}>"
+        mail_values_list = []
+        for user, res_ids in records_by_user.items():
+            render_context = {"recipient_name": user.name}
+            subjects = template._render_field("subject", res_ids, add_context=render_context)
+            bodies = template._render_field(
+                "body_html", res_ids, add_context=render_context, options={"post_process": True}
+            )
+            for res_id in res_ids:
+                mail_values_list.append({
+                    "email_from": email_from,
+                    "author_id": self.env.user.partner_id.id,
+                    "email_to": user.partner_id.email,
+                    "subject": subjects[res_id],
+                    "body_html": bodies[res_id],
+                    "auto_delete": True,
+                    "state": "outgoing",
+                    "is_service_reminder": True,
+                    "res_id": res_id,
+                    "model": self._name,
+                })
+        mails = self.env["mail.mail"].sudo().create(mail_values_list)
+        _logger.info(f"Queued {len(mails)} {self._name} email reminder(s) using template {template_xml_id}.")
+        return mails
@@ -1,5 +1,5 @@
 import logging
-from odoo import api, fields, models
+from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 
 _logger = logging.getLogger(__name__)
@@ -51,3 +51,11 @@ class SupervisorUser(models.Model):
             record.name = (
                 record.user_id.partner_id.name if record.user_id.partner_id.name else ""
             )
+
+    @api.model
+    def _get_current_supervisor(self):
+        """Return the supervisor record of the current user, raising if there is none."""
+        supervisor = self.search([("user_id", "=", self.env.uid)], limit=1)
+        if not supervisor:
+            raise UserError(_("You do not have permission to assign technicians. Only supervisors can perform this action."))
+        return supervisor
@@ -11,6 +11,12 @@ class ServiceType(models.Model):
 
     name = fields.Char(string="Service Type Name", required=True)
     description = fields.Text(string="Description")
+    workload_weight = fields.Float(
+        string="Workload Weight",
+        required=True,
+        default=1.0,
+        help="Relative effort of a job order of this type when balancing technician workload.",
+    )
 
     _sql_constraints = [
         ("name_uniq", "unique (name)", "Service Type name must be unique!")
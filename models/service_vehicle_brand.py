@@ -7,6 +7,7 @@ _logger = logging.getLogger(__name__)
 
 class VehicleBrand(models.Model):
     _name = "service.vehicle.brand"
+    _inherit = ["showroom.page.cache.mixin"]
     _description = "Vehicle Brand"
 
     name = fields.Char(string="Brand Name", required=True)
@@ -15,3 +16,9 @@ class VehicleBrand(models.Model):
     _sql_constraints = [
         ("name_uniq", "unique (name)", "Vehicle Brand name must be unique!")
     ]
+
+    def unlink(self):
+        res = super().unlink()
+        # Drops the brand from the cached service.vehicle.model catalogue.
+        self.env["showroom.cache.version"]._bump("service.vehicle.model")
+        return res
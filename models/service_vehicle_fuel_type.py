@@ -7,6 +7,7 @@ _logger = logging.getLogger(__name__)
 
 class VehicleFuelType(models.Model):
     _name = "service.vehicle.fuel.type"
+    _inherit = ["showroom.page.cache.mixin"]
     _description = "Vehicle Fuel Type"
     ordering = "name asc"
 
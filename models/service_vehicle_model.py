@@ -1,5 +1,9 @@
+import hashlib
+import json
 import logging
-from odoo import api, fields, models
+from collections import defaultdict
+
+from odoo import api, fields, models, tools
 from odoo.exceptions import UserError
 
 _logger = logging.getLogger(__name__)
@@ -7,6 +11,7 @@ _logger = logging.getLogger(__name__)
 
 class VehicleModel(models.Model):
     _name = "service.vehicle.model"
+    _inherit = ["showroom.page.cache.mixin"]
     _description = "Vehicle Model"
 
     name = fields.Char(string="Model Name", required=True)
@@ -30,3 +35,45 @@ class VehicleModel(models.Model):
     _sql_constraints = [
         ("name_unique", "unique(name)", "Vehicle Model Name must be unique.")
     ]
+
+    @api.model
+    def _get_brand_model_catalogue(self):
+        """Return ``{"version": ..., "brands": {brand_id: [{"id", "name"}]}}``.
+
+        ``version`` is a hash of the catalogue, so clients can keep a copy and
+        only refetch it when it changes.
+        """
+        cache_version = self.env["showroom.cache.version"]._get_version(self._name)
+        return self._get_brand_model_catalogue_cached(cache_version)
+
+    @tools.ormcache("cache_version")
+    def _get_brand_model_catalogue_cached(self, cache_version):
+        brands = defaultdict(list)
+        for model in self.sudo().search_read(
+            [], ["name", "vehicle_brand"], order="name"
+        ):
+            brands[str(model["vehicle_brand"][0])].append(
+                {"id": model["id"], "name": model["name"]}
+            )
+        payload = json.dumps(brands, sort_keys=True)
+        return {
+            "version": hashlib.sha1(payload.encode()).hexdigest()[:16],
+            "brands": dict(brands),
+        }
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["showroom.cache.version"]._bump(self._name)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "name" in vals or "vehicle_brand" in vals:
+            self.env["showroom.cache.version"]._bump(self._name)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["showroom.cache.version"]._bump(self._name)
+        return res
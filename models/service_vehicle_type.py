@@ -7,6 +7,7 @@ _logger = logging.getLogger(__name__)
 
 class VehicleType(models.Model):
     _name = "service.vehicle.type"
+    _inherit = ["showroom.page.cache.mixin"]
     _description = "Vehicle Type"
 
     name = fields.Char(string="Vehicle Type Name", required=True)
@@ -0,0 +1,279 @@
+from collections import Counter
+from datetime import timedelta
+
+from odoo import api, fields, models, tools, _
+from odoo.exceptions import UserError, ValidationError
+
+
+# Documents occupying a workshop slot on their planned date. An appointment
+# stops counting once its job order exists, as the job order takes its place.
+WORKSHOP_OCCUPYING_STATES = {
+    "service.appointment": ("draft",),
+    "service.booking": ("booked", "assigned", "in_progress", "completed"),
+}
+
+
+class WorkshopCapacity(models.Model):
+    _name = "service.workshop.capacity"
+    _description = "Workshop Capacity"
+    _order = "date desc, service_type_id"
+
+    date = fields.Date(
+        string="Date",
+        help="Leave empty for the default capacity of every day.",
+    )
+    service_type_id = fields.Many2one(
+        "service.type",
+        string="Service Type",
+        ondelete="cascade",
+        help="Leave empty for the capacity of the whole workshop.",
+    )
+    bay_capacity = fields.Integer(string="Service Bays", required=True, default=1)
+    technician_capacity = fields.Integer(string="Technicians", required=True, default=1)
+    slot_capacity = fields.Integer(
+        string="Vehicles per Day",
+        compute="_compute_slot_capacity",
+        store=True,
+        help="A vehicle needs both a bay and a technician.",
+    )
+
+    @api.constrains("date", "service_type_id")
+    def _check_unique_rule(self):
+        for capacity in self:
+            if self.search_count([
+                ("id", "!=", capacity.id),
+                ("date", "=", capacity.date),
+                ("service_type_id", "=", capacity.service_type_id.id),
+            ]):
+                raise ValidationError(_("Only one capacity can be defined per date and service type."))
+
+    @api.depends("bay_capacity", "technician_capacity")
+    def _compute_slot_capacity(self):
+        for capacity in self:
+            capacity.slot_capacity = min(capacity.bay_capacity, capacity.technician_capacity)
+
+    @api.model
+    def _get_capacity_rules(self):
+        """Return ``{(date or None, service_type_id or None): slot_capacity}``."""
+        version = self.env["showroom.cache.version"]._get_version(self._name)
+        return self._get_capacity_rules_cached(version)
+
+    @tools.ormcache("version")
+    def _get_capacity_rules_cached(self, version):
+        return {
+            (rule["date"] or None, rule["service_type_id"] and rule["service_type_id"][0] or None):
+                rule["slot_capacity"]
+            for rule in self.sudo().search_read([], ["date", "service_type_id", "slot_capacity"])
+        }
+
+    @api.model
+    def _get_slot_capacity(self, day, service_type_id=None):
+        """Capacity of a day, for one service type or (``None``) the workshop.
+
+        A rule for that exact date wins over the default rule; no rule means
+        the capacity is unlimited (``None``).
+        """
+        rules = self._get_capacity_rules()
+        for key in ((day, service_type_id), (None, service_type_id)):
+            if key in rules:
+                return rules[key]
+        return None
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["showroom.cache.version"]._bump(self._name)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["showroom.cache.version"]._bump(self._name)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["showroom.cache.version"]._bump(self._name)
+        return res
+
+
+class WorkshopOccupancy(models.Model):
+    _name = "service.workshop.occupancy"
+    _description = "Workshop Occupancy"
+    _order = "date, service_type_id"
+
+    date = fields.Date(string="Date", required=True, readonly=True, index=True)
+    service_type_id = fields.Many2one(
+        "service.type",
+        string="Service Type",
+        readonly=True,
+        ondelete="cascade",
+        help="Empty on the row holding the total of the whole workshop for the date.",
+    )
+    occupied = fields.Integer(string="Occupied Slots", readonly=True)
+
+    _sql_constraints = [
+        ("date_service_type_uniq", "unique (date, service_type_id)", "Occupancy is tracked once per date and service type."),
+    ]
+
+    def init(self):
+        """Rebuild the table from the live documents on install and update."""
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS service_workshop_occupancy_date_total_uniq
+                ON service_workshop_occupancy (date)
+             WHERE service_type_id IS NULL
+            """
+        )
+        self.env.cr.execute("DELETE FROM service_workshop_occupancy")
+        self.env.cr.execute(
+            """
+            INSERT INTO service_workshop_occupancy (date, service_type_id, occupied)
+                 SELECT plan_service_date, service_type, COUNT(*)
+                   FROM (
+                         SELECT plan_service_date, service_type FROM service_appointment
+                          WHERE state IN %s
+                      UNION ALL
+                         SELECT plan_service_date, service_type FROM service_booking
+                          WHERE state IN %s
+                        ) AS documents
+                  WHERE plan_service_date IS NOT NULL AND service_type IS NOT NULL
+               GROUP BY GROUPING SETS ((plan_service_date, service_type), (plan_service_date))
+            """,
+            (
+                WORKSHOP_OCCUPYING_STATES["service.appointment"],
+                WORKSHOP_OCCUPYING_STATES["service.booking"],
+            ),
+        )
+
+    @api.model
+    def _occupancy_keys(self, records):
+        """Return the ``(date, service_type_id)`` slot of each occupying record."""
+        states = WORKSHOP_OCCUPYING_STATES[records._name]
+        return Counter(
+            (record.plan_service_date, record.service_type.id)
+            for record in records
+            if record.state in states and record.plan_service_date and record.service_type
+        )
+
+    @api.model
+    def _apply_deltas(self, deltas):
+        """Add ``deltas`` (a Counter of slot -> change) to the occupancy table,
+        and their sum per date to the workshop total rows."""
+        rows = [(day, type_id, delta) for (day, type_id), delta in deltas.items() if delta]
+        totals = Counter()
+        for day, _type_id, delta in rows:
+            totals[day] += delta
+        total_rows = [(day, delta) for day, delta in totals.items() if delta]
+        if not rows:
+            return
+        self.flush_model()
+        self.env.cr.execute(
+            f"""
+            INSERT INTO service_workshop_occupancy (date, service_type_id, occupied)
+                 VALUES {", ".join(["(%s, %s, %s)"] * len(rows))}
+            ON CONFLICT (date, service_type_id)
+              DO UPDATE SET occupied = service_workshop_occupancy.occupied + EXCLUDED.occupied
+            """,
+            [value for row in rows for value in row],
+        )
+        if total_rows:
+            self.env.cr.execute(
+                f"""
+                INSERT INTO service_workshop_occupancy (date, service_type_id, occupied)
+                     VALUES {", ".join(["(%s, NULL, %s)"] * len(total_rows))}
+                ON CONFLICT (date) WHERE service_type_id IS NULL
+                  DO UPDATE SET occupied = service_workshop_occupancy.occupied + EXCLUDED.occupied
+                """,
+                [value for row in total_rows for value in row],
+            )
+        self.invalidate_model(["occupied"])
+
+    @api.model
+    def _get_availability(self, start, days=60, service_type_id=None):
+        """Return one ``{date, remaining, available}`` entry per day.
+
+        ``remaining`` is the tightest of the workshop and the service type
+        figures, or None when neither is limited.
+        """
+        end = start + timedelta(days=days - 1)
+        self.flush_model()
+        self.env.cr.execute(
+            """
+            SELECT date,
+                   COALESCE(SUM(occupied) FILTER (WHERE service_type_id IS NULL), 0),
+                   COALESCE(SUM(occupied) FILTER (WHERE service_type_id = %s), 0)
+              FROM service_workshop_occupancy
+             WHERE date BETWEEN %s AND %s
+          GROUP BY date
+            """,
+            (service_type_id, start, end),
+        )
+        occupancy = {day: (total, typed) for day, total, typed in self.env.cr.fetchall()}
+
+        Capacity = self.env["service.workshop.capacity"]
+        calendar = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            total, typed = occupancy.get(day, (0, 0))
+            limits = [(Capacity._get_slot_capacity(day), total)]
+            if service_type_id:
+                limits.append((Capacity._get_slot_capacity(day, service_type_id), typed))
+            remaining = [
+                capacity - occupied for capacity, occupied in limits if capacity is not None
+            ]
+            calendar.append({
+                "date": fields.Date.to_string(day),
+                "remaining": max(min(remaining), 0) if remaining else None,
+                "available": all(slots > 0 for slots in remaining),
+            })
+        return calendar
+
+    @api.model
+    def _reserve_slot(self, day, service_type_id):
+        """Check that a slot is free before a public submission takes it.
+
+        The workshop total and service type rows of the date are locked with
+        ``FOR UPDATE`` until the submitting transaction commits its
+        appointment. A concurrent submission waits for them; if they changed
+        since its snapshot, PostgreSQL raises a serialization failure and the
+        request is retried with fresh figures. Raises ``UserError`` when the
+        date is fully booked.
+        """
+        self.flush_model()
+        cr = self.env.cr
+        cr.execute(
+            """
+            INSERT INTO service_workshop_occupancy (date, service_type_id, occupied)
+                 VALUES (%s, NULL, 0)
+            ON CONFLICT (date) WHERE service_type_id IS NULL DO NOTHING
+            """,
+            (day,),
+        )
+        cr.execute(
+            """
+            INSERT INTO service_workshop_occupancy (date, service_type_id, occupied)
+                 VALUES (%s, %s, 0)
+            ON CONFLICT (date, service_type_id) DO NOTHING
+            """,
+            (day, service_type_id),
+        )
+        cr.execute(
+            """
+            SELECT service_type_id, occupied
+              FROM service_workshop_occupancy
+             WHERE date = %s
+               AND (service_type_id IS NULL OR service_type_id = %s)
+               FOR UPDATE
+            """,
+            (day, service_type_id),
+        )
+        occupied = dict(cr.fetchall())
+
+        Capacity = self.env["service.workshop.capacity"]
+        for type_id in (None, service_type_id):
+            capacity = Capacity._get_slot_capacity(day, type_id)
+            if capacity is not None and occupied.get(type_id, 0) >= capacity:
+                raise UserError(_(
+                    "The workshop is fully booked on %(date)s. Please choose another date.",
+                    date=fields.Date.to_string(day),
+                ))
@@ -0,0 +1,38 @@
+from collections import Counter
+
+from odoo import api, models
+
+
+class WorkshopOccupancyMixin(models.AbstractModel):
+    """Keep ``service.workshop.occupancy`` in step with the inheriting documents."""
+
+    _name = "service.workshop.occupancy.mixin"
+    _description = "Workshop Occupancy Mixin"
+
+    _OCCUPANCY_FIELDS = {"plan_service_date", "service_type", "state"}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        Occupancy = self.env["service.workshop.occupancy"]
+        Occupancy._apply_deltas(Occupancy._occupancy_keys(records))
+        return records
+
+    def write(self, vals):
+        if not self._OCCUPANCY_FIELDS.intersection(vals):
+            return super().write(vals)
+        Occupancy = self.env["service.workshop.occupancy"]
+        before = Occupancy._occupancy_keys(self)
+        res = super().write(vals)
+        deltas = Occupancy._occupancy_keys(self)
+        deltas.subtract(before)
+        Occupancy._apply_deltas(deltas)
+        return res
+
+    def unlink(self):
+        Occupancy = self.env["service.workshop.occupancy"]
+        deltas = Counter()
+        deltas.subtract(Occupancy._occupancy_keys(self))
+        res = super().unlink()
+        Occupancy._apply_deltas(deltas)
+        return res
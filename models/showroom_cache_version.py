@@ -0,0 +1,57 @@
+from odoo import api, fields, models
+
+
+class ShowroomCacheVersion(models.Model):
+    """Versions keying the showroom's per-worker caches.
+
+    A cache reads its version in the request transaction and puts it in its
+    cache key; a change bumps the version in the transaction making it. A
+    worker thus sees the new version exactly when it sees the change, and
+    a rolled back change leaves the committed version, and the entries
+    cached under it, untouched. Versions are taken from a sequence, so a
+    rolled back one is never handed out again.
+
+    There is one row per cache name, and per record for the caches keyed by
+    record (``res_id``, 0 otherwise). Rows are created on their first bump.
+    """
+
+    _name = "showroom.cache.version"
+    _description = "Showroom Cache Version"
+    _log_access = False
+
+    name = fields.Char(string="Cache", required=True, readonly=True)
+    res_id = fields.Integer(string="Record ID", required=True, readonly=True, default=0)
+    version = fields.Integer(string="Version", readonly=True, default=0)
+
+    _sql_constraints = [
+        ("name_res_id_uniq", "unique (name, res_id)", "A cache has one version per record."),
+    ]
+
+    def init(self):
+        self.env.cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {self._table}_seq")
+
+    @api.model
+    def _get_version(self, name, res_id=0):
+        """Return the version of cache ``name`` for ``res_id``, as of this transaction."""
+        self.env.cr.execute(
+            f"SELECT version FROM {self._table} WHERE name = %s AND res_id = %s",
+            (name, res_id),
+        )
+        row = self.env.cr.fetchone()
+        return row[0] if row else 0
+
+    @api.model
+    def _bump(self, name, res_ids=(0,)):
+        """Make the entries of cache ``name`` for ``res_ids`` unreachable in every worker."""
+        if not res_ids:
+            return
+        self.env.cr.execute(
+            f"""
+            INSERT INTO {self._table} (name, res_id, version)
+                 SELECT %(name)s, res_id, nextval('{self._table}_seq')
+                   FROM unnest(%(res_ids)s) AS res_id
+            ON CONFLICT (name, res_id) DO UPDATE SET version = EXCLUDED.version
+            """,
+            {"name": name, "res_ids": sorted(set(res_ids))},
+        )
+        self.invalidate_model(["version"])
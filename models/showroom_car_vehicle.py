@@ -1,8 +1,41 @@
+import re
+import unicodedata
+from collections import Counter
+
 from odoo import models, fields, api
+from odoo.tools import escape_psql, html2plaintext
+
+# (key, label, lower bound inclusive, upper bound exclusive) of the price
+# ranges offered as a facet on the website listing.
+SHOWROOM_PRICE_BUCKETS = [
+    ("under_100m", "Under 100M", 0, 100_000_000),
+    ("100m_250m", "100M - 250M", 100_000_000, 250_000_000),
+    ("250m_500m", "250M - 500M", 250_000_000, 500_000_000),
+    ("500m_1b", "500M - 1B", 500_000_000, 1_000_000_000),
+    ("over_1b", "Over 1B", 1_000_000_000, None),
+]
+
+# Website filter parameter -> field grouped by the facet engine.
+SHOWROOM_FACET_FIELDS = {
+    "brand_id": "brand_id",
+    "fuel_type_id": "fuel_type_id",
+    "transmission": "transmission",
+    "type_id": "type_id",
+    "price_bucket": "price_bucket",
+}
+
+
+
+def _normalize_search_text(text):
+    """Lowercase ``text``, strip accents and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.sub(r"\s+", " ", text).strip().lower()
 
 
 class CarVehicle(models.Model):
     _name = "showroom.car.vehicle"
+    _inherit = ["showroom.page.cache.mixin", "showroom.image.mixin"]
     _description = "Showroom Vehicle"
     _order = "name"
 
@@ -68,19 +101,190 @@ class CarVehicle(models.Model):
         required=True,
     )
     price = fields.Monetary("Price", currency_field="currency_id")
+    price_bucket = fields.Selection(
+        [(key, label) for key, label, _low, _high in SHOWROOM_PRICE_BUCKETS],
+        string="Price Range",
+        compute="_compute_price_bucket",
+        store=True,
+        index=True,
+    )
 
     description = fields.Html("Description")
 
-    main_image = fields.Image("Main Image")
+    search_document = fields.Text(
+        compute="_compute_search_document",
+        store=True,
+        index="trigram",
+        help="Normalized text matched by the website search box.",
+    )
+
+    main_image = fields.Image("Main Image", max_width=1920, max_height=1920)
+    main_image_gallery = fields.Image(
+        "Main Image (Gallery)", related="main_image", max_width=1024, max_height=1024, store=True
+    )
+    main_image_card = fields.Image(
+        "Main Image (Card)", related="main_image", max_width=512, max_height=512, store=True
+    )
+    main_image_webp = fields.Binary(
+        "Main Image (WebP)", compute="_compute_main_image_webp", store=True, attachment=True
+    )
+    main_image_gallery_webp = fields.Binary(
+        "Main Image (Gallery, WebP)",
+        compute="_compute_main_image_webp",
+        store=True,
+        attachment=True,
+    )
+    main_image_card_webp = fields.Binary(
+        "Main Image (Card, WebP)",
+        compute="_compute_main_image_webp",
+        store=True,
+        attachment=True,
+    )
+    main_image_checksum = fields.Char(compute="_compute_main_image_checksum", store=True)
     image_ids = fields.One2many(
         "showroom.car.vehicle.image",
         "vehicle_id",
         string="Gallery Images",
     )
 
+    @api.depends("main_image", "main_image_gallery", "main_image_card")
+    def _compute_main_image_webp(self):
+        self._compute_showroom_webp("main_image")
+
+    @api.depends("main_image")
+    def _compute_main_image_checksum(self):
+        self._compute_showroom_checksum("main_image")
+
+    @api.depends("price")
+    def _compute_price_bucket(self):
+        for car in self:
+            price = car.price or 0.0
+            car.price_bucket = next(
+                key
+                for key, _label, low, high in SHOWROOM_PRICE_BUCKETS
+                if price >= low and (high is None or price < high)
+            )
+
+    @api.depends(
+        "name",
+        "brand_id.name",
+        "model_id.name",
+        "year",
+        "fuel_type_id.name",
+        "transmission",
+        "description",
+    )
+    def _compute_search_document(self):
+        transmissions = dict(self._fields["transmission"].selection)
+        for car in self:
+            car.search_document = _normalize_search_text(" ".join(filter(None, [
+                car.name,
+                car.brand_id.name,
+                car.model_id.name,
+                car.year,
+                car.fuel_type_id.name,
+                transmissions.get(car.transmission),
+                html2plaintext(car.description) if car.description else None,
+            ])))
+
+    @api.model
+    def _search_showroom_ids(self, term, limit=None):
+        """Return the ids of published cars matching ``term``, best match first.
+
+        Substring matches rank first. When pg_trgm is available, near matches
+        (typos, missing letters) are also returned, ordered by word similarity.
+        """
+        term = _normalize_search_text(term)
+        if not term:
+            return []
+        self.flush_model(["search_document", "website_published", "active", "name"])
+        pattern = f"%{escape_psql(term)}%"
+        if self.env.registry.has_trigram:
+            self.env.cr.execute(
+                """
+                SELECT id FROM showroom_car_vehicle
+                 WHERE website_published AND active
+                   AND (search_document ILIKE %s OR %s <%% search_document)
+              ORDER BY search_document ILIKE %s DESC,
+                       word_similarity(%s, search_document) DESC,
+                       name
+                 LIMIT %s
+                """,
+                (pattern, term, pattern, term, limit),
+            )
+        else:
+            self.env.cr.execute(
+                """
+                SELECT id FROM showroom_car_vehicle
+                 WHERE website_published AND active
+                   AND search_document ILIKE %s
+              ORDER BY name
+                 LIMIT %s
+                """,
+                (pattern, limit),
+            )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def _get_showroom_facets(self, domain, selected):
+        """Count the cars of each facet value in a single grouped query.
+
+        Also returns under ``total`` the number of cars matching ``domain``
+        with every selected facet applied.
+
+        ``domain`` must not contain the facet filters themselves: ``selected``
+        maps facet names to the chosen value and every facet is counted with
+        the other selections applied, so a shopper can still switch to another
+        brand (or fuel type, ...) with the counts they would get.
+        """
+        groupby = list(SHOWROOM_FACET_FIELDS.values())
+        rows = self._read_group(domain, groupby, ["__count"])
+
+        selected = {name: value for name, value in selected.items() if value}
+        counts = {name: Counter() for name in SHOWROOM_FACET_FIELDS}
+        total = 0
+        for row in rows:
+            values = {}
+            for name, group in zip(SHOWROOM_FACET_FIELDS, row[:-1]):
+                values[name] = group.id if isinstance(group, models.BaseModel) else group
+            count = row[-1]
+            if all(values[name] == value for name, value in selected.items()):
+                total += count
+            for name in SHOWROOM_FACET_FIELDS:
+                if all(
+                    values[other] == value
+                    for other, value in selected.items()
+                    if other != name
+                ):
+                    counts[name][values[name]] += count
+
+        def _records(model_name, facet):
+            records = self.env[model_name].browse(
+                [value for value in counts[facet] if value]
+            ).sorted("name")
+            return [(record, counts[facet][record.id]) for record in records]
+
+        def _selection(facet):
+            selection = self._fields[SHOWROOM_FACET_FIELDS[facet]].selection
+            return [
+                (key, label, counts[facet][key])
+                for key, label in selection
+                if counts[facet][key]
+            ]
+
+        return {
+            "total": total,
+            "brand_id": _records("service.vehicle.brand", "brand_id"),
+            "fuel_type_id": _records("service.vehicle.fuel.type", "fuel_type_id"),
+            "type_id": _records("service.vehicle.type", "type_id"),
+            "transmission": _selection("transmission"),
+            "price_bucket": _selection("price_bucket"),
+        }
+
 
 class CarVehicleImage(models.Model):
     _name = "showroom.car.vehicle.image"
+    _inherit = ["showroom.page.cache.mixin", "showroom.image.mixin"]
     _description = "Vehicle Gallery Image"
     _order = "id"
 
@@ -91,4 +295,34 @@ class CarVehicleImage(models.Model):
         required=True,
         ondelete="cascade",
     )
-    image = fields.Image("Image", required=True)
+    image = fields.Image("Image", max_width=1920, max_height=1920, required=True)
+    image_gallery = fields.Image(
+        "Image (Gallery)", related="image", max_width=1024, max_height=1024, store=True
+    )
+    image_card = fields.Image(
+        "Image (Card)", related="image", max_width=512, max_height=512, store=True
+    )
+    image_webp = fields.Binary(
+        "Image (WebP)", compute="_compute_image_webp", store=True, attachment=True
+    )
+    image_gallery_webp = fields.Binary(
+        "Image (Gallery, WebP)",
+        compute="_compute_image_webp",
+        store=True,
+        attachment=True,
+    )
+    image_card_webp = fields.Binary(
+        "Image (Card, WebP)",
+        compute="_compute_image_webp",
+        store=True,
+        attachment=True,
+    )
+    image_checksum = fields.Char(compute="_compute_image_checksum", store=True)
+
+    @api.depends("image", "image_gallery", "image_card")
+    def _compute_image_webp(self):
+        self._compute_showroom_webp("image")
+
+    @api.depends("image")
+    def _compute_image_checksum(self):
+        self._compute_showroom_checksum("image")
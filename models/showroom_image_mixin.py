@@ -0,0 +1,92 @@
+import hashlib
+import logging
+
+from odoo import api, models
+from odoo.tools.image import base64_to_image, image_to_base64
+
+_logger = logging.getLogger(__name__)
+
+# Rendition name -> maximum width/height. The "zoom" rendition is the stored
+# source field itself, capped at upload time.
+SHOWROOM_IMAGE_VARIANTS = {
+    "card": 512,
+    "gallery": 1024,
+    "zoom": 1920,
+}
+SHOWROOM_WEBP_QUALITY = 80
+
+
+def _to_webp(value):
+    """Return ``value`` (base64 image) re-encoded as base64 WebP, or False."""
+    if not value:
+        return False
+    try:
+        image = base64_to_image(value)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        return image_to_base64(image, "WEBP", quality=SHOWROOM_WEBP_QUALITY)
+    except (OSError, ValueError, KeyError) as e:
+        _logger.warning(f"Could not encode showroom image as WebP: {e}")
+        return False
+
+
+class ShowroomImageMixin(models.AbstractModel):
+    """URL helpers for image fields that come with card/gallery/zoom renditions.
+
+    For a source field ``<field>`` the inheriting model declares:
+
+    - ``<field>`` capped to the zoom size, ``<field>_gallery`` and
+      ``<field>_card`` as stored related Image fields;
+    - ``<field>_webp``, ``<field>_gallery_webp`` and ``<field>_card_webp``
+      computed with :meth:`_compute_showroom_webp`;
+    - ``<field>_checksum`` computed with :meth:`_compute_showroom_checksum`.
+    """
+
+    _name = "showroom.image.mixin"
+    _description = "Showroom Image Renditions Mixin"
+
+    @api.model
+    def _showroom_variant_field(self, field, variant, webp=False):
+        name = field if variant == "zoom" else f"{field}_{variant}"
+        return f"{name}_webp" if webp else name
+
+    def _compute_showroom_webp(self, field):
+        for record in self:
+            for variant in SHOWROOM_IMAGE_VARIANTS:
+                source = self._showroom_variant_field(field, variant)
+                record[self._showroom_variant_field(field, variant, webp=True)] = (
+                    _to_webp(record[source])
+                )
+
+    def _compute_showroom_checksum(self, field):
+        for record in self:
+            value = record[field]
+            if isinstance(value, str):
+                value = value.encode()
+            record[f"{field}_checksum"] = (
+                hashlib.sha1(value).hexdigest()[:16] if value else False
+            )
+
+    def _showroom_image_url(self, field, variant, webp=False):
+        """Return the checksum-stamped URL of one rendition of ``field``.
+
+        The ``unique`` argument makes /web/image answer with a long-lived,
+        immutable Cache-Control header; it changes whenever the image does.
+        """
+        self.ensure_one()
+        return "/web/image/%s/%s/%s?unique=%s" % (
+            self._name,
+            self.id,
+            self._showroom_variant_field(field, variant, webp=webp),
+            self[f"{field}_checksum"],
+        )
+
+    def _showroom_image_srcset(self, field, variants, webp=False):
+        self.ensure_one()
+        return ", ".join(
+            "%s %sw" % (
+                self._showroom_image_url(field, variant, webp=webp),
+                SHOWROOM_IMAGE_VARIANTS[variant],
+            )
+            for variant in variants
+        )
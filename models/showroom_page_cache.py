@@ -0,0 +1,151 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from odoo import api, fields, models
+
+SHOWROOM_PAGE_CACHE_SIZE = 512
+
+# Rendered public showroom fragments, per worker. Entries are keyed by the
+# version stored in ``showroom.page.cache.version``: bumping it makes all
+# existing entries unreachable in every worker, as soon as it commits.
+_page_cache = OrderedDict()
+_page_cache_lock = threading.Lock()
+_page_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+class ShowroomPageCacheVersion(models.Model):
+    """Single row holding the version of the showroom page cache.
+
+    The row is read in the request transaction, so a worker sees the new
+    version exactly when it sees the changes that bumped it, and never
+    caches old content under a new version.
+    """
+
+    _name = "showroom.page.cache.version"
+    _description = "Showroom Page Cache Version"
+    _log_access = False
+
+    version = fields.Integer(string="Version", readonly=True, default=0)
+    changed_at = fields.Datetime(string="Changed On", readonly=True)
+
+    def init(self):
+        self.env.cr.execute(
+            f"""
+            INSERT INTO {self._table} (id, version, changed_at)
+            VALUES (1, 0, now() AT TIME ZONE 'UTC')
+            ON CONFLICT (id) DO NOTHING
+            """
+        )
+
+
+class ShowroomPageCache(models.AbstractModel):
+    _name = "showroom.page.cache"
+    _description = "Showroom Page Cache"
+
+    @api.model
+    def _get_version(self):
+        """Return the ``(version, changed_at)`` of the cache, as of this transaction."""
+        self.env.cr.execute(
+            "SELECT version, changed_at FROM showroom_page_cache_version WHERE id = 1"
+        )
+        return self.env.cr.fetchone() or (0, None)
+
+    @api.model
+    def _make_key(self, key, version):
+        website = self.env["website"].get_current_website()
+        # The fragments are rendered from views: a view change bumps the
+        # registry's "templates" cache sequence.
+        templates = self.env.registry.cache_sequences.get("templates", 0)
+        return (self.env.cr.dbname, version, templates, website.id, self.env.lang) + tuple(key)
+
+    @api.model
+    def _lookup(self, key):
+        """Return the cached ``(etag, last_modified, fragment)`` for ``key`` or None."""
+        key = self._make_key(key, self._get_version()[0])
+        with _page_cache_lock:
+            entry = _page_cache.get(key)
+            if entry is None:
+                _page_cache_stats["misses"] += 1
+                return None
+            _page_cache.move_to_end(key)
+            _page_cache_stats["hits"] += 1
+            return entry
+
+    @api.model
+    def _store(self, key, fragment):
+        version, changed_at = self._get_version()
+        key = self._make_key(key, version)
+        website = self.env["website"].get_current_website()
+        # The validators cover the whole page, so the layout around the
+        # fragment counts as well: website, language and views.
+        templates = self.env.registry.cache_sequences.get("templates", 0)
+        etag = hashlib.sha1(
+            repr((website.id, website.write_date, self.env.lang, templates, str(fragment))).encode()
+        ).hexdigest()
+        last_modified = max(filter(None, (changed_at, website.write_date)), default=None)
+        entry = (etag, last_modified, fragment)
+        with _page_cache_lock:
+            _page_cache[key] = entry
+            while len(_page_cache) > SHOWROOM_PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+        return entry
+
+    @api.model
+    def _invalidate(self):
+        """Drop every cached showroom page, in all workers.
+
+        The version is bumped once per transaction, right before it
+        commits, so the row stays locked for as short as possible.
+        """
+        data = self.env.cr.precommit.data
+        if data.get("showroom.page.cache.invalidate"):
+            return
+        data["showroom.page.cache.invalidate"] = True
+        self.env.cr.precommit.add(self._bump_version)
+
+    @api.model
+    def _bump_version(self):
+        self.env.cr.precommit.data.pop("showroom.page.cache.invalidate", None)
+        self.env.cr.execute(
+            """
+            UPDATE showroom_page_cache_version
+               SET version = version + 1,
+                   changed_at = now() AT TIME ZONE 'UTC'
+             WHERE id = 1
+            """
+        )
+        self.env["showroom.page.cache.version"].invalidate_model()
+        with _page_cache_lock:
+            _page_cache_stats["invalidations"] += 1
+
+    @api.model
+    def _get_stats(self):
+        with _page_cache_lock:
+            stats = dict(_page_cache_stats, entries=len(_page_cache))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+class ShowroomPageCacheMixin(models.AbstractModel):
+    """Invalidate the showroom page cache whenever records of the model change."""
+
+    _name = "showroom.page.cache.mixin"
+    _description = "Showroom Page Cache Invalidation Mixin"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env["showroom.page.cache"]._invalidate()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env["showroom.page.cache"]._invalidate()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env["showroom.page.cache"]._invalidate()
+        return res
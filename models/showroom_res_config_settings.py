@@ -1,4 +1,63 @@
-from odoo import fields, models
+from collections import namedtuple
+
+from odoo import api, fields, models, tools
+
+SHOWROOM_PARAM_PREFIX = "infinys_service_showroom."
+
+WHATSAPP_PHONE_NUMBER_PLACEHOLDER = "628xxxxxxxxxx"
+WHATSAPP_PREFILL_MESSAGE_DEFAULT = (
+    "Halo, saya tertarik dengan mobil {car_name}. "
+    "Bisakah saya mendapatkan informasi lebih lanjut?"
+)
+
+# Every ``infinys_service_showroom.*`` parameter with the value used when it is
+# not set. The type of the default is the type of the parsed value.
+SHOWROOM_SETTINGS_DEFAULTS = {
+    "automate_delivery_order_done": False,
+    "automate_invoice_creation": False,
+    "show_advanced_settings": False,
+    "showroom_cars_per_page": 12,
+    "whatsapp_phone_number": "",
+    "whatsapp_prefill_message": "",
+    "enable_service_booking_reminders": False,
+    "reminder_interval_days_assigned": 1,
+    "reminder_interval_days_in_progress": 1,
+    "reminder_new_booking_supervisor": False,
+    "reminder_assigned_technician_initial": False,
+    "reminder_in_progress_notification": False,
+    "enable_service_booking_email_reminders": False,
+    "reminder_new_booking_supervisor_email": False,
+    "reminder_assigned_technician_initial_email": False,
+    "reminder_in_progress_notification_email": False,
+    "reminder_interval_days_assigned_email": 1,
+    "reminder_interval_days_in_progress_email": 1,
+    "enable_new_appointment_supervisor_reminders": False,
+    "reminder_new_appointment_supervisor_activity": False,
+    "reminder_new_appointment_supervisor_email": False,
+    "reminder_interval_days_new_appointment": 1,
+}
+
+# Settings rendered on the public showroom pages.
+SHOWROOM_PAGE_SETTINGS = (
+    "showroom_cars_per_page",
+    "whatsapp_phone_number",
+    "whatsapp_prefill_message",
+)
+
+ShowroomSettings = namedtuple("ShowroomSettings", SHOWROOM_SETTINGS_DEFAULTS)
+
+
+def _parse_showroom_param(value, default):
+    if value is False or value is None:
+        return default
+    if isinstance(default, bool):
+        return str(value).lower() == "true"
+    if isinstance(default, int):
+        try:
+            return int(value)
+        except ValueError:
+            return default
+    return value
 
 
 class ResConfigSettings(models.TransientModel):
@@ -24,15 +83,21 @@ class ResConfigSettings(models.TransientModel):
         help="If checked, sales orders created from service bookings will be automatically confirmed and a draft invoice will be created."
     )
 
+    showroom_cars_per_page = fields.Integer(
+        string="Cars per Page",
+        default=12,
+        help="Number of vehicles shown per page on the website showroom listing.",
+    )
+
     whatsapp_phone_number = fields.Char(
         string="WhatsApp Phone Number",
         help="Enter the WhatsApp number for showroom inquiries (e.g., 628123456789).",
-        default="628xxxxxxxxxx",
+        default=WHATSAPP_PHONE_NUMBER_PLACEHOLDER,
     )
     whatsapp_prefill_message = fields.Text(
         string="WhatsApp Prefill Message",
         help="Default message to prefill when opening WhatsApp chat from car details. Use {car_name} placeholder.",
-        default="Halo, saya tertarik dengan mobil {car_name}. Bisakah saya mendapatkan informasi lebih lanjut?",
+        default=WHATSAPP_PREFILL_MESSAGE_DEFAULT,
     )
     
     enable_service_booking_reminders = fields.Boolean(
@@ -107,9 +172,22 @@ class ResConfigSettings(models.TransientModel):
         help="Number of days after a new appointment without a job order to send a daily reminder.",
     )
 
+    @api.model
+    @tools.ormcache()
+    def _get_showroom_settings(self):
+        """Return a read-only snapshot of the showroom configuration parameters."""
+        ICPSudo = self.env["ir.config_parameter"].sudo()
+        return ShowroomSettings(**{
+            name: _parse_showroom_param(
+                ICPSudo.get_param(SHOWROOM_PARAM_PREFIX + name, default=False), default
+            )
+            for name, default in SHOWROOM_SETTINGS_DEFAULTS.items()
+        })
+
     def get_values(self):
         res = super(ResConfigSettings, self).get_values()
-        ICPSudo = self.env["ir.config_parameter"].sudo()
+        settings = self._get_showroom_settings()
+        res.update(settings._asdict())
         res.update(
             module_infinys_showroom=self.env.user.has_group(
                 "infinys_service_showroom.group_infinys_showroom"
@@ -117,157 +195,31 @@ class ResConfigSettings(models.TransientModel):
             module_infinys_booking_service=self.env.user.has_group(
                 "infinys_service_showroom.group_infinys_booking_service"
             ),
-            automate_delivery_order_done=ICPSudo.get_param(
-                "infinys_service_showroom.automate_delivery_order_done", default="False"
-            ).lower() == "true",
-            automate_invoice_creation=ICPSudo.get_param(
-                "infinys_service_showroom.automate_invoice_creation", default="False"
-            ).lower() == "true",
-            show_advanced_settings=ICPSudo.get_param(
-                "infinys_service_showroom.show_advanced_settings", default="False"
-            ).lower() == "true",
-            whatsapp_phone_number=ICPSudo.get_param(
-                "infinys_service_showroom.whatsapp_phone_number", default="628xxxxxxxxxx"
+            whatsapp_phone_number=(
+                settings.whatsapp_phone_number or WHATSAPP_PHONE_NUMBER_PLACEHOLDER
             ),
-            whatsapp_prefill_message=ICPSudo.get_param(
-                "infinys_service_showroom.whatsapp_prefill_message", default="Halo, saya tertarik dengan mobil {car_name}. Bisakah saya mendapatkan informasi lebih lanjut?"
+            whatsapp_prefill_message=(
+                settings.whatsapp_prefill_message or WHATSAPP_PREFILL_MESSAGE_DEFAULT
             ),
-            enable_service_booking_reminders=ICPSudo.get_param(
-                "infinys_service_showroom.enable_service_booking_reminders", default="False"
-            ).lower() == "true",
-            reminder_interval_days_assigned=int(ICPSudo.get_param(
-                "infinys_service_showroom.reminder_interval_days_assigned", default="1"
-            )),
-            reminder_interval_days_in_progress=int(ICPSudo.get_param(
-                "infinys_service_showroom.reminder_interval_days_in_progress", default="1"
-            )),
-            reminder_new_booking_supervisor=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_new_booking_supervisor", default="False"
-            ).lower() == "true",
-            reminder_assigned_technician_initial=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_assigned_technician_initial", default="False"
-            ).lower() == "true",
-            reminder_in_progress_notification=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_in_progress_notification", default="False"
-            ).lower() == "true",
-            enable_service_booking_email_reminders=ICPSudo.get_param(
-                "infinys_service_showroom.enable_service_booking_email_reminders", default="False"
-            ).lower() == "true",
-            reminder_new_booking_supervisor_email=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_new_booking_supervisor_email", default="False"
-            ).lower() == "true",
-            reminder_assigned_technician_initial_email=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_assigned_technician_initial_email", default="False"
-            ).lower() == "true",
-            reminder_in_progress_notification_email=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_in_progress_notification_email", default="False"
-            ).lower() == "true",
-            reminder_interval_days_assigned_email=int(ICPSudo.get_param(
-                "infinys_service_showroom.reminder_interval_days_assigned_email", default="1"
-            )),
-            reminder_interval_days_in_progress_email=int(ICPSudo.get_param(
-                "infinys_service_showroom.reminder_interval_days_in_progress_email", default="1"
-            )),
-            enable_new_appointment_supervisor_reminders=ICPSudo.get_param(
-                "infinys_service_showroom.enable_new_appointment_supervisor_reminders", default="False"
-            ).lower() == "true",
-            reminder_new_appointment_supervisor_activity=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_new_appointment_supervisor_activity", default="False"
-            ).lower() == "true",
-            reminder_new_appointment_supervisor_email=ICPSudo.get_param(
-                "infinys_service_showroom.reminder_new_appointment_supervisor_email", default="False"
-            ).lower() == "true",
-            reminder_interval_days_new_appointment=int(ICPSudo.get_param(
-                "infinys_service_showroom.reminder_interval_days_new_appointment", default="1"
-            )),
         )
         return res
 
     def set_values(self):
         super(ResConfigSettings, self).set_values()
+        previous = self._get_showroom_settings()
         ICPSudo = self.env["ir.config_parameter"].sudo()
-        ICPSudo.set_param(
-            "infinys_service_showroom.automate_delivery_order_done",
-            str(self.automate_delivery_order_done)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.automate_invoice_creation",
-            str(self.automate_invoice_creation)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.show_advanced_settings",
-            str(self.show_advanced_settings)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.whatsapp_phone_number", self.whatsapp_phone_number
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.whatsapp_prefill_message", self.whatsapp_prefill_message
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.enable_service_booking_reminders",
-            str(self.enable_service_booking_reminders)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_interval_days_assigned",
-            str(self.reminder_interval_days_assigned)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_interval_days_in_progress",
-            str(self.reminder_interval_days_in_progress)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_new_booking_supervisor",
-            str(self.reminder_new_booking_supervisor)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_assigned_technician_initial",
-            str(self.reminder_assigned_technician_initial)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_in_progress_notification",
-            str(self.reminder_in_progress_notification)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.enable_service_booking_email_reminders",
-            str(self.enable_service_booking_email_reminders)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_new_booking_supervisor_email",
-            str(self.reminder_new_booking_supervisor_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_assigned_technician_initial_email",
-            str(self.reminder_assigned_technician_initial_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_in_progress_notification_email",
-            str(self.reminder_in_progress_notification_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_interval_days_assigned_email",
-            str(self.reminder_interval_days_assigned_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_interval_days_in_progress_email",
-            str(self.reminder_interval_days_in_progress_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.enable_new_appointment_supervisor_reminders",
-            str(self.enable_new_appointment_supervisor_reminders)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_activity",
-            str(self.reminder_new_appointment_supervisor_activity)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_new_appointment_supervisor_email",
-            str(self.reminder_new_appointment_supervisor_email)
-        )
-        ICPSudo.set_param(
-            "infinys_service_showroom.reminder_interval_days_new_appointment",
-            str(self.reminder_interval_days_new_appointment)
-        )
+        for name, default in SHOWROOM_SETTINGS_DEFAULTS.items():
+            value = self[name]
+            if isinstance(default, (bool, int)):
+                value = str(value)
+            ICPSudo.set_param(SHOWROOM_PARAM_PREFIX + name, value)
+        self.env.registry.clear_cache()
+        if any(
+            getattr(previous, name) != getattr(self._get_showroom_settings(), name)
+            for name in SHOWROOM_PAGE_SETTINGS
+        ):
+            self.env["showroom.page.cache"]._invalidate()
+
         group_showroom = self.env.ref("infinys_service_showroom.group_infinys_showroom")
         group_booking_service = self.env.ref(
             "infinys_service_showroom.group_infinys_booking_service"
@@ -9,6 +9,8 @@ publicWidget.registry.ServiceBookingWizard = publicWidget.Widget.extend({
     "click .prev-step": "_onPrevStep",
     "change #customer_vehicle_select": "_onVehicleChange",
     "change #vehicle_brand": "_onBrandChange",
+    "change #service_type": "_onServiceTypeChange",
+    "change #plan_service_date": "_checkPlanDate",
   },
 
   start: function () {
@@ -18,6 +20,8 @@ publicWidget.registry.ServiceBookingWizard = publicWidget.Widget.extend({
     this.progressBar = this.el
       .closest(".oe_structure")
       .querySelector("#progressBar");
+    this.fullDates = new Set();
+    this._loadAvailability();
 
     return this._super.apply(this, arguments);
   },
@@ -94,33 +98,25 @@ publicWidget.registry.ServiceBookingWizard = publicWidget.Widget.extend({
   },
 
   _onBrandChange: function (ev) {
-    const brandId = ev.currentTarget.value;
+    this._populateModels(ev.currentTarget.value);
+  },
+
+  /**
+   * Fill the model select with the models of a brand.
+   *
+   * @param {string} brandId
+   * @returns {Promise}
+   */
+  _populateModels: function (brandId) {
     const modelSelect = this.el.querySelector("#vehicle_model");
     modelSelect.innerHTML = '<option value="">Select Model...</option>';
     modelSelect.disabled = !brandId;
 
-    if (!brandId) return;
-
-    fetch("/web/dataset/call_kw", {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-      },
-      body: JSON.stringify({
-        jsonrpc: "2.0",
-        method: "call",
-        params: {
-          model: "service.vehicle.model",
-          method: "search_read",
-          args: [[["vehicle_brand", "=", parseInt(brandId)]]],
-          kwargs: { fields: ["id", "name"], order: "name asc" },
-        },
-      }),
-    })
-      .then((res) => res.json())
-      .then((data) => {
-        const models = data.result || [];
-        models.forEach((model) => {
+    if (!brandId) return Promise.resolve();
+
+    return this._loadCatalogue()
+      .then((brands) => {
+        (brands[brandId] || []).forEach((model) => {
           const option = document.createElement("option");
           option.value = model.id;
           option.textContent = model.name;
@@ -131,6 +127,90 @@ publicWidget.registry.ServiceBookingWizard = publicWidget.Widget.extend({
       .catch((err) => console.error("Error fetching models:", err));
   },
 
+  /**
+   * Return the brand -> models catalogue. It is fetched at most once per
+   * catalogue version and kept in sessionStorage across pages.
+   *
+   * @returns {Promise<Object>}
+   */
+  _loadCatalogue: function () {
+    if (this._cataloguePromise) {
+      return this._cataloguePromise;
+    }
+    const version = this.el.dataset.catalogueVersion || "";
+    const storageKey = "infinys_service_showroom.vehicle_catalogue";
+    try {
+      const stored = JSON.parse(sessionStorage.getItem(storageKey));
+      if (stored && version && stored.version === version) {
+        this._cataloguePromise = Promise.resolve(stored.brands);
+        return this._cataloguePromise;
+      }
+    } catch {
+      // Unavailable or corrupted storage: fetch the catalogue instead.
+    }
+    this._cataloguePromise = fetch(
+      "/service-booking/vehicle-models?version=" + encodeURIComponent(version)
+    )
+      .then((res) => res.json())
+      .then((data) => {
+        try {
+          sessionStorage.setItem(storageKey, JSON.stringify(data));
+        } catch {
+          // Storage full or disabled: the in-memory copy is enough.
+        }
+        return data.brands;
+      });
+    this._cataloguePromise.catch(() => {
+      this._cataloguePromise = null;
+    });
+    return this._cataloguePromise;
+  },
+
+  _onServiceTypeChange: function () {
+    this._loadAvailability();
+  },
+
+  /**
+   * Fetch the workshop availability of the coming days for the selected
+   * service type, then re-check the chosen date against it.
+   *
+   * @returns {Promise}
+   */
+  _loadAvailability: function () {
+    const dateInput = this.el.querySelector("#plan_service_date");
+    if (!dateInput) return Promise.resolve();
+    const serviceType = this.el.querySelector("#service_type").value;
+    const params = new URLSearchParams({ service_type_id: serviceType });
+    return fetch("/service-booking/availability?" + params)
+      .then((res) => res.json())
+      .then((data) => {
+        this.fullDates = new Set(
+          data.days.filter((day) => !day.available).map((day) => day.date)
+        );
+        if (data.days.length) {
+          dateInput.min = data.days[0].date;
+        }
+        const hint = this.el.querySelector("#plan_service_date_hint");
+        const fullDays = [...this.fullDates].slice(0, 5);
+        hint.textContent = fullDays.length
+          ? "Fully booked: " + fullDays.join(", ") + (this.fullDates.size > 5 ? ", ..." : "")
+          : "";
+        this._checkPlanDate();
+      })
+      .catch((err) => console.error("Error fetching availability:", err));
+  },
+
+  /**
+   * Date inputs cannot disable single days: flag a fully booked date as
+   * invalid instead, which also blocks the form submission.
+   */
+  _checkPlanDate: function () {
+    const dateInput = this.el.querySelector("#plan_service_date");
+    const full = this.fullDates.has(dateInput.value);
+    dateInput.setCustomValidity(full ? "The workshop is fully booked on this date." : "");
+    dateInput.classList.toggle("is-invalid", full);
+  },
+
   _onVehicleChange: function (ev) {
     const select = ev.currentTarget;
     const selectedOption = select.options[select.selectedIndex];
@@ -145,8 +225,10 @@ publicWidget.registry.ServiceBookingWizard = publicWidget.Widget.extend({
         this.el.querySelector("#plat_number").value = vehicleData.plate || "";
         this.el.querySelector("#vehicle_brand").value =
           vehicleData.brand_id || "";
-        this.el.querySelector("#vehicle_model").value =
-          vehicleData.model_id || "";
+        this._populateModels(String(vehicleData.brand_id || "")).then(() => {
+          this.el.querySelector("#vehicle_model").value =
+            vehicleData.model_id || "";
+        });
         this.el.querySelector("#vehicle_year_manufacture").value =
           vehicleData.year || "";
       } catch (e) {
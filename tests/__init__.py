@@ -0,0 +1,7 @@
+from . import test_ir_attachment_upload
+from . import test_service_booking_create
+from . import test_service_booking_dispatch
+from . import test_service_reminder_queue
+from . import test_service_reminder_rendering
+from . import test_showroom_car_search
+from . import test_showroom_image_renditions
@@ -0,0 +1,64 @@
+import io
+from unittest.mock import patch
+
+from werkzeug.datastructures import FileStorage
+
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+UPLOAD_MODULE = "odoo.addons.infinys_service_showroom.models.ir_attachment"
+
+
+@tagged("post_install", "-at_install")
+class TestAttachmentUpload(TransactionCase):
+
+    def _upload(self, content, filename="photo.jpg"):
+        return FileStorage(stream=io.BytesIO(content), filename=filename)
+
+    def test_streamed_upload_keeps_content(self):
+        content = b"\xff\xd8\xff\xe0" + b"jpeg body " * 50000
+        attachments = self.env["ir.attachment"]._create_from_uploads(
+            [self._upload(content), self._upload(b"%PDF-1.4 report", "report.pdf")],
+            "res.partner",
+            self.env.user.partner_id.id,
+        )
+        self.assertEqual(len(attachments), 2)
+        photo, report = attachments
+        self.assertEqual(photo.raw, content)
+        self.assertEqual(photo.file_size, len(content))
+        self.assertEqual(photo.checksum, photo._compute_checksum(content))
+        self.assertEqual(photo.mimetype, "image/jpeg")
+        self.assertEqual(report.raw, b"%PDF-1.4 report")
+        if photo._storage() == "file":
+            self.assertEqual(photo.store_fname, photo._get_path(content, photo.checksum)[0])
+
+        # Read back from the database, not from the cache.
+        attachments.invalidate_recordset()
+        self.assertEqual(photo.raw, content)
+
+    def test_unprocessed_media_url_has_access_token(self):
+        photo = self.env["ir.attachment"]._create_from_uploads(
+            [self._upload(b"\xff\xd8\xff\xe0 unprocessed", "fresh.jpg")],
+            "res.partner",
+            self.env.user.partner_id.id,
+        )
+        url = photo._get_service_media_url()
+        self.assertTrue(photo.access_token)
+        self.assertEqual(url, f"/web/image/{photo.id}?access_token={photo.access_token}")
+
+    def test_duplicate_uploads_stored_once(self):
+        attachments = self.env["ir.attachment"]._create_from_uploads(
+            [self._upload(b"same bytes", "a.txt"), self._upload(b"same bytes", "b.txt")],
+            "res.partner",
+            self.env.user.partner_id.id,
+        )
+        self.assertEqual(attachments.mapped("name"), ["a.txt"])
+        self.assertEqual(attachments.raw, b"same bytes")
+
+    def test_upload_limit(self):
+        with patch(f"{UPLOAD_MODULE}.UPLOAD_MAX_FILE_SIZE", 8), self.assertRaises(UserError):
+            self.env["ir.attachment"]._create_from_uploads(
+                [self._upload(b"more than eight bytes")],
+                "res.partner",
+                self.env.user.partner_id.id,
+            )
@@ -0,0 +1,149 @@
+import logging
+import time
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+
+class ServiceBookingCreateCase(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(
+            cls.env.context,
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_create_nosubscribe=True,
+        ))
+        fuel_type = cls.env["service.vehicle.fuel.type"].create({"name": "Diesel (batch test)"})
+        vehicle_type = cls.env["service.vehicle.type"].create({"name": "Pickup (batch test)"})
+        cls.brand = cls.env["service.vehicle.brand"].create({"name": "Batch Motors"})
+        cls.vehicle_model = cls.env["service.vehicle.model"].create({
+            "name": "Batch Ranger",
+            "vehicle_brand": cls.brand.id,
+            "vehicle_fuel_type": fuel_type.id,
+            "vehicle_type": [(6, 0, vehicle_type.ids)],
+        })
+        cls.service_type = cls.env["service.type"].create({"name": "Batch Periodic Service"})
+        cls.customers = cls.env["res.partner"].create([
+            {"name": f"Batch Customer {index}"} for index in range(10)
+        ])
+        cls.inspection_types = cls.env["service.inspection.type"].create([
+            {"name": "Batch Brakes"},
+            {"name": "Batch Lights"},
+        ])
+
+    def _vals_list(self, count, prefix):
+        return [
+            {
+                "name": f"{prefix}/{index:05d}",
+                "customer_name": self.customers[index % len(self.customers)].id,
+                "contact_number": "0811000000",
+                "plat_number": f"{prefix} {index} xy",
+                "vehicle_brand": self.brand.id,
+                "vehicle_model": self.vehicle_model.id,
+                "vehicle_year_manufacture": "2022",
+                "service_type": self.service_type.id,
+                "plan_service_date": fields.Date.today(),
+            }
+            for index in range(count)
+        ]
+
+    def _create_counting_queries(self, vals_list):
+        self.env.flush_all()
+        queries = self.cr.sql_log_count
+        bookings = self.env["service.booking"].create(vals_list)
+        self.env.flush_all()
+        return bookings, self.cr.sql_log_count - queries
+
+
+@tagged("post_install", "-at_install")
+class TestServiceBookingCreate(ServiceBookingCreateCase):
+
+    def test_batch_registers_vehicles_and_checklists(self):
+        vals_list = self._vals_list(3, "T")
+        vals_list.append(dict(vals_list[0], name="T/repeat"))
+        bookings = self.env["service.booking"].create(vals_list)
+
+        self.assertEqual(bookings[0].plat_number, "T 0 XY")
+        vehicles = self.env["service.customer.vehicle"].search([
+            ("vehicle_plate_no", "in", bookings.mapped("plat_number")),
+        ])
+        self.assertEqual(len(vehicles), 3, "a (customer, plate) pair is registered once")
+        active_types = self.env["service.inspection.type"].search([("active", "=", True)])
+        for booking in bookings:
+            self.assertEqual(
+                booking.inspection_checklist_line_ids.inspection_type_id, active_types
+            )
+
+    def test_known_vehicle_is_not_duplicated(self):
+        first = self.env["service.booking"].create(self._vals_list(1, "K"))
+        self.env["service.booking"].create(dict(self._vals_list(1, "K")[0], name="K/again"))
+        self.assertEqual(
+            self.env["service.customer.vehicle"].search_count([
+                ("customer_id", "=", first.customer_name.id),
+                ("vehicle_plate_no", "=", first.plat_number),
+            ]),
+            1,
+        )
+
+    def test_batch_notifies_supervisors(self):
+        ICPSudo = self.env["ir.config_parameter"].sudo()
+        for name in (
+            "enable_service_booking_reminders",
+            "reminder_new_booking_supervisor",
+            "enable_service_booking_email_reminders",
+            "reminder_new_booking_supervisor_email",
+        ):
+            ICPSudo.set_param(f"infinys_service_showroom.{name}", "True")
+        user = self.env["res.users"].create({
+            "name": "Batch Supervisor",
+            "login": "batch.supervisor.test",
+            "email": "batch.supervisor@example.com",
+        })
+        supervisor = self.env["service.supervisor.user"].create({"user_id": user.id})
+        vals_list = self._vals_list(3, "N")
+        for vals in vals_list:
+            vals["supervisor_user_id"] = supervisor.id
+        bookings = self.env["service.booking"].create(vals_list)
+
+        activities = self.env["mail.activity"].search([
+            ("res_model", "=", "service.booking"),
+            ("res_id", "in", bookings.ids),
+        ])
+        self.assertEqual(sorted(activities.mapped("res_id")), sorted(bookings.ids))
+        self.assertEqual(activities.user_id, user)
+        mails = self.env["mail.mail"].search([
+            ("model", "=", "service.booking"),
+            ("res_id", "in", bookings.ids),
+        ])
+        self.assertEqual(sorted(mails.mapped("res_id")), sorted(bookings.ids))
+
+    def test_batch_query_count(self):
+        # Warm up the caches so both measures start from the same state.
+        self.env["service.booking"].create(self._vals_list(1, "W"))
+        _single, single_queries = self._create_counting_queries(self._vals_list(1, "S"))
+        batch, batch_queries = self._create_counting_queries(self._vals_list(20, "B"))
+        self.assertEqual(len(batch), 20)
+        # Vehicles, checklists and settings are handled once per batch:
+        # nineteen more job orders cost fewer than one query each.
+        self.assertLess(batch_queries - single_queries, 19)
+
+
+@tagged("post_install", "-at_install", "-standard", "showroom_benchmark")
+class BenchmarkServiceBookingCreate(ServiceBookingCreateCase):
+    """Run with ``--test-tags showroom_benchmark``."""
+
+    def test_create_5000_bookings(self):
+        vals_list = self._vals_list(5000, "BM")
+        started = time.monotonic()
+        bookings, queries = self._create_counting_queries(vals_list)
+        elapsed = time.monotonic() - started
+        self.assertEqual(len(bookings), 5000)
+        _logger.info(
+            "Created %s job orders in %.2fs: %s queries, %.2f queries per job order",
+            len(bookings), elapsed, queries, queries / len(bookings),
+        )
@@ -0,0 +1,169 @@
+import logging
+import random
+import time
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+
+class ServiceBookingDispatchCase(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        fuel_type = cls.env["service.vehicle.fuel.type"].create({"name": "Petrol (dispatch test)"})
+        vehicle_type = cls.env["service.vehicle.type"].create({"name": "Sedan (dispatch test)"})
+        cls.brand = cls.env["service.vehicle.brand"].create({"name": "Dispatch Cars"})
+        cls.vehicle_model = cls.env["service.vehicle.model"].create({
+            "name": "Dispatch Sedan",
+            "vehicle_brand": cls.brand.id,
+            "vehicle_fuel_type": fuel_type.id,
+            "vehicle_type": [(6, 0, vehicle_type.ids)],
+        })
+        cls.oil_change, cls.overhaul = cls.env["service.type"].create([
+            {"name": "Oil Change (dispatch test)", "workload_weight": 1.0},
+            {"name": "Engine Overhaul (dispatch test)", "workload_weight": 3.0},
+        ])
+        cls.customer = cls.env["res.partner"].create({"name": "Dispatch Customer"})
+
+    @classmethod
+    def _create_technicians(cls, count):
+        groups = cls.env.ref("base.group_user") | cls.env.ref(
+            "infinys_service_showroom.group_infinys_booking_service"
+        )
+        return cls.env["res.users"].create([
+            {
+                "name": f"Technician {index}",
+                "login": f"dispatch.technician.{index}",
+                "groups_id": [(6, 0, groups.ids)],
+            }
+            for index in range(count)
+        ])
+
+    @classmethod
+    def _create_bookings(cls, service_types, **vals):
+        return cls.env["service.booking"].create([
+            dict({
+                "customer_name": cls.customer.id,
+                "contact_number": "0813000000",
+                "plat_number": f"L {index} DS",
+                "vehicle_brand": cls.brand.id,
+                "vehicle_model": cls.vehicle_model.id,
+                "vehicle_year_manufacture": "2020",
+                "service_type": service_type.id,
+                "plan_service_date": fields.Date.today(),
+            }, **vals)
+            for index, service_type in enumerate(service_types)
+        ])
+
+    def _dispatch(self, bookings, technicians):
+        """Dispatch ``bookings`` and return the report and the technician of every write."""
+        Booking = type(self.env["service.booking"])
+        original_write = Booking.write
+        writes = []
+
+        def write(records, vals):
+            if "assigned_technician_id" in vals:
+                writes.append(vals["assigned_technician_id"])
+            return original_write(records, vals)
+
+        with patch.object(Booking, "write", write):
+            report = bookings._auto_dispatch(technicians=technicians)
+        return report, writes
+
+
+@tagged("post_install", "-at_install")
+class TestServiceBookingDispatch(ServiceBookingDispatchCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.busy, cls.idle = cls.technicians = cls._create_technicians(2)
+
+    def test_dispatch_evens_out_workload(self):
+        Booking = self.env["service.booking"]
+        self._create_bookings(
+            [self.oil_change] * 2, state="assigned", assigned_technician_id=self.busy.id
+        )
+        bookings = self._create_bookings([self.oil_change] * 4)
+
+        report, writes = self._dispatch(bookings, self.technicians)
+
+        self.assertEqual(report["bookings"], 4)
+        self.assertEqual(set(bookings.mapped("state")), {"assigned"})
+        self.assertEqual(
+            Booking._get_technician_workload(self.technicians),
+            {self.busy.id: 4.0, self.idle.id: 4.0},
+        )
+        self.assertEqual(sorted(writes), sorted(self.technicians.ids))
+
+    def test_dispatch_weighs_service_types(self):
+        Booking = self.env["service.booking"]
+        heavy = self._create_bookings([self.overhaul])
+        light = self._create_bookings([self.oil_change] * 3)
+
+        report, writes = self._dispatch(heavy | light, self.technicians)
+
+        self.assertEqual(report["technicians"], 2)
+        self.assertEqual(len(light.assigned_technician_id), 1)
+        self.assertNotEqual(heavy.assigned_technician_id, light.assigned_technician_id)
+        self.assertEqual(
+            Booking._get_technician_workload(self.technicians),
+            {self.busy.id: 3.0, self.idle.id: 3.0},
+        )
+        self.assertEqual(len(writes), 2)
+
+    def test_dispatch_skips_bookings_not_booked(self):
+        booking = self._create_bookings(
+            [self.oil_change], state="assigned", assigned_technician_id=self.busy.id
+        )
+        report, writes = self._dispatch(booking, self.technicians)
+        self.assertEqual(report["bookings"], 0)
+        self.assertFalse(writes)
+        self.assertEqual(booking.assigned_technician_id, self.busy)
+
+
+@tagged("post_install", "-at_install", "-standard", "showroom_benchmark")
+class BenchmarkServiceBookingDispatch(ServiceBookingDispatchCase):
+    """Dispatch 2,000 job orders over 50 technicians.
+
+    Run with ``--test-tags showroom_benchmark``.
+    """
+
+    def test_dispatch_2000_bookings_50_technicians(self):
+        technicians = self._create_technicians(50)
+        rng = random.Random(2000)
+        # Some technicians already have work in progress.
+        self._create_bookings(
+            [self.oil_change] * 100,
+            state="assigned",
+            assigned_technician_id=technicians[0].id,
+        )
+        bookings = self._create_bookings(
+            [rng.choice([self.oil_change] * 3 + [self.overhaul]) for _index in range(2000)]
+        )
+        self.env.flush_all()
+
+        queries = self.cr.sql_log_count
+        started = time.monotonic()
+        report, writes = self._dispatch(bookings, technicians)
+        self.env.flush_all()
+        elapsed = time.monotonic() - started
+        queries = self.cr.sql_log_count - queries
+
+        loads = self.env["service.booking"]._get_technician_workload(technicians)
+        # The first technician starts above the average and gets nothing new.
+        others = [load for user_id, load in loads.items() if user_id != technicians[0].id]
+        spread = max(others) - min(others)
+        _logger.info(
+            "Dispatched %s job orders over %s technicians in %.2fs: "
+            "%s writes, %s queries, load spread %.1f",
+            report["bookings"], report["technicians"], elapsed, len(writes), queries, spread,
+        )
+        self.assertEqual(report["bookings"], 2000)
+        self.assertEqual(len(writes), report["technicians"])
+        self.assertLessEqual(spread, self.overhaul.workload_weight)
@@ -0,0 +1,137 @@
+import socket
+from datetime import timedelta
+from unittest import skipUnless
+from unittest.mock import patch
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    Controller = None
+
+
+class StandInSMTPHandler:
+    """Local SMTP server answering a temporary failure to the first messages."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.failures:
+            self.failures -= 1
+            return "451 4.3.0 Mailbox temporarily unavailable"
+        self.envelopes.append(envelope)
+        return "250 OK"
+
+
+@tagged("post_install", "-at_install")
+@skipUnless(Controller, "aiosmtpd is not installed")
+class TestServiceReminderQueue(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.smtp = StandInSMTPHandler()
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        controller = Controller(self.smtp, hostname="127.0.0.1", port=port)
+        controller.start()
+        self.addCleanup(controller.stop)
+
+        # Deliver for real, but only through the stand-in server.
+        MailServer = self.env["ir.mail_server"]
+        patcher = patch.object(type(MailServer), "_is_test_mode", lambda self: False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mail_server = MailServer.create({
+            "name": "Stand-in SMTP",
+            "smtp_host": "127.0.0.1",
+            "smtp_port": port,
+            "smtp_encryption": "none",
+            "sequence": 0,
+        })
+
+        self.Mail = self.env["mail.mail"].sudo()
+        self.Mail.search([("is_service_reminder", "=", True)]).unlink()
+
+    def _queue(self, count=1):
+        return self.Mail.create([
+            {
+                "email_from": "workshop@example.com",
+                "email_to": f"customer{index}@example.com",
+                "subject": f"Service reminder {index}",
+                "body_html": "<p>Your car is due for service.</p>",
+                "mail_server_id": self.mail_server.id,
+                "state": "outgoing",
+                "is_service_reminder": True,
+                "auto_delete": False,
+            }
+            for index in range(count)
+        ])
+
+    def _assert_next_try(self, mail, before, delay):
+        after = fields.Datetime.now()
+        self.assertGreaterEqual(mail.service_reminder_next_try, before + delay)
+        self.assertLessEqual(mail.service_reminder_next_try, after + delay)
+
+    def test_batch_is_delivered(self):
+        mails = self._queue(3)
+        metrics = self.Mail._process_service_reminder_queue(batch_size=2)
+
+        self.assertEqual([batch["count"] for batch in metrics], [2, 1])
+        self.assertEqual(sum(batch["sent"] for batch in metrics), 3)
+        self.assertEqual(set(mails.mapped("state")), {"sent"})
+        self.assertEqual(
+            sorted(rcpt for envelope in self.smtp.envelopes for rcpt in envelope.rcpt_tos),
+            sorted(mails.mapped("email_to")),
+        )
+
+    def test_failed_reminder_is_retried_with_backoff(self):
+        delay = timedelta(minutes=self.Mail._SERVICE_REMINDER_RETRY_DELAY)
+        mail = self._queue()
+        self.smtp.failures = 2
+
+        before = fields.Datetime.now()
+        metrics = self.Mail._process_service_reminder_queue()
+        self.assertEqual(metrics[0]["failed"], 1)
+        self.assertEqual(mail.state, "exception")
+        self.assertEqual(mail.service_reminder_attempts, 1)
+        self._assert_next_try(mail, before, delay)
+
+        # Not due yet: the mail stays aside.
+        self.assertFalse(self.Mail._process_service_reminder_queue())
+        self.assertEqual(mail.state, "exception")
+
+        # Due again; the second failure doubles the delay.
+        mail.service_reminder_next_try = fields.Datetime.now()
+        before = fields.Datetime.now()
+        self.Mail._process_service_reminder_queue()
+        self.assertEqual(mail.service_reminder_attempts, 2)
+        self._assert_next_try(mail, before, 2 * delay)
+
+        mail.service_reminder_next_try = fields.Datetime.now()
+        metrics = self.Mail._process_service_reminder_queue()
+        self.assertEqual(metrics[0]["sent"], 1)
+        self.assertEqual(mail.state, "sent")
+        self.assertEqual(mail.service_reminder_attempts, 2)
+        self.assertEqual(len(self.smtp.envelopes), 1)
+
+    def test_reminder_is_abandoned_after_max_attempts(self):
+        mail = self._queue()
+        mail.write({
+            "state": "exception",
+            "service_reminder_attempts": self.Mail._SERVICE_REMINDER_MAX_ATTEMPTS,
+            "service_reminder_next_try": fields.Datetime.now() - timedelta(days=1),
+        })
+        self.assertFalse(self.Mail._process_service_reminder_queue())
+        self.assertEqual(mail.state, "exception")
+        self.assertFalse(self.smtp.envelopes)
+
+    def test_generic_queue_skips_reminders(self):
+        mail = self._queue()
+        self.Mail.process_email_queue()
+        self.assertEqual(mail.state, "outgoing")
+        self.assertFalse(self.smtp.envelopes)
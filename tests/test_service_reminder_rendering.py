@@ -0,0 +1,155 @@
+import logging
+import time
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+NEW_BOOKING_TEMPLATE = "email_template_new_booking_supervisor_reminder"
+
+
+class ServiceReminderRenderingCase(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        fuel_type = cls.env["service.vehicle.fuel.type"].create({"name": "Hybrid (mail test)"})
+        vehicle_type = cls.env["service.vehicle.type"].create({"name": "MPV (mail test)"})
+        cls.brand = cls.env["service.vehicle.brand"].create({"name": "Mailer Auto"})
+        cls.vehicle_model = cls.env["service.vehicle.model"].create({
+            "name": "Mailer Voyage",
+            "vehicle_brand": cls.brand.id,
+            "vehicle_fuel_type": fuel_type.id,
+            "vehicle_type": [(6, 0, vehicle_type.ids)],
+        })
+        cls.service_type = cls.env["service.type"].create({"name": "Mailer Tune-up"})
+        cls.customers = cls.env["res.partner"].create([
+            {"name": "Rina Customer"},
+            {"name": "Dewi Customer"},
+        ])
+        cls.supervisors = cls.env["res.users"].create([
+            {"name": "Sari Supervisor", "login": "sari.mail.test", "email": "sari@example.com"},
+            {"name": "Budi Supervisor", "login": "budi.mail.test", "email": "budi@example.com"},
+        ])
+
+    @classmethod
+    def _create_bookings(cls, count):
+        return cls.env["service.booking"].with_context(tracking_disable=True).create([
+            {
+                "name": f"JO/MAIL/{index:05d}",
+                "customer_name": cls.customers[index % 2].id,
+                "contact_number": "0812000000",
+                "plat_number": f"D {index} ML",
+                "vehicle_brand": cls.brand.id,
+                "vehicle_model": cls.vehicle_model.id,
+                "vehicle_year_manufacture": "2021",
+                "service_type": cls.service_type.id,
+                "plan_service_date": fields.Date.today(),
+                "complaint_issue": f"Noise number {index}",
+            }
+            for index in range(count)
+        ])
+
+
+@tagged("post_install", "-at_install")
+class TestServiceReminderRendering(ServiceReminderRenderingCase):
+
+    def test_one_rendered_email_per_record_and_recipient(self):
+        first, second, third = self._create_bookings(3)
+        sari, budi = self.supervisors
+        mails = (first | second | third)._queue_reminder_emails(
+            NEW_BOOKING_TEMPLATE, {first.id: sari, second.id: budi, third.id: sari}
+        )
+
+        self.assertEqual(len(mails), 3)
+        self.assertEqual(set(mails.mapped("state")), {"outgoing"})
+        for booking, user in ((first, sari), (second, budi), (third, sari)):
+            mail = mails.filtered(lambda m: m.res_id == booking.id)
+            self.assertEqual(mail.model, "service.booking")
+            self.assertEqual(mail.email_to, user.email)
+            self.assertEqual(mail.subject, f"New Service Booking: {booking.name} needs assignment")
+            self.assertIn(f"Hello {user.name}", mail.body_html)
+            self.assertIn(booking.customer_name.name, mail.body_html)
+            self.assertIn(booking.complaint_issue, mail.body_html)
+            self.assertIn(booking.plat_number, mail.body_html)
+
+    def test_recipient_without_email_is_skipped(self):
+        first, second = self._create_bookings(2)
+        sari, budi = self.supervisors
+        budi.partner_id.email = False
+        mails = (first | second)._queue_reminder_emails(
+            NEW_BOOKING_TEMPLATE, {first.id: sari, second.id: budi}
+        )
+        self.assertEqual(mails.mapped("res_id"), [first.id])
+
+    def test_unknown_template_queues_nothing(self):
+        booking = self._create_bookings(1)
+        mails = booking._queue_reminder_emails(
+            "email_template_does_not_exist", {booking.id: self.supervisors[0]}
+        )
+        self.assertFalse(mails)
+
+
+@tagged("post_install", "-at_install", "-standard", "showroom_benchmark")
+class BenchmarkServiceReminderRendering(ServiceReminderRenderingCase):
+    """Per-record f-string bodies versus one batched template render.
+
+    Run with ``--test-tags showroom_benchmark``.
+    """
+
+    def _render_per_record(self, booking_ids, recipient):
+        # What the reminder code did before: one record at a time, so every
+        # relational field is fetched again for every booking.
+        bodies = {}
+        for booking_id in booking_ids:
+            record = self.env["service.booking"].browse(booking_id)
+            bodies[booking_id] = f"""
+                <div style="margin: 0px; padding: 0px;">
+                    <p style="margin: 0px; padding: 0px; font-size: 13px;">
+                        Hello {recipient.name},
+                        <br/><br/>
+                        A new service booking, <strong>{record.name}</strong>, has been created and requires your attention for technician assignment.
+                        <br/><br/>
+                        <strong>Customer:</strong> {record.customer_name.name} <br/>
+                        <strong>Vehicle:</strong> {record.vehicle_brand.name} {record.vehicle_model.name} ({record.plat_number}) <br/>
+                        <strong>Booking Date:</strong> {record.plan_service_date} <br/>
+                        <strong>Complaint:</strong> {record.complaint_issue or 'N/A'}
+                    </p>
+                </div>
+            """
+        return bodies
+
+    def _render_batch(self, booking_ids, recipient):
+        template = self.env.ref(f"infinys_service_showroom.{NEW_BOOKING_TEMPLATE}")
+        return template._render_field(
+            "body_html",
+            booking_ids,
+            add_context={"recipient_name": recipient.name},
+            options={"post_process": True},
+        )
+
+    def _measure(self, render, booking_ids, recipient):
+        self.env.invalidate_all()
+        queries = self.cr.sql_log_count
+        started = time.monotonic()
+        bodies = render(booking_ids, recipient)
+        elapsed = time.monotonic() - started
+        self.assertEqual(len(bodies), len(booking_ids))
+        return elapsed, self.cr.sql_log_count - queries
+
+    def test_render_2000_reminders(self):
+        booking_ids = self._create_bookings(2000).ids
+        recipient = self.supervisors[0]
+        # Compile the template once, as a running server would have.
+        self._render_batch(booking_ids[:1], recipient)
+
+        for label, render in (
+            ("per-record f-string", self._render_per_record),
+            ("batched mail.template", self._render_batch),
+        ):
+            elapsed, queries = self._measure(render, booking_ids, recipient)
+            _logger.info(
+                "Reminder rendering, %s: %s bodies in %.3fs (%.0f/s), %s queries",
+                label, len(booking_ids), elapsed, len(booking_ids) / elapsed, queries,
+            )
@@ -0,0 +1,132 @@
+import base64
+import io
+import logging
+
+from PIL import Image
+
+from odoo.tests import TransactionCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+
+def _encode(image, fmt="PNG", **params):
+    stream = io.BytesIO()
+    image.save(stream, format=fmt, **params)
+    return base64.b64encode(stream.getvalue())
+
+
+def _decode(value):
+    return Image.open(io.BytesIO(base64.b64decode(value)))
+
+
+class ShowroomImageCase(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        fuel_type = cls.env["service.vehicle.fuel.type"].create({"name": "Electric (image test)"})
+        vehicle_type = cls.env["service.vehicle.type"].create({"name": "SUV (image test)"})
+        brand = cls.env["service.vehicle.brand"].create({"name": "Pixel Motors"})
+        vehicle_model = cls.env["service.vehicle.model"].create({
+            "name": "Pixel Volt",
+            "vehicle_brand": brand.id,
+            "vehicle_fuel_type": fuel_type.id,
+            "vehicle_type": [(6, 0, vehicle_type.ids)],
+        })
+        cls.car_vals = {
+            "brand_id": brand.id,
+            "model_id": vehicle_model.id,
+            "type_id": vehicle_type.id,
+            "fuel_type_id": fuel_type.id,
+            "website_published": True,
+        }
+
+
+@tagged("post_install", "-at_install")
+class TestShowroomImageRenditions(ShowroomImageCase):
+
+    def _create_car(self, **vals):
+        return self.env["showroom.car.vehicle"].create(
+            dict(self.car_vals, name="Rendition Test Car", **vals)
+        )
+
+    def test_renditions_are_generated(self):
+        car = self._create_car(main_image=_encode(Image.new("RGB", (2400, 1200), "red")))
+
+        expected = {
+            "main_image": (1920, 960),
+            "main_image_gallery": (1024, 512),
+            "main_image_card": (512, 256),
+        }
+        for field, size in expected.items():
+            self.assertEqual(_decode(car[field]).size, size, field)
+            webp = _decode(car[f"{field}_webp"])
+            self.assertEqual(webp.format, "WEBP", field)
+            self.assertEqual(webp.size, size, field)
+
+        self.assertTrue(car.main_image_checksum)
+        self.assertEqual(
+            car._showroom_image_url("main_image", "card", webp=True),
+            f"/web/image/showroom.car.vehicle/{car.id}/main_image_card_webp"
+            f"?unique={car.main_image_checksum}",
+        )
+        srcset = car._showroom_image_srcset("main_image", ["card", "gallery"])
+        self.assertIn("/main_image_card?unique=", srcset)
+        self.assertIn(" 512w", srcset)
+        self.assertIn(" 1024w", srcset)
+
+    def test_renditions_follow_the_source(self):
+        car = self._create_car(main_image=_encode(Image.new("RGB", (800, 600), "red")))
+        checksum = car.main_image_checksum
+        card_webp = car.main_image_card_webp
+
+        car.main_image = _encode(Image.new("RGB", (800, 600), "blue"))
+        self.assertNotEqual(car.main_image_checksum, checksum)
+        self.assertNotEqual(car.main_image_card_webp, card_webp)
+
+        car.main_image = False
+        self.assertFalse(car.main_image_webp)
+        self.assertFalse(car.main_image_gallery_webp)
+        self.assertFalse(car.main_image_card_webp)
+        self.assertFalse(car.main_image_checksum)
+
+    def test_palette_gallery_image_is_converted(self):
+        car = self._create_car()
+        image = self.env["showroom.car.vehicle.image"].create({
+            "vehicle_id": car.id,
+            "image": _encode(Image.new("P", (300, 200), 1)),
+        })
+        webp = _decode(image.image_card_webp)
+        self.assertEqual(webp.format, "WEBP")
+        self.assertEqual(webp.size, (300, 200))
+
+
+@tagged("post_install", "-at_install", "-standard", "showroom_benchmark")
+class BenchmarkShowroomListingBytes(ShowroomImageCase):
+    """Image bytes of a 24-card /cars page, before and after the renditions.
+
+    Run with ``--test-tags showroom_benchmark``.
+    """
+
+    def test_24_card_listing_bytes(self):
+        # A 12 MP camera-like photo: noise does not compress, like real detail.
+        photo = Image.merge("RGB", [
+            Image.effect_noise((4000, 3000), 48 + 8 * band) for band in range(3)
+        ])
+        upload = _encode(photo, "JPEG", quality=92)
+        cars = self.env["showroom.car.vehicle"].create([
+            dict(self.car_vals, name=f"Listing Car {index}", main_image=upload)
+            for index in range(24)
+        ])
+
+        # Before: every card downloaded the uploaded original. After: a
+        # desktop browser picks the 512 px WebP card from the srcset.
+        before = len(base64.b64decode(upload)) * len(cars)
+        after = sum(len(base64.b64decode(car.main_image_card_webp)) for car in cars)
+        fallback = sum(len(base64.b64decode(car.main_image_card)) for car in cars)
+        _logger.info(
+            "24-card listing image bytes: %.1f MB before, %.1f MB after "
+            "(%.1f MB without WebP support), %.0fx smaller",
+            before / 1e6, after / 1e6, fallback / 1e6, before / after,
+        )
+        self.assertLess(after, before)